@@ -0,0 +1,63 @@
+""" Benchmark of the column width computation of pretty table.
+
+Compare the pure-Python and the NumPy width engines on 100k, 1M and 10M cells,
+from the cells to the widths: the ASCII check, the length of every cell and the
+maximum of each column, as done by ColumnStore.append_rows:
+
+    python benchmarks/benchmark_widths.py
+
+"""
+
+import timeit
+
+from prettypi.pretty_table.widths import ascii_lengths, has_numpy, max_length
+
+NB_COLUMNS = 10
+SIZES = [100_000, 1_000_000, 10_000_000]
+POOL = [f"cell-{i}" + "x" * (i % 17) for i in range(1000)]
+
+
+def build_columns(nb_cells):
+    """Build NB_COLUMNS columns of nb_cells cells in total"""
+    nb_rows = nb_cells // NB_COLUMNS
+    return [
+        [POOL[(i + j) % len(POOL)] for i in range(nb_rows)] for j in range(NB_COLUMNS)
+    ]
+
+
+def column_widths(columns, use_numpy):
+    """Compute the width of each column from its cells"""
+    widths = []
+    for cells in columns:
+        text = "\0".join(cells)
+        assert text.isascii()
+        widths.append(max_length(ascii_lengths(cells, text, use_numpy), use_numpy))
+    return widths
+
+
+def bench(columns, use_numpy, repeat=5):
+    """Return the best time of the width computation"""
+    timer = timeit.Timer(lambda: column_widths(columns, use_numpy))
+    return min(timer.repeat(repeat=repeat, number=1))
+
+
+def main():
+    """Run the benchmark"""
+    if not has_numpy():
+        print("NumPy is not installed, only the pure-Python engine is benchmarked")
+    print(f"{'cells':>12} {'python (ms)':>12} {'numpy (ms)':>12} {'speedup':>8}")
+    for nb_cells in SIZES:
+        columns = build_columns(nb_cells)
+        python_time = bench(columns, use_numpy=False)
+        if has_numpy():
+            numpy_time = bench(columns, use_numpy=True)
+            print(
+                f"{nb_cells:>12,} {python_time * 1000:>12.2f} "
+                f"{numpy_time * 1000:>12.2f} {python_time / numpy_time:>7.1f}x"
+            )
+        else:
+            print(f"{nb_cells:>12,} {python_time * 1000:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 """ This module contains the StyledStr class."""
 
 from prettypi.utils import Color, Style, BackgroundColor, Align
+from prettypi.utils.display_width import center, display_width, ljust, rjust
 
 
 class StyledStr:
@@ -159,12 +160,15 @@ class StyledStr:
         self._check_input()
 
     def _len_without_ansi(self):
-        """Return the length of the string without ANSI codes
+        """Return the display width of the string without ANSI codes
+
+        Wide characters, like CJK text and emojis, take two columns, and the ANSI
+        codes of pre-colored text take none.
 
         :return: The length of the string without ANSI codes
         :rtype: int
         """
-        return len(self.string)
+        return display_width(self.string)
 
     def _align_string(self):
         """Align the string
@@ -177,10 +181,10 @@ class StyledStr:
 
         direction, width = self.align
         if direction == Align.LEFT:
-            return self.string.ljust(width)
+            return ljust(self.string, width)
         if direction == Align.CENTER:
-            return self.string.center(width)
-        return self.string.rjust(width)
+            return center(self.string, width)
+        return rjust(self.string, width)
 
     def __len__(self):
         return self._len_without_ansi()
@@ -0,0 +1,481 @@
+""" ArrayStore class for reading the rows of a table from NumPy or Arrow columns.
+
+The columns are kept as they are, without copying them into Python strings. The
+widths of the columns are computed in bulk, chunk by chunk, and only the cells of
+the rendered rows are formatted, one column at a time.
+
+The lengths are display widths. A chunk of plain ASCII cells is measured in bulk,
+only the chunks with non-ASCII or styled cells are measured cell by cell.
+
+NumPy and PyArrow are optional: each column kind needs its own library.
+"""
+
+from array import array
+from itertools import islice
+from typing import Iterable, Iterator, List, Sequence, Set
+from prettypi.utils.display_width import ESCAPE, display_width
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover
+    pa = None
+    pc = None
+
+ARRAY_CHUNK_SIZE = 65536
+
+
+def _positions(indices):
+    """Convert indices to a slice or a NumPy array of positions, without a Python
+    loop for ranges and arrays"""
+    if isinstance(indices, range) and indices.step == 1:
+        return slice(indices.start, indices.stop)
+    if isinstance(indices, array):
+        return np.frombuffer(indices, dtype=np.dtype(indices.typecode)).astype(np.intp)
+    return np.asarray(indices, dtype=np.intp)
+
+
+class NumpyColumn:
+    """Class to format a one-dimensional NumPy array as a column of strings
+
+    :param values: The values of the column
+    :type values: numpy.ndarray
+    """
+
+    def __init__(self, values) -> None:
+        self.values = values
+        self.ascii = True
+        self.plain = True
+
+    def _format(self, positions):
+        """Format the cells at some positions as a NumPy array of strings"""
+        return self.values[positions].astype(str)
+
+    def strings(self, indices) -> List[str]:
+        """Format some cells of the column
+
+        :param indices: The indices of the cells
+        :type indices: Sequence[int]
+
+        :return: The formatted cells
+        :rtype: List[str]
+        """
+        return self._format(_positions(indices)).tolist()
+
+    def lengths(self, start: int, stop: int):
+        """Get the lengths of the formatted cells of a range of the column
+
+        :param start: The index of the first cell
+        :type start: int
+        :param stop: The index after the last cell
+        :type stop: int
+
+        :return: The length of each cell
+        :rtype: numpy.ndarray
+        """
+        strings = self._format(slice(start, stop))
+        if strings.size == 0:
+            return np.char.str_len(strings)
+        # The strings are stored as UCS-4 code points, ASCII is below 0x80
+        codes = strings.view(np.uint32)
+        is_ascii = codes.max() < 0x80
+        if is_ascii and not (codes == ord(ESCAPE)).any():
+            return np.char.str_len(strings)
+        self.ascii = self.ascii and is_ascii
+        self.plain = False
+        return np.fromiter(map(display_width, strings.tolist()), np.int64, strings.size)
+
+    def max_length(self, start: int, stop: int) -> int:
+        """Get the length of the longest formatted cell of a range of the column
+
+        The longest integer is either the smallest or the largest one, so integer
+        columns are not formatted.
+
+        :param start: The index of the first cell
+        :type start: int
+        :param stop: The index after the last cell
+        :type stop: int
+
+        :return: The length of the longest cell
+        :rtype: int
+        """
+        values = self.values[start:stop]
+        if values.dtype.kind in "iu":
+            return max(len(str(values.min())), len(str(values.max())))
+        return int(self.lengths(start, stop).max())
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class PandasColumn(NumpyColumn):
+    """Class to format a pandas Series as a column of strings, missing cells are empty
+
+    Each cell is formatted as in a list of rows, so a timestamp is written in full
+    whatever the other cells of its chunk.
+
+    :param values: The values of the column
+    :type values: pandas.Series
+    """
+
+    def _format(self, positions):
+        """Format the cells at some positions as a NumPy array of strings"""
+        values = self.values.iloc[positions]
+        cells = zip(values.tolist(), values.isna().tolist())
+        return np.array(["" if missing else str(cell) for cell, missing in cells], dtype=str)
+
+    def max_length(self, start: int, stop: int) -> int:
+        """Get the length of the longest formatted cell of a range of the column
+
+        :param start: The index of the first cell
+        :type start: int
+        :param stop: The index after the last cell
+        :type stop: int
+
+        :return: The length of the longest cell
+        :rtype: int
+        """
+        return int(self.lengths(start, stop).max())
+
+
+class ArrowColumn:
+    """Class to format a PyArrow array as a column of strings, null cells are empty
+
+    The cells are formatted by the Arrow cast to strings, so floats may be written
+    differently than by NumPy (1 instead of 1.0).
+
+    :param values: The values of the column
+    :type values: pyarrow.Array or pyarrow.ChunkedArray
+    """
+
+    def __init__(self, values) -> None:
+        self.values = values
+        self.ascii = True
+        self.plain = True
+
+    @staticmethod
+    def _format(values):
+        """Format the values as strings, the values are cast chunk by chunk"""
+        if not pa.types.is_string(values.type):
+            values = pc.cast(values, pa.string())
+        return pc.fill_null(values, "")
+
+    def strings(self, indices) -> List[str]:
+        """Format some cells of the column
+
+        :param indices: The indices of the cells
+        :type indices: Sequence[int]
+
+        :return: The formatted cells
+        :rtype: List[str]
+        """
+        if isinstance(indices, range) and indices.step == 1:
+            values = self.values.slice(indices.start, len(indices))
+        else:
+            values = self.values.take(pa.array(_positions(indices)))
+        return self._format(values).to_pylist()
+
+    def lengths(self, start: int, stop: int):
+        """Get the lengths of the formatted cells of a range of the column
+
+        :param start: The index of the first cell
+        :type start: int
+        :param stop: The index after the last cell
+        :type stop: int
+
+        :return: The length of each cell
+        :rtype: numpy.ndarray
+        """
+        values = self._format(self.values.slice(start, stop - start))
+        # pylint: disable=no-member
+        is_ascii = pc.all(pc.string_is_ascii(values)).as_py() is not False
+        styled = bool(pc.any(pc.match_substring(values, ESCAPE)).as_py())
+        if is_ascii and not styled:
+            return pc.utf8_length(values).to_numpy()
+        self.ascii = self.ascii and is_ascii
+        self.plain = False
+        return np.fromiter(map(display_width, values.to_pylist()), np.int64, len(values))
+
+    def max_length(self, start: int, stop: int) -> int:
+        """Get the length of the longest formatted cell of a range of the column
+
+        :param start: The index of the first cell
+        :type start: int
+        :param stop: The index after the last cell
+        :type stop: int
+
+        :return: The length of the longest cell
+        :rtype: int
+        """
+        return int(self.lengths(start, stop).max())
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class ArrayStore:
+    """Class to store the rows of a table in NumPy or Arrow columns
+
+    The store has the same interface as the ColumnStore. Every column must have
+    the same number of cells.
+
+    :param columns: The columns of the table
+    :type columns: List[Union[NumpyColumn, PandasColumn, ArrowColumn]]
+    :param header: The header of the table, defaults to None
+    :type header: List[str], optional
+
+    :raises ValueError: If the columns do not have the same length
+    """
+
+    def __init__(self, columns: List, header: List[str] = None) -> None:
+        self.columns = columns
+        self.header = header
+        self.nb_rows = len(columns[0]) if columns else 0
+        if any(len(column) != self.nb_rows for column in columns):
+            raise ValueError("Invalid columns: every column must have the same length")
+        self.widths = [self._max_length(column) for column in columns]
+        self._lengths = {}
+
+    def _max_length(self, column):
+        """Compute the length of the longest formatted cell of a column"""
+        width = 0
+        for start in range(0, self.nb_rows, ARRAY_CHUNK_SIZE):
+            stop = min(start + ARRAY_CHUNK_SIZE, self.nb_rows)
+            width = max(width, column.max_length(start, stop))
+        return width
+
+    @classmethod
+    def from_numpy(cls, values, header: List[str] = None) -> "ArrayStore":
+        """Create a store from a two-dimensional NumPy array, without copying it
+
+        :param values: The array, one row per line, a one-dimensional array is a
+            single column
+        :type values: numpy.ndarray
+        :param header: The header of the table, defaults to None
+        :type header: List[str], optional
+
+        :return: The store
+        :rtype: ArrayStore
+
+        :raises ImportError: If NumPy is not installed
+        :raises ValueError: If the array has more than two dimensions
+        """
+        if np is None:
+            raise ImportError("NumPy is required to read NumPy arrays")
+        values = np.asarray(values)
+        if values.ndim == 1:
+            values = values.reshape(-1, 1)
+        if values.ndim != 2:
+            raise ValueError(f"Invalid array: {values.ndim} dimensions")
+        columns = [NumpyColumn(values[:, i]) for i in range(values.shape[1])]
+        return cls(columns, header)
+
+    @classmethod
+    def from_dataframe(cls, dataframe) -> "ArrayStore":
+        """Create a store from a pandas DataFrame, the headers are the column names
+
+        The integer and boolean NumPy columns are read as they are, the other columns
+        are formatted cell by cell as in a list of rows, missing cells are empty.
+
+        :param dataframe: The DataFrame
+        :type dataframe: pandas.DataFrame
+
+        :return: The store
+        :rtype: ArrayStore
+
+        :raises ImportError: If NumPy is not installed
+        """
+        if np is None:
+            raise ImportError("NumPy is required to read DataFrames")
+        columns = []
+        for i in range(dataframe.shape[1]):
+            series = dataframe.iloc[:, i]
+            if isinstance(series.dtype, np.dtype) and series.dtype.kind in "iub":
+                columns.append(NumpyColumn(series.to_numpy()))
+            else:
+                columns.append(PandasColumn(series.reset_index(drop=True)))
+        return cls(columns, [str(name) for name in dataframe.columns])
+
+    @classmethod
+    def from_arrow(cls, table) -> "ArrayStore":
+        """Create a store from a PyArrow Table, the headers are the column names
+
+        :param table: The Table
+        :type table: pyarrow.Table
+
+        :return: The store
+        :rtype: ArrayStore
+
+        :raises ImportError: If PyArrow is not installed
+        """
+        if pa is None:
+            raise ImportError("PyArrow is required to read Arrow tables")
+        columns = [ArrowColumn(column) for column in table.columns]
+        return cls(columns, list(table.column_names))
+
+    def iter_rows(
+        self, indices: Iterable[int], columns: Sequence[int] = None
+    ) -> Iterator[List[str]]:
+        """Get the cells of some rows, formatted column by column, chunk by chunk
+
+        :param indices: The indices of the rows
+        :type indices: Iterable[int]
+        :param columns: The positions of the columns, missing cells are empty,
+            defaults to None (all)
+        :type columns: Sequence[int], optional
+
+        :return: A generator of the cells of each row
+        :rtype: Iterator[List[str]]
+        """
+        if columns is None:
+            columns = range(len(self.columns))
+        for chunk in self._chunks(indices):
+            cells = [self._strings(i, chunk) for i in columns]
+            yield from map(list, zip(*cells))
+
+    @staticmethod
+    def _chunks(indices):
+        """Split the indices in chunks, sequences of indices are sliced"""
+        if isinstance(indices, (range, array, list)):
+            for start in range(0, len(indices), ARRAY_CHUNK_SIZE):
+                yield indices[start:start + ARRAY_CHUNK_SIZE]
+            return
+        indices = iter(indices)
+        while True:
+            chunk = list(islice(indices, ARRAY_CHUNK_SIZE))
+            if not chunk:
+                return
+            yield chunk
+
+    def _strings(self, index, indices):
+        """Format some cells of a column, the cells of a missing column are empty"""
+        if index < len(self.columns):
+            return self.columns[index].strings(indices)
+        return [""] * len(indices)
+
+    def row(self, index: int) -> List[str]:
+        """Get the cells of a row
+
+        :param index: The index of the row
+        :type index: int
+
+        :return: The cells of the row
+        :rtype: List[str]
+        """
+        return next(self.iter_rows([index]))
+
+    def project(self, index: int, columns: Sequence[int]) -> List[str]:
+        """Get some cells of a row
+
+        :param index: The index of the row
+        :type index: int
+        :param columns: The positions of the columns, missing cells are empty
+        :type columns: Sequence[int]
+
+        :return: The cells of the row
+        :rtype: List[str]
+        """
+        return next(self.iter_rows([index], columns))
+
+    def nb_columns(self) -> int:
+        """Get the number of columns of the store
+
+        :return: The number of columns
+        :rtype: int
+        """
+        return len(self.columns)
+
+    def column(self, index: int) -> List[str]:
+        """Get the formatted cells of a column
+
+        :param index: The index of the column
+        :type index: int
+
+        :return: The cells of the column
+        :rtype: List[str]
+        """
+        return self.columns[index].strings(range(self.nb_rows))
+
+    def column_lengths(self, index: int) -> array:
+        """Get the lengths of the formatted cells of a column, computed once
+
+        :param index: The index of the column
+        :type index: int
+
+        :return: The length of each cell of the column
+        :rtype: array
+        """
+        lengths = self._lengths.get(index)
+        if lengths is None:
+            lengths = array("L")
+            for start in range(0, self.nb_rows, ARRAY_CHUNK_SIZE):
+                stop = min(start + ARRAY_CHUNK_SIZE, self.nb_rows)
+                lengths.extend(self.columns[index].lengths(start, stop).tolist())
+            self._lengths[index] = lengths
+        return lengths
+
+    def append_rows(self, rows):
+        """Rows cannot be appended to columns
+
+        :raises ValueError: Always
+        """
+        raise ValueError("Cannot append rows to a table read from columns")
+
+    def is_ragged(self) -> bool:
+        """Check if some rows have fewer cells than the others
+
+        :return: False, every column has the same number of cells
+        :rtype: bool
+        """
+        return False
+
+    def is_ascii(self) -> bool:
+        """Check if every formatted cell is ASCII text, as measured by the widths
+
+        :return: True if every formatted cell is ASCII text
+        :rtype: bool
+        """
+        return all(column.ascii for column in self.columns)
+
+    def wide_columns(self) -> Set[int]:
+        """Get the columns holding non-ASCII or styled cells, padded by display width
+
+        :return: The positions of the columns
+        :rtype: Set[int]
+        """
+        return {i for i, column in enumerate(self.columns) if not column.plain}
+
+    def max_row_size(self) -> int:
+        """Get the number of cells of the longest row
+
+        :return: The number of cells of the longest row
+        :rtype: int
+        """
+        return len(self.columns) if self.nb_rows else 0
+
+    def max_length(self, index: int) -> int:
+        """Get the length of the longest cell of a column
+
+        :param index: The index of the column
+        :type index: int
+
+        :return: The length of the longest cell
+        :rtype: int
+        """
+        return self.widths[index]
+
+    def max_lengths(self) -> List[int]:
+        """Get the length of the longest cell of each column
+
+        :return: The length of the longest cell of each column
+        :rtype: List[int]
+        """
+        return list(self.widths)
+
+    def __len__(self) -> int:
+        return self.nb_rows
@@ -0,0 +1,284 @@
+""" CsvStore class for reading the rows of a table from a memory-mapped CSV file.
+
+The file is memory-mapped and read in two passes. The first pass parses every
+record once to measure the widths of the columns, and only keeps the byte offset
+of each record in a compact array. The second pass, at render time, seeks to the
+records and parses them again one by one, so the rows are never all held in memory.
+"""
+
+import csv
+import mmap
+from array import array
+from functools import partial
+from typing import Iterable, Iterator, List, Sequence, Set
+from prettypi.utils.display_width import display_width, is_plain
+
+
+class CsvStore:  # pylint: disable=too-many-instance-attributes
+    """Class to store the rows of a table in a CSV file
+
+    The store has the same interface as the ColumnStore, the cells are parsed
+    from the file when a row is rendered. The encoding must be ASCII compatible
+    (UTF-8, Latin-1...), as the records are split on the newline byte.
+
+    The widths are display widths: the cells are measured with len() as long as
+    the records are plain ASCII, and the non-ASCII or styled cells by display
+    width once a record is not.
+
+    The memory map is released by the close method, or at the end of a with block.
+
+    :param path: The path of the CSV file
+    :type path: str
+    :param delimiter: The delimiter of the cells, "\\t" for TSV files, defaults to ","
+    :type delimiter: str, optional
+    :param has_header: The first record is the header, defaults to True
+    :type has_header: bool, optional
+    :param encoding: The encoding of the file, defaults to "utf-8"
+    :type encoding: str, optional
+
+    :raises OSError: If the file cannot be opened
+    """
+
+    def __init__(
+        self,
+        path: str,
+        delimiter: str = ",",
+        has_header: bool = True,
+        encoding: str = "utf-8",
+    ) -> None:
+        self.path = path
+        self.delimiter = delimiter
+        self.encoding = encoding
+        self.header = None
+        self.offsets = array("Q", [0])
+        self.widths = []
+        self.row_size = 0
+        self.min_row_size = None
+        self.ascii = True
+        self.plain = True
+        self.wide = set()
+        self._lengths = None
+        self._position = 0
+        self._mmap = self._map(path)
+        self._scan(has_header)
+
+    @staticmethod
+    def _map(path):
+        """Memory-map the file, read-only"""
+        with open(path, "rb") as file:
+            try:
+                return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file
+                return b""
+
+    def __getstate__(self):
+        """Pickle the store without its memory map, sent to the workers of a pool"""
+        state = self.__dict__.copy()
+        del state["_mmap"]
+        state["_lengths"] = None
+        return state
+
+    def __setstate__(self, state):
+        """Unpickle the store, the file is mapped again"""
+        self.__dict__.update(state)
+        self._mmap = self._map(self.path)
+
+    def _iter_records(self):
+        """Decode the lines of the file, recording the offset after each line"""
+        data = self._mmap
+        size = len(data)
+        start = 0
+        while start < size:
+            end = data.find(b"\n", start)
+            end = size if end == -1 else end + 1
+            self._position = end
+            line = data[start:end]
+            if self.ascii and not line.isascii():
+                self.ascii = False
+                self.plain = False
+            elif self.plain and b"\x1b" in line:
+                self.plain = False
+            yield line.decode(self.encoding)
+            start = end
+
+    def _scan(self, has_header):
+        """First pass: index the records and measure the widths of the columns"""
+        widths = self.widths
+        for cells in csv.reader(self._iter_records(), delimiter=self.delimiter):
+            if has_header and self.header is None:
+                self.header = cells
+                self.offsets[0] = self._position
+                continue
+            self.offsets.append(self._position)
+            self.row_size = max(self.row_size, len(cells))
+            if self.min_row_size is None or len(cells) < self.min_row_size:
+                self.min_row_size = len(cells)
+            for i, cell in enumerate(cells):
+                length = len(cell)
+                if not self.plain and not is_plain(cell):
+                    length = display_width(cell)
+                    self.wide.add(i)
+                if i == len(widths):
+                    widths.append(length)
+                elif length > widths[i]:
+                    widths[i] = length
+
+    def iter_rows(
+        self, indices: Iterable[int], columns: Sequence[int] = None
+    ) -> Iterator[List[str]]:
+        """Get the cells of some rows
+
+        :param indices: The indices of the rows
+        :type indices: Iterable[int]
+        :param columns: The positions of the columns, missing cells are empty,
+            defaults to None (all)
+        :type columns: Sequence[int], optional
+
+        :return: A generator of the cells of each row
+        :rtype: Iterator[List[str]]
+        """
+        if columns is None:
+            return map(self.row, indices)
+        return map(partial(self.project, columns=columns), indices)
+
+    def row(self, index: int) -> List[str]:
+        """Get the cells of a row, parsed from the file
+
+        :param index: The index of the row
+        :type index: int
+
+        :return: The cells of the row
+        :rtype: List[str]
+        """
+        record = self._mmap[self.offsets[index]:self.offsets[index + 1]]
+        return next(
+            csv.reader([record.decode(self.encoding)], delimiter=self.delimiter), []
+        )
+
+    def project(self, index: int, columns: Sequence[int]) -> List[str]:
+        """Get some cells of a row
+
+        :param index: The index of the row
+        :type index: int
+        :param columns: The positions of the columns, missing cells are empty
+        :type columns: Sequence[int]
+
+        :return: The cells of the row
+        :rtype: List[str]
+        """
+        cells = self.row(index)
+        return [cells[i] if i < len(cells) else "" for i in columns]
+
+    def nb_columns(self) -> int:
+        """Get the number of columns of the store
+
+        :return: The number of columns
+        :rtype: int
+        """
+        return len(self.widths)
+
+    def column(self, index: int) -> List[str]:
+        """Get the cells of a column, missing cells are empty
+
+        The file is read again, only the cells of the column are kept.
+
+        :param index: The index of the column
+        :type index: int
+
+        :return: The cells of the column
+        :rtype: List[str]
+        """
+        rows = map(self.row, range(len(self)))
+        return [row[index] if index < len(row) else "" for row in rows]
+
+    def column_lengths(self, index: int) -> array:
+        """Get the lengths of the cells of a column
+
+        The lengths of every column are measured the first time, with a single
+        pass over the file.
+
+        :param index: The index of the column
+        :type index: int
+
+        :return: The length of each cell of the column
+        :rtype: array
+        """
+        if self._lengths is None:
+            lengths = [array("L", [0]) * len(self) for _ in self.widths]
+            for i in range(len(self)):
+                for j, cell in enumerate(self.row(i)):
+                    lengths[j][i] = display_width(cell)
+            self._lengths = lengths
+        return self._lengths[index]
+
+    def append_rows(self, rows):
+        """Rows cannot be appended to a file
+
+        :raises ValueError: Always
+        """
+        raise ValueError(f"Cannot append rows to a table read from {self.path}")
+
+    def is_ragged(self) -> bool:
+        """Check if some rows have fewer cells than the others
+
+        :return: True if the rows do not all have the same number of cells
+        :rtype: bool
+        """
+        return bool(len(self)) and self.min_row_size != self.row_size
+
+    def is_ascii(self) -> bool:
+        """Check if the file is ASCII text, checked line by line by the first pass
+
+        :return: True if every byte of the file is ASCII
+        :rtype: bool
+        """
+        return self.ascii
+
+    def wide_columns(self) -> Set[int]:
+        """Get the columns holding non-ASCII or styled cells, padded by display width
+
+        :return: The positions of the columns
+        :rtype: Set[int]
+        """
+        return self.wide
+
+    def max_row_size(self) -> int:
+        """Get the number of cells of the longest row
+
+        :return: The number of cells of the longest row
+        :rtype: int
+        """
+        return self.row_size
+
+    def max_length(self, index: int) -> int:
+        """Get the length of the longest cell of a column
+
+        :param index: The index of the column
+        :type index: int
+
+        :return: The length of the longest cell
+        :rtype: int
+        """
+        return self.widths[index]
+
+    def max_lengths(self) -> List[int]:
+        """Get the length of the longest cell of each column
+
+        :return: The length of the longest cell of each column
+        :rtype: List[int]
+        """
+        return list(self.widths)
+
+    def close(self) -> None:
+        """Close the memory map of the file, the rows cannot be read anymore"""
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
+
+    def __enter__(self) -> "CsvStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
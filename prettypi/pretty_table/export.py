@@ -0,0 +1,159 @@
+""" Fixed-width export of a table into a preallocated file.
+
+When every cell is ASCII text and every row has the same number of cells, all
+the data rows of a table have the same length in bytes, and so do the separator
+rows. The offset of each row in the output file is known in advance: the file is
+sized once, then a pool of workers renders blocks of rows and writes each block
+at its own offset, in any order. The workers read the cells of their rows from
+the store, only the offsets and the indices of the rows are sent to them.
+
+Otherwise, the table is written sequentially.
+"""
+
+from typing import Sequence
+
+from prettypi.pretty_table.output import dump_lines
+from prettypi.pretty_table.parallel import (
+    PARALLEL_CHUNK_SIZE,
+    iter_chunks,
+    iter_results,
+    render_rows,
+    worker_pool,
+)
+
+
+def is_fixed_width(store, encoding: str) -> bool:
+    """Check if every data row of a store renders to the same number of bytes
+
+    :param store: The store of the data rows
+    :type store: Union[ColumnStore, CsvStore, ArrayStore]
+    :param encoding: The encoding of the output
+    :type encoding: str
+
+    :return: True if the data rows have a fixed width in bytes
+    :rtype: bool
+    """
+    ascii_compatible = "a ".encode(encoding) == b"a "
+    return ascii_compatible and not store.is_ragged() and not store.wide_columns()
+
+
+def write_block(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    offset: int,
+    indices: Sequence[int],
+    last: bool,
+    store,
+    layout,
+    path: str,
+    encoding: str,
+) -> int:
+    """Render a block of data rows and write it at its offset, in a worker
+
+    :param offset: The offset of the block in the file
+    :type offset: int
+    :param indices: The indices of the rows of the block
+    :type indices: Sequence[int]
+    :param last: The block ends the table
+    :type last: bool
+    :param store: The store of the data rows
+    :type store: Union[ColumnStore, CsvStore, ArrayStore, RingStore]
+    :param layout: The layout shared by the data rows
+    :type layout: RowLayout
+    :param path: The path of the preallocated file
+    :type path: str
+    :param encoding: The encoding of the output
+    :type encoding: str
+
+    :return: The number of bytes written
+    :rtype: int
+    """
+    lines = render_rows(indices, last, store, layout)
+    data = "".join(line + "\n" for line in lines).encode(encoding)
+    with open(path, "r+b") as file:
+        file.seek(offset)
+        file.write(data)
+    return len(data)
+
+
+def _export_sequential(manager, path, encoding):
+    """Export a table to a file, line by line"""
+    with open(path, "wb") as file:
+        dump_lines(manager.iter_lines(), file, encoding)
+
+
+def _line_size(line, encoding):
+    """Get the size in bytes of a line and its newline, 0 for no line"""
+    return len(line.encode(encoding)) + 1 if line is not None else 0
+
+
+def _preallocate(manager, path, indices, encoding, chunk_size):
+    """Write the header, size the output file and split the data rows in blocks
+
+    :return: The layout of the data rows and a generator of the offset, the
+        indices of the rows and the last flag of each block
+    :rtype: Tuple[RowLayout, Iterator[Tuple[int, Sequence[int], bool]]]
+    """
+    header, layout = manager.header_and_layout()
+    header_data = "".join(line + "\n" for line in header).encode(encoding)
+    row_size = _line_size(layout.render_row(manager.store.row(indices[0])), encoding)
+    block_row_size = row_size + _line_size(layout.row_separator, encoding)
+    end_size = _line_size(layout.bottom_separator or layout.row_separator, encoding)
+    size = len(header_data) + (len(indices) - 1) * block_row_size + row_size + end_size
+    with open(path, "wb") as file:
+        file.write(header_data)
+        file.truncate(size)
+    blocks = (
+        (len(header_data) + start * block_row_size, chunk, last)
+        for start, chunk, last in iter_chunks(indices, chunk_size)
+    )
+    return layout, blocks
+
+
+def export_fixed_width(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    manager,
+    path: str,
+    encoding: str = "utf-8",
+    workers: int = None,
+    executor: str = "process",
+    chunk_size: int = PARALLEL_CHUNK_SIZE,
+) -> None:
+    """Export a table to a file, writing blocks of rows in parallel when possible
+
+    The rows are written sequentially when they do not all have the same size in
+    bytes, or when their cells may be wrapped on several lines.
+
+    :param manager: The manager of the table
+    :type manager: JsonRowsManager
+    :param path: The path of the output file
+    :type path: str
+    :param encoding: The encoding of the output, defaults to "utf-8"
+    :type encoding: str, optional
+    :param workers: The number of workers, defaults to None (sequential)
+    :type workers: int, optional
+    :param executor: The kind of pool, "process" or "thread", defaults to "process"
+    :type executor: str, optional
+    :param chunk_size: The number of rows per block, defaults to PARALLEL_CHUNK_SIZE
+    :type chunk_size: int, optional
+    """
+    indices = manager.row_order()
+    if (
+        workers is None
+        or len(indices) == 0
+        or not is_fixed_width(manager.store, encoding)
+        or manager.config.has_width_constraints()
+    ):
+        _export_sequential(manager, path, encoding)
+        return
+
+    layout, blocks = _preallocate(manager, path, indices, encoding, chunk_size)
+    pool, submit = worker_pool(
+        workers,
+        executor,
+        write_block,
+        store=manager.store,
+        layout=layout,
+        path=path,
+        encoding=encoding,
+    )
+    with pool:
+        for _ in iter_results(submit, blocks, workers):
+            pass
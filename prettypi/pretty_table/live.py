@@ -0,0 +1,228 @@
+""" LiveTable class for redrawing a table in place in a terminal.
+
+The last frame drawn is kept cell by cell. Each update compares the new rows with
+it and only rewrites the cells that changed, moving the cursor to them with ANSI
+escape sequences, so an update costs the size of the changes and not the size of
+the table. The whole table is drawn again only when its shape changes: another
+number of rows or cells, a column getting wider or narrower, or a wrapped row
+taking another number of lines.
+"""
+
+import sys
+from typing import List, TextIO
+from prettypi.pretty_table.table_config import TableConfig
+from prettypi.pretty_table.utils import JsonRowsManager, fit_cells
+from prettypi.utils.display_width import display_width, ljust
+
+CURSOR_UP = "\x1b[{}A"
+CURSOR_DOWN = "\x1b[{}B"
+CURSOR_COLUMN = "\x1b[{}G"
+ERASE_LINE = "\x1b[K"
+ERASE_BELOW = "\x1b[J"
+
+
+class LiveTable:  # pylint: disable=too-many-instance-attributes
+    """LiveTable class for redrawing a table in place, like a dashboard.
+
+    The table is drawn below the cursor the first time, then each update moves the
+    cursor back into the table to rewrite the changed cells, and puts it back on
+    the line below the table. Nothing else must be written to the terminal between
+    two updates, and the table must fit in the terminal: the lines scrolled out of
+    the screen cannot be rewritten.
+
+    **Features:**
+
+    - Rewrite only the cells that changed since the last update.
+    - Draw the whole table again when the widths of the columns change.
+    - Use the TableConfig class to customize the table, width constraints included.
+
+    :param headers: The headers of the table, defaults to None
+    :type headers: List[str], optional
+    :param config: The configuration of the table, defaults to TableConfig()
+    :type config: TableConfig, optional
+    :param fp: The terminal to write to, defaults to None (sys.stdout)
+    :type fp: TextIO, optional
+
+    **Example:**
+
+    .. code-block:: python
+
+            from prettypi.pretty_table.live import LiveTable
+
+            live = LiveTable(["Host", "Load"])
+            live.update([["web-1", "0.42"], ["web-2", "0.17"]])
+            live.update([["web-1", "0.51"], ["web-2", "0.17"]])
+
+    """
+
+    def __init__(
+        self,
+        headers: List[str] = None,
+        config: TableConfig = TableConfig(),
+        fp: TextIO = None,
+    ) -> None:
+        self.headers = headers
+        self.config = config
+        self.fp = fp
+        self.redraws = 0
+        self._rows = None
+        self._lengths = []
+        self._widths = []
+        self._layout = None
+        self._fitted = []
+        self._starts = []
+        self._offsets = []
+        self._height = 0
+
+    def update(self, data: List[List[str]]) -> None:
+        """Draw the new rows of the table, rewriting only the changed cells.
+
+        :param data: The rows of the table
+        :type data: List[List[str]]
+        """
+        fp = self.fp if self.fp is not None else sys.stdout
+        fp.write(self.diff(data))
+        fp.flush()
+
+    def diff(self, data: List[List[str]]) -> str:
+        """Compute the text turning the last frame into the new one.
+
+        The new rows become the last frame, so the text must be written to the
+        terminal.
+
+        :param data: The rows of the table
+        :type data: List[List[str]]
+
+        :return: The changed cells and the cursor movements to reach them, or the
+            whole table if its shape changed
+        :rtype: str
+
+        **Example:**
+
+        .. code-block:: python
+
+                from prettypi.pretty_table.live import LiveTable
+
+                live = LiveTable(["Host", "Load"])
+                live.diff([["web-1", "0.42"]])
+                print(repr(live.diff([["web-1", "0.51"]])))
+
+        """
+        rows = [[str(item) for item in row] for row in data]
+        if self._rows is None or len(rows) != len(self._rows):
+            return self._redraw(rows)
+        changed = [
+            index
+            for index, (row, previous) in enumerate(zip(rows, self._rows))
+            if row != previous
+        ]
+        if any(len(rows[index]) != len(self._rows[index]) for index in changed):
+            return self._redraw(rows)
+        if self._resized(rows, changed):
+            return self._redraw(rows)
+        updates = []
+        for index in changed:
+            fitted = self._fit(rows[index])
+            if len(fitted) != len(self._fitted[index]):
+                return self._redraw(rows)
+            start = self._starts[index]
+            for line, (cells, previous) in enumerate(zip(fitted, self._fitted[index])):
+                updates.extend(
+                    (start + line, column, cell)
+                    for column, (cell, old) in enumerate(zip(cells, previous))
+                    if cell != old
+                )
+            self._fitted[index] = fitted
+            self._rows[index] = rows[index]
+        return self._move(updates)
+
+    def _resized(self, rows, changed):
+        """Measure the changed rows, check if the widths of the columns change"""
+        widths = list(self._widths)
+        shrunk = set()
+        for index in changed:
+            lengths = [display_width(cell) for cell in rows[index]]
+            for column, (length, old) in enumerate(zip(lengths, self._lengths[index])):
+                if length > widths[column]:
+                    widths[column] = length
+                elif length < old == self._widths[column]:
+                    shrunk.add(column)
+            self._lengths[index] = lengths
+        for column in shrunk:
+            widths[column] = self._column_width(column)
+        return widths != self._widths
+
+    def _column_width(self, column):
+        """Compute the width of a column from the lengths of its cells"""
+        headers = self.headers or []
+        width = display_width(str(headers[column])) if column < len(headers) else 0
+        lengths = (row[column] for row in self._lengths if column < len(row))
+        return max(width, max(lengths, default=0))
+
+    def _fit(self, row):
+        """Fit the cells of a row to the layout, one list of cells per line"""
+        if self._layout.overflow is None:
+            return [row]
+        return fit_cells(row, self._layout.widths, self._layout.overflow)
+
+    def _redraw(self, rows):
+        """Draw the whole table again, over the last frame"""
+        manager = JsonRowsManager()
+        manager.init(self.headers, rows, self.config)
+        lines = list(manager.iter_lines())
+        self._rows = rows
+        self._lengths = [[display_width(cell) for cell in row] for row in rows]
+        self._widths = [
+            self._column_width(column) for column in range(manager.nb_columns())
+        ]
+        self._fitted = []
+        self._starts = []
+        if rows:
+            header, self._layout = manager.header_and_layout()
+            self._locate(rows, len(header))
+        text = "".join(line + "\n" for line in lines)
+        if self.redraws:
+            text = "".join(line + ERASE_LINE + "\n" for line in lines) + ERASE_BELOW
+            if self._height:
+                text = CURSOR_UP.format(self._height) + "\r" + text
+        self.redraws += 1
+        self._height = len(lines)
+        return text
+
+    def _locate(self, rows, start):
+        """Find the first line of each row and the first column of each cell"""
+        layout = self._layout
+        separator = int(layout.row_separator is not None)
+        for row in rows:
+            fitted = self._fit(row)
+            self._fitted.append(fitted)
+            self._starts.append(start)
+            start += len(fitted) + separator
+        offset = display_width(layout.left) + 1
+        self._offsets = []
+        for width in layout.widths:
+            self._offsets.append(offset)
+            offset += width + display_width(layout.separator)
+
+    def _move(self, updates):
+        """Rewrite the changed cells, then put the cursor back below the table"""
+        if not updates:
+            return ""
+        widths = self._layout.widths
+        parts = []
+        line = self._height
+        for target, column, cell in updates:
+            if target < line:
+                parts.append(CURSOR_UP.format(line - target))
+            elif target > line:
+                parts.append(CURSOR_DOWN.format(target - line))
+            line = target
+            parts.append(CURSOR_COLUMN.format(self._offsets[column] + 1))
+            parts.append(ljust(cell, widths[column]))
+        parts.append(CURSOR_DOWN.format(self._height - line) + "\r")
+        return "".join(parts)
+
+    def __str__(self) -> str:
+        manager = JsonRowsManager()
+        manager.init(self.headers, self._rows or [], self.config)
+        return "\n".join(manager.iter_lines())
@@ -0,0 +1,210 @@
+""" Buffered output of rendered tables to text or binary file objects.
+
+The lines are grouped in blocks of about buffer_size characters, each block is
+written with a single call, so the whole table is never held in memory and the
+number of write calls stays low. Binary file objects (files opened in "wb" mode,
+gzip streams, sockets made into files...) receive encoded blocks.
+
+The same blocks can be written to an asyncio stream writer, draining it and
+yielding to the event loop after each block.
+"""
+
+import asyncio
+import io
+from abc import ABC, abstractmethod
+from typing import BinaryIO, Iterable, Iterator, List, TextIO, Union
+
+DEFAULT_BUFFER_SIZE = 1 << 16
+
+
+def is_binary(fp: Union[TextIO, BinaryIO]) -> bool:
+    """Check if a file object expects bytes
+
+    :param fp: The file object
+    :type fp: Union[TextIO, BinaryIO]
+
+    :return: True if the file object is a binary stream
+    :rtype: bool
+    """
+    return isinstance(fp, (io.RawIOBase, io.BufferedIOBase))
+
+
+def dump_lines(
+    lines: Iterable[str],
+    fp: Union[TextIO, BinaryIO],
+    encoding: str = "utf-8",
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> None:
+    """Write lines to a file object by blocks, each line terminated by a newline
+
+    :param lines: The lines to write
+    :type lines: Iterable[str]
+    :param fp: The text or binary file object to write to
+    :type fp: Union[TextIO, BinaryIO]
+    :param encoding: The encoding of the lines, for binary file objects only,
+        defaults to "utf-8"
+    :type encoding: str, optional
+    :param buffer_size: The number of characters per block, defaults to 65536
+    :type buffer_size: int, optional
+
+    :raises ValueError: If the buffer size is invalid
+    """
+    binary = is_binary(fp)
+    for block in iter_blocks(lines, buffer_size):
+        _write_block(fp, block, binary, encoding)
+
+
+def _write_block(fp, block, binary, encoding):
+    """Write a block of strings to a file object"""
+    if binary:
+        fp.write("".join(block).encode(encoding))
+    else:
+        fp.writelines(block)
+
+
+def iter_blocks(lines: Iterable[str], buffer_size: int) -> Iterator[List[str]]:
+    """Group lines in blocks of about buffer_size characters, newlines included
+
+    :param lines: The lines to group
+    :type lines: Iterable[str]
+    :param buffer_size: The number of characters per block
+    :type buffer_size: int
+
+    :return: A generator of blocks, each block is a list of strings
+    :rtype: Iterator[List[str]]
+
+    :raises ValueError: If the buffer size is invalid
+    """
+    if buffer_size < 1:
+        raise ValueError(f"Invalid buffer size: {buffer_size}")
+    block = []
+    size = 0
+    for line in lines:
+        block.append(line)
+        block.append("\n")
+        size += len(line) + 1
+        if size >= buffer_size:
+            yield block
+            block = []
+            size = 0
+    if block:
+        yield block
+
+
+async def adump_lines(
+    lines: Iterable[str],
+    writer: asyncio.StreamWriter,
+    encoding: str = "utf-8",
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> None:
+    """Write lines to an asyncio stream writer by blocks, with backpressure
+
+    After each block, the writer is drained and the control is given back to
+    the event loop, so a large table never blocks the other tasks for more than
+    the rendering of one block.
+
+    :param lines: The lines to write
+    :type lines: Iterable[str]
+    :param writer: The stream writer
+    :type writer: asyncio.StreamWriter
+    :param encoding: The encoding of the lines, defaults to "utf-8"
+    :type encoding: str, optional
+    :param buffer_size: The number of characters per block, defaults to 65536
+    :type buffer_size: int, optional
+
+    :raises ValueError: If the buffer size is invalid
+    """
+    for block in iter_blocks(lines, buffer_size):
+        writer.write("".join(block).encode(encoding))
+        await writer.drain()
+        await asyncio.sleep(0)
+
+
+class LinesOutput(ABC):
+    """Mixin class adding the buffered outputs to the classes rendering lines
+
+    The classes using the mixin render their lines with an iter_lines method, a
+    class missing it cannot be instantiated.
+    """
+
+    @abstractmethod
+    def iter_lines(self) -> Iterator[str]:
+        """Render the lines to write
+
+        :return: A generator of the lines
+        :rtype: Iterator[str]
+        """
+
+    def dump(
+        self,
+        fp: Union[TextIO, BinaryIO],
+        encoding: str = "utf-8",
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> None:
+        """Write the lines to a text or binary file object, by blocks of lines.
+
+        The lines are rendered lazily and written in blocks of about buffer_size
+        characters, so the output is never built in memory. Binary file objects
+        (gzip streams, sockets, pipes...) receive the blocks encoded.
+
+        :param fp: The file object to write to
+        :type fp: Union[TextIO, BinaryIO]
+        :param encoding: The encoding of the output, for binary file objects only,
+            defaults to "utf-8"
+        :type encoding: str, optional
+        :param buffer_size: The number of characters per block, defaults to 65536
+        :type buffer_size: int, optional
+
+        :raises ValueError: If the buffer size is invalid
+
+        **Example:**
+
+        .. code-block:: python
+
+                import gzip
+                import io
+                from prettypi.pretty_table.table import PrettyTable
+
+                pt = PrettyTable([["1", "2"], ["3", "4"]], ["A", "B"])
+                buffer = io.BytesIO()
+                with gzip.GzipFile(fileobj=buffer, mode="wb") as fp:
+                    pt.dump(fp)
+
+        """
+        dump_lines(self.iter_lines(), fp, encoding, buffer_size)
+
+    async def awrite(
+        self,
+        writer: asyncio.StreamWriter,
+        encoding: str = "utf-8",
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> None:
+        """Write the lines to an asyncio stream writer without blocking the event loop.
+
+        The lines are rendered lazily, with the same layout as the other outputs,
+        and written in blocks of about buffer_size characters. The writer is
+        drained after each block and the event loop runs the other tasks.
+
+        :param writer: The stream writer, a TCP or SSH connection for example
+        :type writer: asyncio.StreamWriter
+        :param encoding: The encoding of the output, defaults to "utf-8"
+        :type encoding: str, optional
+        :param buffer_size: The number of characters per block, defaults to 65536
+        :type buffer_size: int, optional
+
+        :raises ValueError: If the buffer size is invalid
+
+        **Example:**
+
+        .. code-block:: python
+
+                import asyncio
+                from prettypi.pretty_table.table import PrettyTable
+
+                async def handle(reader, writer):
+                    await PrettyTable([["1", "2"]], ["A", "B"]).awrite(writer)
+                    writer.close()
+                    await writer.wait_closed()
+
+        """
+        await adump_lines(self.iter_lines(), writer, encoding, buffer_size)
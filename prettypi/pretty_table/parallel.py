@@ -0,0 +1,187 @@
+""" Parallel rendering of the data rows of a table.
+
+Once the widths of the columns are known, every data row can be rendered
+independently. The rows are split in ranges of indices, each range is rendered by
+a worker of a process pool (or a thread pool, for free-threaded builds of Python)
+and the rendered lines are yielded back in order.
+
+The workers read the cells of their rows from the store themselves: only the
+indices of the rows are sent to them, and only the rendered lines come back. The
+store and the layout are shared once per worker: a thread pool shares them with
+the caller, a process pool sends them to each worker when it starts (the workers
+inherit them without copy when they are forked). A CsvStore is sent as the path
+of its file, which each worker maps again.
+
+With a process pool, the pool is started at render time: the ``__main__`` module
+must be importable without side effects on the platforms that spawn the workers.
+"""
+
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+EXECUTORS = {"process": ProcessPoolExecutor, "thread": ThreadPoolExecutor}
+PARALLEL_CHUNK_SIZE = 10000
+
+_SHARED = {}
+
+
+def check_workers(workers: int, executor: str) -> None:
+    """Check the parallel rendering options
+
+    :param workers: The number of workers, None to render serially
+    :type workers: int
+    :param executor: The kind of pool, "process" or "thread"
+    :type executor: str
+
+    :raises ValueError: If the options are invalid
+    """
+    if workers is not None and (not isinstance(workers, int) or workers < 1):
+        raise ValueError(f"Invalid workers: {workers}")
+    if executor not in EXECUTORS:
+        raise ValueError(f"Invalid executor: {executor}")
+
+
+def share(values: Dict[str, object]) -> None:
+    """Keep the objects shared by every task of a worker process, at its start
+
+    :param values: The objects passed by name to the tasks
+    :type values: Dict[str, object]
+    """
+    _SHARED.clear()
+    _SHARED.update(values)
+
+
+def _run_shared(function, *args):
+    """Run a task in a worker process with the objects shared at its start"""
+    return function(*args, **_SHARED)
+
+
+def worker_pool(
+    workers: int, executor: str, function: Callable, **shared
+) -> Tuple[Executor, Callable[..., Future]]:
+    """Create a pool of workers running a function with objects shared by every task
+
+    :param workers: The number of workers
+    :type workers: int
+    :param executor: The kind of pool, "process" or "thread"
+    :type executor: str
+    :param function: The function run by the tasks, it gets the arguments of the
+        task followed by the shared objects as keyword arguments
+    :type function: Callable
+    :param shared: The objects shared by every task, sent once per worker
+
+    :return: The pool, to use as a context manager, and the function submitting
+        a task to it
+    :rtype: Tuple[Executor, Callable[..., Future]]
+    """
+    if executor == "thread":
+        pool = ThreadPoolExecutor(max_workers=workers)
+        return pool, partial(pool.submit, partial(function, **shared))
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=share, initargs=(shared,))
+    return pool, partial(pool.submit, _run_shared, function)
+
+
+def iter_results(
+    submit: Callable[..., Future], tasks: Iterable[Tuple], workers: int
+) -> Iterator:
+    """Submit tasks to a pool of workers, yielding their results in order
+
+    At most two tasks per worker are in flight, so the memory stays bounded
+    whatever the number of tasks.
+
+    :param submit: The function submitting a task
+    :type submit: Callable[..., Future]
+    :param tasks: The arguments of each task
+    :type tasks: Iterable[Tuple]
+    :param workers: The number of workers
+    :type workers: int
+
+    :return: A generator of the result of each task
+    :rtype: Iterator
+    """
+    pending = deque()
+    for args in tasks:
+        pending.append(submit(*args))
+        if len(pending) >= 2 * workers:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def iter_chunks(indices: Sequence[int], chunk_size: int) -> Iterator[Tuple]:
+    """Split the indices of the rows in chunks
+
+    :param indices: The indices of the rows
+    :type indices: Sequence[int]
+    :param chunk_size: The number of rows per chunk
+    :type chunk_size: int
+
+    :return: A generator of the position of the first row, the indices of the rows
+        and the last flag of each chunk
+    :rtype: Iterator[Tuple[int, Sequence[int], bool]]
+    """
+    for start in range(0, len(indices), chunk_size):
+        stop = start + chunk_size
+        yield start, indices[start:stop], stop >= len(indices)
+
+
+def render_rows(
+    indices: Sequence[int], last: bool, store, layout, columns: Sequence[int] = None
+) -> List[str]:
+    """Render a chunk of data rows, reading their cells from the store
+
+    :param indices: The indices of the rows of the chunk
+    :type indices: Sequence[int]
+    :param last: The chunk ends the table
+    :type last: bool
+    :param store: The store of the data rows
+    :type store: Union[ColumnStore, CsvStore, ArrayStore, RingStore]
+    :param layout: The layout shared by the data rows
+    :type layout: RowLayout
+    :param columns: The positions of the columns to render, defaults to None (all)
+    :type columns: Sequence[int], optional
+
+    :return: The rendered lines of the chunk
+    :rtype: List[str]
+    """
+    return list(layout.iter_lines(store.iter_rows(indices, columns), last))
+
+
+def iter_parallel_lines(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    layout,
+    store,
+    indices: Sequence[int],
+    columns: Sequence[int],
+    workers: int,
+    executor: str = "process",
+    chunk_size: int = PARALLEL_CHUNK_SIZE,
+) -> Iterator[str]:
+    """Render data rows in a pool of workers, yielding the lines in order
+
+    :param layout: The layout shared by the data rows
+    :type layout: RowLayout
+    :param store: The store of the data rows
+    :type store: Union[ColumnStore, CsvStore, ArrayStore, RingStore]
+    :param indices: The indices of the rows to render
+    :type indices: Sequence[int]
+    :param columns: The positions of the columns to render, None for all
+    :type columns: Sequence[int]
+    :param workers: The number of workers
+    :type workers: int
+    :param executor: The kind of pool, "process" or "thread", defaults to "process"
+    :type executor: str, optional
+    :param chunk_size: The number of rows per chunk, defaults to PARALLEL_CHUNK_SIZE
+    :type chunk_size: int, optional
+
+    :return: A generator of the rendered lines
+    :rtype: Iterator[str]
+    """
+    tasks = (chunk[1:] for chunk in iter_chunks(indices, chunk_size))
+    pool, submit = worker_pool(
+        workers, executor, render_rows, store=store, layout=layout, columns=columns
+    )
+    with pool:
+        for lines in iter_results(submit, tasks, workers):
+            yield from lines
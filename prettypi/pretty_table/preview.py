@@ -0,0 +1,186 @@
+""" PreviewTable class for previewing huge iterables of rows with bounded memory. """
+
+import heapq
+from collections import deque
+from itertools import islice
+from typing import Iterable, Iterator, List, Tuple, Union
+from prettypi.pretty_table.output import LinesOutput
+from prettypi.pretty_table.sorting import sort_key
+from prettypi.pretty_table.table_config import TableConfig
+from prettypi.pretty_table.utils import JsonRowsManager
+from prettypi.utils.display_width import ELLIPSIS, center, display_width
+
+
+class PreviewTable(LinesOutput):
+    """PreviewTable class for displaying a few rows of a huge iterable of rows.
+
+    The rows are read once and only the previewed rows are kept: the first head
+    rows in a list, the last tail rows in a bounded deque, or the top_n rows in a
+    heap, so the memory is O(head + tail) or O(n) whatever the number of rows.
+    The widths of the columns are computed over the kept rows only, and a row
+    "… N rows …" stands for the rows left out.
+
+    **Features:**
+
+    - Preview the first and the last rows with head and tail.
+    - Preview the n rows with the highest values of a column with top_n, the
+      numbers first by descending value, then the other cells.
+    - Use the TableConfig class to customize the table.
+
+    :param data: The rows to preview, read once
+    :type data: Iterable[List[str]]
+    :param headers: The headers of the table, defaults to None
+    :type headers: List[str], optional
+    :param config: The configuration of the table, defaults to TableConfig()
+    :type config: TableConfig, optional
+    :param head: The number of first rows to keep, defaults to 20
+    :type head: int, optional
+    :param tail: The number of last rows to keep, defaults to 20
+    :type tail: int, optional
+    :param top_n: The header or the position of a column and the number of rows
+        with its highest values to keep, instead of the head and the tail,
+        defaults to None
+    :type top_n: Tuple[Union[int, str], int], optional
+
+    :raises ValueError: If head, tail or n is negative, or the header does not exist
+    :raises IndexError: If the position of the column is negative
+
+    **Example:**
+
+    .. code-block:: python
+
+            from prettypi.pretty_table.preview import PreviewTable
+
+            rows = ([str(i), str(i * 37 % 101)] for i in range(100000))
+            print(PreviewTable(rows, ["Id", "Score"], head=2, tail=2))
+            rows = ([str(i), str(i * 37 % 101)] for i in range(100000))
+            print(PreviewTable(rows, ["Id", "Score"], top_n=("Score", 3)))
+
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        data: Iterable[List[str]],
+        headers: List[str] = None,
+        config: TableConfig = TableConfig(),
+        head: int = 20,
+        tail: int = 20,
+        top_n: Tuple[Union[int, str], int] = None,
+    ) -> None:
+        if head < 0 or tail < 0:
+            raise ValueError(f"Invalid head or tail: {head}, {tail}")
+        self.headers = headers
+        self.config = config
+        self.nb_rows = 0
+        if top_n is None:
+            rows = self._head_and_tail(iter(data), head, tail)
+            self.split = min(head, len(rows))
+        else:
+            rows = self._top(iter(data), *top_n)
+            self.split = len(rows)
+        self.elided = self.nb_rows - len(rows)
+        self.json_rows_manager = JsonRowsManager()
+        self.json_rows_manager.init(headers, rows, config)
+
+    def _head_and_tail(self, rows, head, tail):
+        """Keep the first head rows and the last tail rows, counting the others"""
+        kept = list(islice(rows, head))
+        last = deque(maxlen=tail)
+        count = 0
+        for count, row in enumerate(rows, 1):
+            last.append(row)
+        self.nb_rows = len(kept) + count
+        kept.extend(last)
+        return kept
+
+    def _column_index(self, column):
+        """Get the position of a column from its position or its header"""
+        if isinstance(column, str):
+            if not self.headers or column not in self.headers:
+                raise ValueError(f"Invalid column: {column}")
+            return self.headers.index(column)
+        if column < 0:
+            raise IndexError(f"Invalid column: {column}")
+        return column
+
+    def _top(self, rows, column, n):
+        """Keep the n rows with the highest values of a column in a heap
+
+        The numbers come first, by descending value. The text, blank and missing
+        cells rank below every number, in descending alphabetical order, so a
+        blank or "N/A" cell never hides a number. The first rows come first on ties.
+        """
+        if n < 0:
+            raise ValueError(f"Invalid number of rows: {n}")
+        column = self._column_index(column)
+        heap = []
+        index = -1
+        for index, row in enumerate(rows):
+            key = self._top_key(str(row[column]) if column < len(row) else "")
+            if len(heap) < n:
+                heapq.heappush(heap, (key, -index, row))
+            elif n and key > heap[0][0]:
+                heapq.heapreplace(heap, (key, -index, row))
+        self.nb_rows = index + 1
+        return [row for _, _, row in sorted(heap, reverse=True)]
+
+    @staticmethod
+    def _top_key(cell):
+        """Get the key of a cell for top_n, every number is above every other cell"""
+        numeric, value, text = sort_key(cell)
+        return (1, value) if not numeric else (0, text)
+
+    def _elision(self):
+        """Get the text of the row standing for the rows left out"""
+        return f"{ELLIPSIS} {self.elided:,} row{'s' * (self.elided != 1)} {ELLIPSIS}"
+
+    @staticmethod
+    def _inner_width(layout):
+        """Get the width of the cells of a row and their separators"""
+        widths = layout.widths
+        return sum(widths) + len(layout.separator) * max(len(widths) - 1, 0)
+
+    def _header_and_layout(self, text):
+        """Render the header and build the layout, the last column is widened if
+        the text of the elided rows does not fit in the row
+
+        Without kept rows, the table is laid out for the row of the elided rows.
+        """
+        manager = self.json_rows_manager
+        if len(manager.store) == 0:
+            manager.reserve_rows(1)
+        header, layout = manager.header_and_layout()
+        missing = display_width(text) - self._inner_width(layout)
+        if missing > 0:
+            widths = list(layout.widths) or [0]
+            widths[-1] += missing
+            header, layout = manager.header_and_layout(widths)
+        return header, layout
+
+    def iter_lines(self) -> Iterator[str]:
+        """Render the preview one line at a time.
+
+        :return: A generator of the lines of the preview
+        :rtype: Iterator[str]
+        """
+        manager = self.json_rows_manager
+        size = len(manager.store)
+        if not self.elided:
+            yield from manager.iter_lines()
+            return
+        text = self._elision()
+        header, layout = self._header_and_layout(text)
+        yield from header
+        yield from layout.iter_lines(manager.rows(range(self.split)), last=False)
+        yield f"{layout.left} {center(text, self._inner_width(layout))} {layout.right}"
+        if self.split < size:
+            if layout.row_separator is not None:
+                yield layout.row_separator
+            yield from layout.iter_lines(manager.rows(range(self.split, size)))
+        elif layout.bottom_separator is not None:
+            yield layout.bottom_separator
+        elif layout.row_separator is not None:
+            yield layout.row_separator
+
+    def __str__(self) -> str:
+        return "\n".join(self.iter_lines())
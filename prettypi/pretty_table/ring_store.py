@@ -0,0 +1,238 @@
+""" RingStore class for keeping the last rows of a table in a ring buffer.
+
+The store has a fixed capacity: once it is full, each new row takes the slot of
+the oldest one. The widths of the columns are tracked with a counter of the cell
+lengths per column, so removing the widest cell of a column shrinks the column
+without scanning the rows again. Appending a row costs O(columns), the counter is
+only scanned when the last cell of the maximum length is removed.
+"""
+
+import sys
+from array import array
+from collections import Counter
+from typing import Iterable, Iterator, List, Sequence, Set
+from prettypi.utils.display_width import display_width, is_plain
+
+
+class RingStore:  # pylint: disable=too-many-instance-attributes
+    """Class to store the last rows of a table in a ring buffer
+
+    The store has the same interface as the ColumnStore, the rows are indexed
+    from the oldest one to the newest one.
+
+    :param capacity: The maximum number of rows kept
+    :type capacity: int
+
+    :raises ValueError: If the capacity is invalid
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError(f"Invalid capacity: {capacity}")
+        self.capacity = capacity
+        self.rows = [None] * capacity
+        self.start = 0
+        self.nb_rows = 0
+        self.counters = []
+        self.widths = []
+        self.wide = []
+        self.non_ascii = 0
+        self.sizes = Counter()
+
+    def append(self, row: List[str]) -> None:
+        """Append a row, removing the oldest row if the store is full
+
+        :param row: The cells of the row
+        :type row: List[str]
+        """
+        cells = [sys.intern(str(item)) for item in row]
+        slot = (self.start + self.nb_rows) % self.capacity
+        if self.nb_rows == self.capacity:
+            self._remove(self.rows[slot])
+            self.start = (self.start + 1) % self.capacity
+        else:
+            self.nb_rows += 1
+        self.rows[slot] = cells
+        self._add(cells)
+
+    def _add(self, cells):
+        """Count the lengths of the cells of a new row"""
+        while len(self.counters) < len(cells):
+            self.counters.append(Counter())
+            self.widths.append(0)
+            self.wide.append(0)
+        self.sizes[len(cells)] += 1
+        for i, cell in enumerate(cells):
+            length = len(cell)
+            if not is_plain(cell):
+                length = display_width(cell)
+                self.wide[i] += 1
+                self.non_ascii += not cell.isascii()
+            self.counters[i][length] += 1
+            if length > self.widths[i]:
+                self.widths[i] = length
+
+    def _remove(self, cells):
+        """Uncount the lengths of the cells of a removed row"""
+        self._discard(self.sizes, len(cells))
+        for i, cell in enumerate(cells):
+            length = len(cell)
+            if not is_plain(cell):
+                length = display_width(cell)
+                self.wide[i] -= 1
+                self.non_ascii -= not cell.isascii()
+            counter = self.counters[i]
+            self._discard(counter, length)
+            if length == self.widths[i] and length not in counter:
+                self.widths[i] = max(counter, default=0)
+
+    @staticmethod
+    def _discard(counter, key):
+        """Remove one occurrence of a key from a counter"""
+        counter[key] -= 1
+        if not counter[key]:
+            del counter[key]
+
+    def append_rows(self, rows: Iterable[List[str]]) -> List[int]:
+        """Append rows, removing the oldest rows if the store is full
+
+        :param rows: The rows to append
+        :type rows: Iterable[List[str]]
+
+        :return: The length of the longest cell of each column
+        :rtype: List[int]
+        """
+        for row in rows:
+            self.append(row)
+        return self.max_lengths()
+
+    def _slot(self, index):
+        """Get the slot of the row at an index, from the oldest row"""
+        return (self.start + index) % self.capacity
+
+    def iter_rows(
+        self, indices: Iterable[int], columns: Sequence[int] = None
+    ) -> Iterator[List[str]]:
+        """Get the cells of some rows
+
+        :param indices: The indices of the rows
+        :type indices: Iterable[int]
+        :param columns: The positions of the columns, missing cells are empty,
+            defaults to None (all)
+        :type columns: Sequence[int], optional
+
+        :return: A generator of the cells of each row
+        :rtype: Iterator[List[str]]
+        """
+        if columns is None:
+            return map(self.row, indices)
+        return (self.project(index, columns) for index in indices)
+
+    def row(self, index: int) -> List[str]:
+        """Get the cells of a row
+
+        :param index: The index of the row, 0 is the oldest row
+        :type index: int
+
+        :return: The cells of the row
+        :rtype: List[str]
+        """
+        return list(self.rows[self._slot(index)])
+
+    def project(self, index: int, columns: Sequence[int]) -> List[str]:
+        """Get some cells of a row
+
+        :param index: The index of the row, 0 is the oldest row
+        :type index: int
+        :param columns: The positions of the columns, missing cells are empty
+        :type columns: Sequence[int]
+
+        :return: The cells of the row
+        :rtype: List[str]
+        """
+        cells = self.rows[self._slot(index)]
+        return [cells[i] if i < len(cells) else "" for i in columns]
+
+    def nb_columns(self) -> int:
+        """Get the number of columns of the store
+
+        :return: The number of columns
+        :rtype: int
+        """
+        return self.max_row_size()
+
+    def column(self, index: int) -> List[str]:
+        """Get the cells of a column, missing cells are empty
+
+        :param index: The index of the column
+        :type index: int
+
+        :return: The cells of the column
+        :rtype: List[str]
+        """
+        return [row[0] for row in self.iter_rows(range(self.nb_rows), [index])]
+
+    def column_lengths(self, index: int) -> array:
+        """Get the lengths of the cells of a column, measured again
+
+        :param index: The index of the column
+        :type index: int
+
+        :return: The length of each cell of the column
+        :rtype: array
+        """
+        return array("L", map(display_width, self.column(index)))
+
+    def is_ragged(self) -> bool:
+        """Check if some rows have fewer cells than the others
+
+        :return: True if the rows do not all have the same number of cells
+        :rtype: bool
+        """
+        return len(self.sizes) > 1
+
+    def is_ascii(self) -> bool:
+        """Check if every cell is ASCII text
+
+        :return: True if every cell is ASCII text
+        :rtype: bool
+        """
+        return not self.non_ascii
+
+    def wide_columns(self) -> Set[int]:
+        """Get the columns holding non-ASCII or styled cells, padded by display width
+
+        :return: The positions of the columns
+        :rtype: Set[int]
+        """
+        return {i for i, count in enumerate(self.wide) if count}
+
+    def max_row_size(self) -> int:
+        """Get the number of cells of the longest row
+
+        :return: The number of cells of the longest row
+        :rtype: int
+        """
+        return max(self.sizes, default=0)
+
+    def max_length(self, index: int) -> int:
+        """Get the length of the longest cell of a column
+
+        :param index: The index of the column
+        :type index: int
+
+        :return: The length of the longest cell
+        :rtype: int
+        """
+        return self.widths[index]
+
+    def max_lengths(self) -> List[int]:
+        """Get the length of the longest cell of each column
+
+        :return: The length of the longest cell of each column
+        :rtype: List[int]
+        """
+        return self.widths[:self.max_row_size()]
+
+    def __len__(self) -> int:
+        return self.nb_rows
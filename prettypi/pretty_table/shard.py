@@ -0,0 +1,157 @@
+""" Two-phase rendering of a table split in several shards.
+
+When the rows of a table are spread across workers or machines, each shard
+computes a small width summary of its rows. The summaries are merged, then each
+shard renders its rows with the merged summary: the rendered shards can be
+concatenated, in order, into a single aligned table.
+
+**Example:**
+
+.. code-block:: python
+
+        from prettypi.pretty_table.shard import (
+            compute_width_summary,
+            merge_width_summaries,
+            render_shard,
+        )
+        from prettypi.pretty_table.table_config import TableConfig
+
+        shards = [[["1", "apple"]], [["2", "banana"]], [["3", "kiwi"]]]
+        headers = ["Id", "Fruit"]
+        summary = merge_width_summaries(
+            compute_width_summary(rows, headers) for rows in shards
+        )
+        parts = ["first", "middle", "last"]
+        for rows, part in zip(shards, parts):
+            for line in render_shard(rows, summary, TableConfig(), part, headers):
+                print(line)
+
+"""
+
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Iterable, Iterator, List
+from prettypi.pretty_table.table_config import TableConfig
+from prettypi.pretty_table.utils import ColumnStore, JsonRowsManager
+from prettypi.pretty_table.widths import merge_widths
+from prettypi.utils.display_width import display_width
+
+PARTS = ("first", "middle", "last", "only")
+SUMMARY_CHUNK_SIZE = 10000
+
+
+@dataclass
+class WidthSummary:
+    """Class to represent the widths of the columns of a shard of a table.
+
+    A summary is small and picklable, the summaries of several shards are merged
+    with the merge method to get the summary of the whole table.
+
+    :param widths: The width of each column
+    :type widths: List[int]
+    :param max_row_size: The number of cells of the longest row
+    :type max_row_size: int
+    :param nb_rows: The number of rows
+    :type nb_rows: int
+    """
+
+    widths: List[int] = field(default_factory=list)
+    max_row_size: int = 0
+    nb_rows: int = 0
+
+    def merge(self, other: "WidthSummary") -> "WidthSummary":
+        """Merge two summaries
+
+        :param other: The other summary
+        :type other: WidthSummary
+
+        :return: The summary of both shards
+        :rtype: WidthSummary
+        """
+        return WidthSummary(
+            merge_widths(self.widths, other.widths),
+            max(self.max_row_size, other.max_row_size),
+            self.nb_rows + other.nb_rows,
+        )
+
+
+def compute_width_summary(
+    rows: Iterable[List[str]], headers: List[str] = None
+) -> WidthSummary:
+    """Compute the width summary of a shard
+
+    The rows are read by chunks, so the shard does not need to fit in memory.
+    The widths do not depend on the configuration of the table.
+
+    :param rows: The rows of the shard
+    :type rows: Iterable[List[str]]
+    :param headers: The headers of the table, defaults to None
+    :type headers: List[str], optional
+
+    :return: The width summary of the shard
+    :rtype: WidthSummary
+    """
+    summary = WidthSummary([display_width(header) for header in headers or []])
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, SUMMARY_CHUNK_SIZE))
+        if not chunk:
+            return summary
+        store = ColumnStore()
+        store.append_rows(chunk)
+        summary = summary.merge(
+            WidthSummary(store.max_lengths(), store.max_row_size(), len(store))
+        )
+
+
+def merge_width_summaries(summaries: Iterable[WidthSummary]) -> WidthSummary:
+    """Merge the summaries of every shard of a table
+
+    :param summaries: The summaries of the shards
+    :type summaries: Iterable[WidthSummary]
+
+    :return: The summary of the whole table
+    :rtype: WidthSummary
+    """
+    merged = WidthSummary()
+    for summary in summaries:
+        merged = merged.merge(summary)
+    return merged
+
+
+def render_shard(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    rows: List[List[str]],
+    summary: WidthSummary,
+    config: TableConfig = TableConfig(),
+    part: str = "middle",
+    headers: List[str] = None,
+) -> Iterator[str]:
+    """Render the rows of a shard with the merged summary of the table
+
+    The first shard renders the header and its borders, the last shard renders
+    the bottom border of the table.
+
+    :param rows: The rows of the shard
+    :type rows: List[List[str]]
+    :param summary: The merged summary of every shard of the table
+    :type summary: WidthSummary
+    :param config: The configuration of the table, defaults to TableConfig()
+    :type config: TableConfig, optional
+    :param part: The position of the shard, "first", "middle", "last" or "only"
+        (the table has a single shard), defaults to "middle"
+    :type part: str, optional
+    :param headers: The headers of the table, defaults to None
+    :type headers: List[str], optional
+
+    :return: A generator of the rendered lines
+    :rtype: Iterator[str]
+
+    :raises ValueError: If the part is invalid
+    """
+    if part not in PARTS:
+        raise ValueError(f"Invalid part: {part}")
+    manager = JsonRowsManager()
+    manager.init(headers, rows, config)
+    return manager.iter_shard_lines(
+        summary, part in ("first", "only"), part in ("last", "only")
+    )
@@ -0,0 +1,152 @@
+""" Sort keys and permutation index used to sort the rows of a table. """
+
+from array import array
+from typing import Callable, List, Sequence, Tuple
+
+
+def sort_key(cell: str) -> Tuple[int, float, str]:
+    """Decorate a cell so that numbers are sorted by value, before the other strings
+
+    :param cell: The cell to decorate
+    :type cell: str
+
+    :return: The sort key of the cell
+    :rtype: Tuple[int, float, str]
+    """
+    try:
+        value = float(cell)
+    except ValueError:
+        return (1, 0.0, cell)
+    if value != value:  # pylint: disable=comparison-with-itself
+        return (1, 0.0, cell)
+    return (0, value, cell)
+
+
+def rank_key(cell: str) -> Tuple:
+    """Decorate a cell so that two cells compare like their ranks in column_keys
+
+    Unlike sort_key, the numbers are only compared by value, so "1" and "1.0"
+    are equal.
+
+    :param cell: The cell to decorate
+    :type cell: str
+
+    :return: The key of the cell
+    :rtype: Tuple
+    """
+    key = sort_key(cell)
+    return key if key[0] else key[:2]
+
+
+def column_keys(cells: Sequence[str]) -> array:
+    """Compute the sort keys of a column, as the rank of each cell
+
+    The numbers and the other strings are sorted separately once, by value and
+    alphabetically, then each cell is replaced by its rank, so sorting the rows
+    only compares integers.
+
+    :param cells: The cells of the column
+    :type cells: Sequence[str]
+
+    :return: The rank of each cell, equal cells have the same rank
+    :rtype: array
+    """
+    numbers = {}
+    strings = []
+    for index, cell in enumerate(cells):
+        key = sort_key(cell)
+        if key[0]:
+            strings.append(index)
+        else:
+            numbers[index] = key[1]
+
+    ranks = array("L", [0]) * len(cells)
+    rank = 0
+    for indices, values in (
+        (sorted(numbers, key=numbers.__getitem__), numbers),
+        (sorted(strings, key=cells.__getitem__), cells),
+    ):
+        previous = None
+        for index in indices:
+            if values[index] != previous:
+                rank += 1
+                previous = values[index]
+            ranks[index] = rank
+    return ranks
+
+
+def sort_permutation(keys: Sequence[array], reverse: Sequence[bool]) -> array:
+    """Compute the permutation that sorts the rows by several columns
+
+    The rows are sorted once per column, from the last column to the first one,
+    the stability of the sort keeps the order of the previous columns.
+
+    :param keys: The sort keys of each column, the first column has the highest priority
+    :type keys: Sequence[array]
+    :param reverse: Sort each column in descending order
+    :type reverse: Sequence[bool]
+
+    :return: The index of the rows in sorted order
+    :rtype: array
+    """
+    order = list(range(len(keys[0]))) if keys else []
+    for index in reversed(range(len(keys))):
+        order.sort(key=keys[index].__getitem__, reverse=reverse[index])
+    return array("L", order)
+
+
+def _is_before(first: List[Tuple], second: List[Tuple], reverse: Sequence[bool]) -> bool:
+    """Check if a row is sorted strictly before another one, from their rank keys"""
+    for key, other, descending in zip(first, second, reverse):
+        if key != other:
+            return key > other if descending else key < other
+    return False
+
+
+def merge_permutation(
+    order: array,
+    row_keys: Callable[[int], List[Tuple]],
+    indices: Sequence[int],
+    reverse: Sequence[bool],
+) -> array:
+    """Merge new rows into the permutation that sorts the existing rows
+
+    The new rows are sorted among themselves, then each one is placed by a binary
+    search in the permutation, after the existing rows it is equal to. The result
+    is the permutation sort_permutation would compute on every row, for the cost
+    of a binary search per new row and a single copy of the permutation.
+
+    :param order: The index of the existing rows in sorted order
+    :type order: array
+    :param row_keys: The function getting the rank keys of the sort columns of a
+        row from its index, see rank_key
+    :type row_keys: Callable[[int], List[Tuple]]
+    :param indices: The indices of the new rows, all after the existing rows
+    :type indices: Sequence[int]
+    :param reverse: Sort each column in descending order
+    :type reverse: Sequence[bool]
+
+    :return: The index of every row in sorted order
+    :rtype: array
+    """
+    keys = [row_keys(index) for index in indices]
+    positions = list(range(len(keys)))
+    for column in reversed(range(len(reverse))):
+        cells = [key[column] for key in keys]
+        positions.sort(key=cells.__getitem__, reverse=reverse[column])
+
+    merged = array("L")
+    start = 0
+    for position in positions:
+        low, high = start, len(order)
+        while low < high:
+            middle = (low + high) // 2
+            if _is_before(keys[position], row_keys(order[middle]), reverse):
+                high = middle
+            else:
+                low = middle + 1
+        merged.extend(order[start:low])
+        merged.append(indices[position])
+        start = low
+    merged.extend(order[start:])
+    return merged
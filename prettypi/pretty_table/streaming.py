@@ -0,0 +1,220 @@
+""" StreamingTable class for rendering tables from unbounded iterables. """
+
+from itertools import chain, islice
+from typing import Iterable, Iterator, List, TextIO
+from prettypi.pretty_table.output import LinesOutput
+from prettypi.pretty_table.table_config import TableConfig
+from prettypi.pretty_table.utils import JsonRow, JsonRowsManager, RowLayout
+from prettypi.utils.display_width import display_width, ellipsize, is_plain
+
+OVERFLOW_MODES = ("truncate", "overflow")
+
+
+class StreamingTable(LinesOutput):
+    """StreamingTable class for rendering a table in a single pass.
+
+    The rows are read from any iterable (a generator, a file, a live feed...) and
+    rendered as soon as they arrive, so the memory stays flat whatever the number
+    of rows. The column widths are either declared or estimated from the first rows.
+
+    **Features:**
+
+    - Declare the column widths with the widths parameter.
+    - Or let the table estimate them from the first sample_size rows.
+    - Truncate the cells that are too long, or let them overflow.
+
+    In "truncate" mode, a row with more cells than the columns raises a ValueError
+    when it is rendered, the extra cells are never dropped silently. The row is
+    checked before any of its lines is written, the lines of the previous rows are
+    already out and the table is left without its bottom border.
+
+    :param data: The rows to display in the table
+    :type data: Iterable[List[str]]
+    :param headers: The headers of the table, defaults to None
+    :type headers: List[str], optional
+    :param config: The configuration of the table, defaults to TableConfig()
+    :type config: TableConfig, optional
+    :param widths: The width of each column, defaults to None (sampled)
+    :type widths: List[int], optional
+    :param sample_size: The number of rows used to estimate the widths, defaults to 100
+    :type sample_size: int, optional
+    :param overflow: What to do with the cells wider than their column,
+        "truncate" or "overflow", defaults to "truncate"
+    :type overflow: str, optional
+
+    :raises ValueError: If the overflow mode or the sample size is invalid
+
+    **Example:**
+
+    .. code-block:: python
+
+            from prettypi.pretty_table.streaming import StreamingTable
+
+            rows = ([str(i), "event"] for i in range(3))
+            for line in StreamingTable(rows, ["Id", "Name"], widths=[4, 8]):
+                print(line)
+
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        data: Iterable[List[str]],
+        headers: List[str] = None,
+        config: TableConfig = TableConfig(),
+        widths: List[int] = None,
+        sample_size: int = 100,
+        overflow: str = "truncate",
+    ) -> None:
+        if overflow not in OVERFLOW_MODES:
+            raise ValueError(f"Invalid overflow: {overflow}")
+        if widths is None and sample_size < 1:
+            raise ValueError(f"Invalid sample size: {sample_size}")
+        self.data = data
+        self.headers = headers
+        self.config = config
+        self.widths = widths
+        self.sample_size = sample_size
+        self.overflow = overflow
+
+    def _compute_widths(self, sample):
+        """Compute the widths of the columns from the headers and the sample"""
+        if self.widths is not None:
+            return list(self.widths)
+        widths = []
+        for row in chain([self.headers or []], sample):
+            for i, item in enumerate(row):
+                if i == len(widths):
+                    widths.append(display_width(item))
+                else:
+                    widths[i] = max(widths[i], display_width(item))
+        return widths
+
+    def _fit(self, row, widths):
+        """Fit the cells of a row to the widths of the columns, in "overflow" mode
+        the widths are extended with empty columns for the extra cells
+
+        :return: The fitted cells
+        :rtype: List[str]
+
+        :raises ValueError: If the row has more cells than the columns, in
+            "truncate" mode
+        """
+        if self.overflow == "overflow":
+            widths.extend([0] * (len(row) - len(widths)))
+            return row
+        if len(row) > len(widths):
+            raise ValueError(
+                f"Invalid row: {len(row)} cells for {len(widths)} columns, "
+                'use overflow="overflow" to render the extra cells'
+            )
+        return [ellipsize(item, width) for item, width in zip(row, widths)]
+
+    def _init_layout(self, widths):
+        """Render the header rows and build the layout of the data rows
+
+        :return: The header lines and the layout of the data rows
+        :rtype: Tuple[List[str], RowLayout]
+        """
+        config = self.config
+        header = self._fit(self.headers, list(widths)) if self.headers else None
+        header_manager = JsonRowsManager()
+        header_manager.init(header, [], config)
+        border_header = header_manager.border_header or config.border_header
+
+        border_data = config.border_data
+        separator = None
+        if config.row_separator:
+            separator = JsonRow.create_separator(border_data, config.row_separator)
+            border_data = border_data.stripped()
+        bottom = None
+        if config.border_data.bottom:
+            bottom = JsonRow.create_separator(
+                config.border_header, config.border_data.bottom
+            )
+            header_manager.strip_header_border()
+            border_header = border_header.stripped()
+
+        borders = [border_data]
+        if header or bottom:
+            borders.append(border_header)
+        before = max(len(border.left) for border in borders)
+        after = max(len(border.right) for border in borders)
+
+        max_len_computed = JsonRow.create_data(
+            [""] * len(widths), border_data, config.column_separator
+        ).len_row_data(before, after, widths)
+        layout = RowLayout(
+            border_data.left.ljust(before),
+            border_data.right.ljust(after),
+            config.column_separator,
+            list(widths),
+            separator.render_row_separator(max_len_computed) if separator else None,
+            bottom.render_row_separator(max_len_computed) if bottom else None,
+        )
+        header_lines = [
+            (
+                row.render_row_separator(max_len_computed)
+                if row.row_type == "separator"
+                else row.render_row_data(before, after, widths)
+            )
+            for row in header_manager.json_rows
+        ]
+        return header_lines, layout
+
+    def iter_lines(self) -> Iterator[str]:
+        """Render the table one line at a time.
+
+        The rows are rendered through the compiled layout, the rows holding
+        non-ASCII or styled cells are padded by the display width of their cells.
+
+        :return: A generator of the lines of the table
+        :rtype: Iterator[str]
+
+        :raises ValueError: If a row has more cells than the columns, in
+            "truncate" mode
+        """
+        rows = iter(self.data)
+        sample = [] if self.widths is not None else list(islice(rows, self.sample_size))
+        widths = self._compute_widths(sample)
+        header_lines, layout = self._init_layout(widths)
+        yield from header_lines
+
+        # The widths list is shared, so the columns added in "overflow" mode are
+        # added to both layouts
+        wide_layout = RowLayout(
+            layout.left,
+            layout.right,
+            layout.separator,
+            layout.widths,
+            wide=tuple(range(len(widths))),
+        )
+        first = True
+        for row in chain(sample, rows):
+            cells = self._fit(row, layout.widths)
+            if not first and layout.row_separator is not None:
+                yield layout.row_separator
+            first = False
+            if all(map(is_plain, cells)):
+                yield layout.render_row(cells)
+            else:
+                yield wide_layout.render_row(cells)
+
+        if first:
+            return
+        if layout.bottom_separator is not None:
+            yield layout.bottom_separator
+        elif layout.row_separator is not None:
+            yield layout.row_separator
+
+    def write(self, fp: TextIO) -> None:
+        """Write the table to a text file object as the rows arrive.
+
+        :param fp: The file object to write to
+        :type fp: TextIO
+        """
+        for line in self.iter_lines():
+            fp.write(line)
+            fp.write("\n")
+
+    def __iter__(self) -> Iterator[str]:
+        return self.iter_lines()
@@ -1,26 +1,68 @@
 """ PrettyTable class for creating styled tables."""
 
-from typing import List
+from collections import OrderedDict
+from typing import Callable, Iterable, Iterator, List, TextIO, Tuple, Union
 from prettypi.pretty_table import TableConfig
+from prettypi.pretty_table.array_store import ArrayStore
+from prettypi.pretty_table.csv_store import CsvStore
+from prettypi.pretty_table.export import export_fixed_width
+from prettypi.pretty_table.live import LiveTable
+from prettypi.pretty_table.output import LinesOutput
+from prettypi.pretty_table.parallel import check_workers
+from prettypi.pretty_table.preview import PreviewTable
+from prettypi.pretty_table.streaming import StreamingTable
+from prettypi.pretty_table.tail import TailTable
 from prettypi.pretty_table.utils import JsonRowsManager
+from prettypi.pretty_table.view import TableView
 
+RENDER_CACHE_SIZE = 8
 
-class PrettyTable:
+
+class PrettyTable(LinesOutput):  # pylint: disable=too-many-public-methods
     """PrettyTable class for creating styled tables.
 
     **Features:**
 
     - Use the PrettyTable class with data and headers to create a styled table.
     - Print the table with the __str__ method.
-    - Use the TableConfig class to customize the table.
+    - Stream the table line by line with the iter_lines and write methods.
+    - Write the table by blocks to text or binary files with the dump method.
+    - Write the table to asyncio streams without blocking with the awrite method.
+    - Render unbounded iterables with the PrettyTable.stream() method.
+    - Redraw live tables in place, cell by cell, with the PrettyTable.live() method.
+    - Keep the last rows of a high-rate stream with the PrettyTable.tail() method.
+    - Preview the first, last or top rows of huge iterables with the
+      PrettyTable.preview() method.
+    - Render large CSV or TSV files with the PrettyTable.from_csv() method, the
+      file is released by the close method or at the end of a with block.
+    - Render NumPy arrays, pandas DataFrames and Arrow tables without converting
+      them to lists with the from_numpy, from_dataframe and from_arrow methods.
+    - Add rows incrementally with the append_rows method.
+    - Render one page of the table with the page and iter_pages methods.
+    - Sort the rows by one or several columns with the sort_by method.
+    - Filter the rows and select the columns with the where and select methods.
+    - Split wide tables into blocks of columns with frozen key columns with the
+      blocks method.
+    - Render the rows of very large tables in parallel with the workers parameter.
+    - Export the table to a fixed-width file in parallel with the export method.
+    - Use the TableConfig class to customize the table, the rendered table is
+      cached for the last few configurations until the data changes.
     - Use the PrettyTable.builder() method to create a TableConfig object.
 
     :param data: The data to display in the table
-    :type data: List[List[str]]
+    :type data: Union[List[List[str]], ArrayStore, CsvStore]
     :param headers: The headers of the table
     :type headers: List[str]
     :param config: The configuration of the table, defaults to TableConfig()
     :type config: TableConfig, optional
+    :param workers: The number of workers rendering the data rows in parallel,
+        defaults to None (serial rendering)
+    :type workers: int, optional
+    :param executor: The pool of workers, "process" or "thread" (for free-threaded
+        builds of Python), defaults to "process"
+    :type executor: str, optional
+
+    :raises ValueError: If the workers or the executor are invalid
 
     **Example:**
 
@@ -42,27 +84,743 @@ class PrettyTable:
 
     """
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
         self,
-        data: List[List[str]],
+        data: Union[List[List[str]], ArrayStore, CsvStore],
         headers: List[str] = None,
         config: TableConfig = TableConfig(),
+        workers: int = None,
+        executor: str = "process",
     ) -> None:
         self.headers = headers
-        self.data = data
         self.config = config
-        self.json_rows_manager = JsonRowsManager()
-        self.json_rows_manager.init(self.headers, self.data, self.config)
-        self.json_rows_manager.process()
+        self.json_rows_manager = JsonRowsManager(workers, executor)
+        self.json_rows_manager.init(self.headers, data, self.config)
+        self._data = data
+        self._appended = False
+        self._render_cache = OrderedDict()
+        self._render_version = 0
+
+    @property
+    def data(self) -> Union[List[List[str]], ArrayStore, CsvStore]:
+        """Get the data of the table
+
+        Once rows are appended, the rows are only kept in the store of the table:
+        every row is read back from it, as strings.
+
+        :return: The data given to the table, or its rows once rows are appended
+        :rtype: Union[List[List[str]], ArrayStore, CsvStore]
+        """
+        if not self._appended:
+            return self._data
+        manager = self.json_rows_manager
+        return list(manager.rows(range(len(manager.store))))
 
     def set_config(self, config: TableConfig):
-        """Set the configuration of the table and reprocess the table."""
+        """Set the configuration of the table.
+
+        The table is reprocessed lazily, the next time it is rendered. The
+        rendered tables of the last RENDER_CACHE_SIZE configurations are cached,
+        so switching back to a recently rendered configuration costs nothing
+        until the data changes, and the memory stays bounded.
+
+        **Example:**
+
+        .. code-block:: python
+
+                from prettypi.pretty_table import TableConfig
+                from prettypi.pretty_table.table import PrettyTable
+
+                light = TableConfig()
+                heavy = TableConfig.builder().set_border(top="═", bottom="═").build()
+                pt = PrettyTable([["1", "2"]], ["A", "B"], light)
+                for config in [heavy, light, heavy]:
+                    pt.set_config(config)
+                    print(pt)
+
+        """
         self.config = config
         self.json_rows_manager.set_config(config)
-        self.json_rows_manager.process()
+
+    def append_rows(self, rows: Iterable[List[str]]) -> None:
+        """Append rows to the table without reprocessing the existing rows.
+
+        Only the new cells are measured and the widths of the columns are updated
+        incrementally, the existing rows are padded again at render time.
+
+        :param rows: The rows to append
+        :type rows: Iterable[List[str]]
+
+        **Example:**
+
+        .. code-block:: python
+
+                from prettypi.pretty_table.table import PrettyTable
+
+                pt = PrettyTable([["1", "2"]], ["A", "B"])
+                pt.append_rows([["3", "4"], ["5", "6"]])
+                print(pt)
+
+        """
+        self.json_rows_manager.append_rows(rows)
+        self._appended = True
+
+    def iter_lines(self) -> Iterator[str]:
+        """Render the table one line at a time.
+
+        The column widths are computed once, then the header, the separators and
+        the data rows are rendered lazily, so only one line is held in memory.
+
+        :return: A generator of the lines of the table
+        :rtype: Iterator[str]
+
+        **Example:**
+
+        .. code-block:: python
+
+                from prettypi.pretty_table.table import PrettyTable
+
+                pt = PrettyTable([["1", "2"], ["3", "4"]], ["A", "B"])
+                for line in pt.iter_lines():
+                    print(line)
+
+        """
+        return self.json_rows_manager.iter_lines()
+
+    def sort_by(
+        self,
+        columns: Union[int, str, List[Union[int, str]]],
+        reverse: Union[bool, List[bool]] = False,
+    ) -> None:
+        """Sort the rows of the table by one or several columns.
+
+        The rows are not copied nor reordered: a permutation index is computed
+        and the table is rendered through it. Numbers are sorted by value, before
+        the other cells. The sort keys of each column are cached, so sorting again
+        by another column does not recompute them.
+
+        :param columns: The position or the header of the columns to sort by,
+            by priority
+        :type columns: Union[int, str, List[Union[int, str]]]
+        :param reverse: Sort in descending order, for all the columns or for each
+            column, defaults to False
+        :type reverse: Union[bool, List[bool]], optional
+
+        :raises ValueError: If no column is given, a header does not exist or the
+            number of reverse flags does not match the columns
+        :raises IndexError: If a column position does not exist
+
+        **Example:**
+
+        .. code-block:: python
+
+                from prettypi.pretty_table.table import PrettyTable
+
+                pt = PrettyTable([["b", "10"], ["a", "9"], ["a", "11"]], ["Name", "Size"])
+                pt.sort_by(["Name", "Size"], reverse=[False, True])
+                print(pt)
+
+        """
+        if not isinstance(columns, list):
+            columns = [columns]
+        if not columns:
+            raise ValueError("Invalid columns: at least one column is required")
+        if not isinstance(reverse, list):
+            reverse = [reverse] * len(columns)
+        if len(reverse) != len(columns):
+            raise ValueError(f"Invalid reverse: {reverse}")
+        manager = self.json_rows_manager
+        manager.sort([manager.column_index(column) for column in columns], reverse)
+
+    def _view(self) -> TableView:
+        """Create a view of the whole table, in display order"""
+        manager = self.json_rows_manager
+        return TableView(
+            manager, manager.row_order(), list(range(manager.nb_columns()))
+        )
+
+    def where(self, predicate: Callable[[List[str]], bool]) -> TableView:
+        """Create a view with only the rows matching a predicate.
+
+        The view keeps an index of the matching rows, the data is not copied.
+        Check the TableView class for more information.
+
+        :param predicate: A function called with the cells of each row
+        :type predicate: Callable[[List[str]], bool]
+
+        :return: The view of the matching rows
+        :rtype: TableView
+
+        **Example:**
+
+        .. code-block:: python
+
+                from prettypi.pretty_table.table import PrettyTable
+
+                pt = PrettyTable([["1", "a"], ["2", "b"]], ["Id", "Name"])
+                print(pt.where(lambda row: int(row[0]) > 1))
+
+        """
+        return self._view().where(predicate)
+
+    def select(self, columns: List[Union[int, str]]) -> TableView:
+        """Create a view with only some columns.
+
+        The view keeps the positions of the selected columns, the data is not copied.
+        Check the TableView class for more information.
+
+        :param columns: The position or the header of the columns
+        :type columns: List[Union[int, str]]
+
+        :return: The view of the selected columns
+        :rtype: TableView
+
+        :raises ValueError: If a header does not exist
+        :raises IndexError: If a position does not exist
+
+        **Example:**
+
+        .. code-block:: python
+
+                from prettypi.pretty_table.table import PrettyTable
+
+                pt = PrettyTable([["1", "a"], ["2", "b"]], ["Id", "Name"])
+                print(pt.select(["Name"]))
+
+        """
+        return self._view().select(columns)
+
+    def blocks(
+        self, max_width: int = None, keys: List[Union[int, str]] = None
+    ) -> List[TableView]:
+        """Split the columns of a wide table into blocks fitting a width.
+
+        Each block is a view with the key columns followed by as many consecutive
+        columns as fit in max_width. Only the cells of the columns of a block are
+        formatted when it is rendered. Check the TableView.blocks method for more
+        information.
+
+        :param max_width: The maximum width of the rendered rows, defaults to None
+            (the width of the terminal)
+        :type max_width: int, optional
+        :param keys: The headers or the positions of the columns repeated in every
+            block, defaults to None (no key column)
+        :type keys: List[Union[int, str]], optional
+
+        :return: The views of the blocks, at least one
+        :rtype: List[TableView]
+
+        :raises ValueError: If a header does not exist
+        :raises IndexError: If a position does not exist
+
+        **Example:**
+
+        .. code-block:: python
+
+                from prettypi.pretty_table.table import PrettyTable
+
+                headers = ["Host"] + [f"Disk {i}" for i in range(6)]
+                pt = PrettyTable([["web-1"] + ["42%"] * 6, ["web-2"] + ["7%"] * 6], headers)
+                for block in pt.blocks(max_width=30, keys=["Host"]):
+                    print(block)
+
+        """
+        return self._view().blocks(max_width, keys)
+
+    def page_count(self, size: int) -> int:
+        """Get the number of pages of the table.
+
+        :param size: The number of data rows per page
+        :type size: int
+
+        :return: The number of pages, at least 1
+        :rtype: int
+
+        :raises ValueError: If the size is invalid
+        """
+        if size < 1:
+            raise ValueError(f"Invalid page size: {size}")
+        return max(-(-len(self.json_rows_manager.store) // size), 1)
+
+    def page(self, number: int, size: int) -> str:
+        """Render one page of the table.
+
+        The widths of the columns are computed once for the whole table, so every
+        page is aligned the same way and only the rows of the page are formatted.
+        Each page has the header and the borders of the table.
+
+        :param number: The number of the page, starting at 0
+        :type number: int
+        :param size: The number of data rows per page
+        :type size: int
+
+        :return: The rendered page
+        :rtype: str
+
+        :raises ValueError: If the size is invalid
+        :raises IndexError: If the page does not exist
+
+        **Example:**
+
+        .. code-block:: python
+
+                from prettypi.pretty_table.table import PrettyTable
+
+                pt = PrettyTable([[str(i)] for i in range(10)], ["Id"])
+                print(pt.page(1, 3))
+
+        """
+        if not 0 <= number < self.page_count(size):
+            raise IndexError(f"Invalid page number: {number}")
+        start = number * size
+        rows = self.json_rows_manager.row_order()[start:start + size]
+        return "\n".join(self.json_rows_manager.iter_lines(rows))
+
+    def iter_pages(self, size: int) -> Iterator[str]:
+        """Render the table page by page.
+
+        :param size: The number of data rows per page
+        :type size: int
+
+        :return: A generator of the rendered pages
+        :rtype: Iterator[str]
+
+        :raises ValueError: If the size is invalid
+        """
+        for number in range(self.page_count(size)):
+            yield self.page(number, size)
+
+    def export(
+        self,
+        path: str,
+        encoding: str = "utf-8",
+        workers: int = None,
+        executor: str = None,
+    ) -> None:
+        """Export the table to a fixed-width file.
+
+        When every cell is ASCII text and every row has the same number of cells,
+        the offset of each row in the file is known in advance: the file is sized
+        once, and the workers read their own blocks of rows from the store, render
+        them and write them at the computed offsets. Otherwise, or without workers,
+        the table is written sequentially.
+
+        :param path: The path of the output file
+        :type path: str
+        :param encoding: The encoding of the output, defaults to "utf-8"
+        :type encoding: str, optional
+        :param workers: The number of workers, defaults to None (the workers of the table)
+        :type workers: int, optional
+        :param executor: The pool of workers, "process" or "thread", defaults to None
+            (the executor of the table)
+        :type executor: str, optional
+
+        :raises ValueError: If the workers or the executor are invalid
+
+        **Example:**
+
+        .. code-block:: python
+
+                import os
+                import tempfile
+                from prettypi.pretty_table.table import PrettyTable
+
+                pt = PrettyTable([[str(i), "row"] for i in range(100)], ["Id", "Name"])
+                path = os.path.join(tempfile.mkdtemp(), "table.txt")
+                pt.export(path, workers=2, executor="thread")
+
+        """
+        manager = self.json_rows_manager
+        if workers is None:
+            workers = manager.workers
+        if executor is None:
+            executor = manager.executor
+        check_workers(workers, executor)
+        export_fixed_width(manager, path, encoding, workers, executor)
+
+    def write(self, fp: TextIO) -> None:
+        """Write the table to a text file object, one line at a time.
+
+        Each line is terminated by a newline, like print(table) would do.
+
+        :param fp: The file object to write to
+        :type fp: TextIO
+
+        **Example:**
+
+        .. code-block:: python
+
+                import sys
+                from prettypi.pretty_table.table import PrettyTable
+
+                pt = PrettyTable([["1", "2"], ["3", "4"]], ["A", "B"])
+                pt.write(sys.stdout)
+
+        """
+        for line in self.iter_lines():
+            fp.write(line)
+            fp.write("\n")
+
+    @classmethod
+    def from_csv(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        cls,
+        path: str,
+        headers: List[str] = None,
+        config: TableConfig = TableConfig(),
+        delimiter: str = ",",
+        has_header: bool = True,
+        encoding: str = "utf-8",
+    ) -> "PrettyTable":
+        """Create a table from a CSV or TSV file, without loading the rows in memory.
+
+        The file is memory-mapped: a first pass measures the widths of the columns
+        and indexes the byte offset of each row, then the rows are parsed again one
+        by one when the table is rendered. Check the CsvStore class for more information.
+
+        The file stays mapped until the table is closed, use the table in a with
+        block or call its close method.
+
+        :param path: The path of the file
+        :type path: str
+        :param headers: The headers of the table, defaults to None (the first
+            record of the file if has_header is True)
+        :type headers: List[str], optional
+        :param config: The configuration of the table, defaults to TableConfig()
+        :type config: TableConfig, optional
+        :param delimiter: The delimiter of the cells, "\\t" for TSV files, defaults to ","
+        :type delimiter: str, optional
+        :param has_header: The first record of the file is the header, defaults to True
+        :type has_header: bool, optional
+        :param encoding: The encoding of the file, ASCII compatible, defaults to "utf-8"
+        :type encoding: str, optional
+
+        :return: The table
+        :rtype: PrettyTable
+
+        :raises OSError: If the file cannot be opened
+
+        **Example:**
+
+        .. code-block:: python
+
+                import tempfile
+                from prettypi.pretty_table.table import PrettyTable
+
+                with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False) as file:
+                    file.write("Id,Name\\n1,apple\\n2,banana\\n")
+                with PrettyTable.from_csv(file.name) as pt:
+                    print(pt)
+
+        """
+        store = CsvStore(path, delimiter, has_header, encoding)
+        if headers is None:
+            headers = store.header
+        return cls(store, headers, config)
+
+    @classmethod
+    def from_numpy(
+        cls, array, headers: List[str] = None, config: TableConfig = TableConfig()
+    ) -> "PrettyTable":
+        """Create a table from a two-dimensional NumPy array, without copying it.
+
+        The widths of the columns are computed in bulk and only the rendered cells
+        are converted to strings. Requires NumPy.
+
+        :param array: The array, one row per line
+        :type array: numpy.ndarray
+        :param headers: The headers of the table, defaults to None
+        :type headers: List[str], optional
+        :param config: The configuration of the table, defaults to TableConfig()
+        :type config: TableConfig, optional
+
+        :return: The table
+        :rtype: PrettyTable
+
+        :raises ImportError: If NumPy is not installed
+        :raises ValueError: If the array has more than two dimensions
+
+        **Example:**
+
+        .. code-block:: python
+
+                import numpy as np
+                from prettypi.pretty_table.table import PrettyTable
+
+                print(PrettyTable.from_numpy(np.arange(6).reshape(3, 2), ["A", "B"]))
+
+        """
+        return cls(ArrayStore.from_numpy(array), headers, config)
+
+    @classmethod
+    def from_dataframe(
+        cls, dataframe, config: TableConfig = TableConfig()
+    ) -> "PrettyTable":
+        """Create a table from a pandas DataFrame, the headers are the column names.
+
+        The columns are read as NumPy arrays, the widths of the columns are computed
+        in bulk and only the rendered cells are converted to strings. Requires NumPy.
+
+        :param dataframe: The DataFrame
+        :type dataframe: pandas.DataFrame
+        :param config: The configuration of the table, defaults to TableConfig()
+        :type config: TableConfig, optional
+
+        :return: The table
+        :rtype: PrettyTable
+
+        :raises ImportError: If NumPy is not installed
+
+        **Example:**
+
+        .. code-block:: python
+
+                import pandas as pd
+                from prettypi.pretty_table.table import PrettyTable
+
+                df = pd.DataFrame({"Id": [1, 2], "Name": ["apple", "banana"]})
+                print(PrettyTable.from_dataframe(df))
+
+        """
+        store = ArrayStore.from_dataframe(dataframe)
+        return cls(store, store.header, config)
+
+    @classmethod
+    def from_arrow(cls, table, config: TableConfig = TableConfig()) -> "PrettyTable":
+        """Create a table from a PyArrow Table, the headers are the column names.
+
+        The columns are read from the Arrow buffers, the cells are cast to strings
+        chunk by chunk and null cells are empty. Requires PyArrow.
+
+        :param table: The Table
+        :type table: pyarrow.Table
+        :param config: The configuration of the table, defaults to TableConfig()
+        :type config: TableConfig, optional
+
+        :return: The table
+        :rtype: PrettyTable
+
+        :raises ImportError: If PyArrow is not installed
+
+        **Example:**
+
+        .. code-block:: python
+
+                import pyarrow as pa
+                from prettypi.pretty_table.table import PrettyTable
+
+                table = pa.table({"Id": [1, 2], "Name": ["apple", None]})
+                print(PrettyTable.from_arrow(table))
+
+        """
+        store = ArrayStore.from_arrow(table)
+        return cls(store, store.header, config)
+
+    @staticmethod
+    def stream(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        data: Iterable[List[str]],
+        headers: List[str] = None,
+        config: TableConfig = TableConfig(),
+        widths: List[int] = None,
+        sample_size: int = 100,
+        overflow: str = "truncate",
+    ) -> StreamingTable:
+        """Create a table rendered in a single pass over any iterable of rows.
+
+        The widths of the columns are either declared with widths, or estimated
+        from the first sample_size rows. Check the StreamingTable class for more information.
+
+        :param data: The rows to display in the table
+        :type data: Iterable[List[str]]
+        :param headers: The headers of the table, defaults to None
+        :type headers: List[str], optional
+        :param config: The configuration of the table, defaults to TableConfig()
+        :type config: TableConfig, optional
+        :param widths: The width of each column, defaults to None (sampled)
+        :type widths: List[int], optional
+        :param sample_size: The number of rows used to estimate the widths, defaults to 100
+        :type sample_size: int, optional
+        :param overflow: "truncate" or "overflow" the cells wider than their column,
+            defaults to "truncate"
+        :type overflow: str, optional
+
+        :return: The StreamingTable object
+        :rtype: StreamingTable
+
+        **Example:**
+
+        .. code-block:: python
+
+                import sys
+                from prettypi.pretty_table.table import PrettyTable
+
+                rows = ([str(i), "event"] for i in range(3))
+                PrettyTable.stream(rows, ["Id", "Name"], sample_size=10).write(sys.stdout)
+
+        """
+        return StreamingTable(data, headers, config, widths, sample_size, overflow)
+
+    @staticmethod
+    def live(
+        headers: List[str] = None,
+        config: TableConfig = TableConfig(),
+        fp: TextIO = None,
+    ) -> LiveTable:
+        """Create a table redrawn in place in a terminal, for live dashboards.
+
+        Each update only rewrites the cells that changed since the last one, the
+        whole table is drawn again when the widths of the columns change. Check
+        the LiveTable class for more information.
+
+        :param headers: The headers of the table, defaults to None
+        :type headers: List[str], optional
+        :param config: The configuration of the table, defaults to TableConfig()
+        :type config: TableConfig, optional
+        :param fp: The terminal to write to, defaults to None (sys.stdout)
+        :type fp: TextIO, optional
+
+        :return: The LiveTable object
+        :rtype: LiveTable
+
+        **Example:**
+
+        .. code-block:: python
+
+                from prettypi.pretty_table.table import PrettyTable
+
+                live = PrettyTable.live(["Host", "Load"])
+                for load in ["0.42", "0.51"]:
+                    live.update([["web-1", load]])
+
+        """
+        return LiveTable(headers, config, fp)
+
+    @staticmethod
+    def tail(
+        capacity: int, headers: List[str] = None, config: TableConfig = TableConfig()
+    ) -> TailTable:
+        """Create a table keeping only the last rows appended, in a ring buffer.
+
+        Appending a row costs O(columns) and the widths of the columns shrink when
+        the widest cells are dropped. Check the TailTable class for more information.
+
+        :param capacity: The maximum number of rows kept
+        :type capacity: int
+        :param headers: The headers of the table, defaults to None
+        :type headers: List[str], optional
+        :param config: The configuration of the table, defaults to TableConfig()
+        :type config: TableConfig, optional
+
+        :return: The TailTable object
+        :rtype: TailTable
+
+        :raises ValueError: If the capacity is invalid
+
+        **Example:**
+
+        .. code-block:: python
+
+                from prettypi.pretty_table.table import PrettyTable
+
+                tail = PrettyTable.tail(2, ["Id"])
+                tail.extend([str(i)] for i in range(5))
+                print(tail)
+
+        """
+        return TailTable(capacity, headers, config)
+
+    @staticmethod
+    def preview(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        data: Iterable[List[str]],
+        headers: List[str] = None,
+        config: TableConfig = TableConfig(),
+        head: int = 20,
+        tail: int = 20,
+        top_n: Tuple[Union[int, str], int] = None,
+    ) -> PreviewTable:
+        """Preview the first and last rows, or the top rows, of a huge iterable of rows.
+
+        The rows are read once and only the previewed rows are kept, in a bounded
+        deque or a heap. The widths of the columns are computed over the kept rows
+        and a "… N rows …" row stands for the others. Check the PreviewTable class
+        for more information.
+
+        :param data: The rows to preview, read once
+        :type data: Iterable[List[str]]
+        :param headers: The headers of the table, defaults to None
+        :type headers: List[str], optional
+        :param config: The configuration of the table, defaults to TableConfig()
+        :type config: TableConfig, optional
+        :param head: The number of first rows to keep, defaults to 20
+        :type head: int, optional
+        :param tail: The number of last rows to keep, defaults to 20
+        :type tail: int, optional
+        :param top_n: The header or the position of a column and the number of rows
+            with its highest values to keep, instead of the head and the tail,
+            defaults to None
+        :type top_n: Tuple[Union[int, str], int], optional
+
+        :return: The PreviewTable object
+        :rtype: PreviewTable
+
+        :raises ValueError: If head, tail or n is negative, or the header does not exist
+        :raises IndexError: If the position of the column is negative
+
+        **Example:**
+
+        .. code-block:: python
+
+                from prettypi.pretty_table.table import PrettyTable
+
+                rows = ([str(i), f"user{i % 7}"] for i in range(1000000))
+                print(PrettyTable.preview(rows, ["Id", "User"], head=3, tail=3))
+
+        """
+        return PreviewTable(data, headers, config, head, tail, top_n)
+
+    def close(self) -> None:
+        """Release the file of a table read with from_csv, the other tables hold
+        no file.
+
+        **Example:**
+
+        .. code-block:: python
+
+                import tempfile
+                from prettypi.pretty_table.table import PrettyTable
+
+                with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False) as file:
+                    file.write("Id,Name\\n1,apple\\n")
+                pt = PrettyTable.from_csv(file.name)
+                print(pt)
+                pt.close()
+
+        """
+        if isinstance(self._data, CsvStore):
+            self._data.close()
+
+    def __enter__(self) -> "PrettyTable":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def __str__(self) -> str:
-        return str(self.json_rows_manager)
+        # The rendered table is cached for the last few configurations, until
+        # the data changes
+        manager = self.json_rows_manager
+        if manager.version != self._render_version:
+            self._render_cache.clear()
+            self._render_version = manager.version
+        key = (self.config, manager.version)
+        text = self._render_cache.get(key)
+        if text is None:
+            text = str(manager)
+            self._render_cache[key] = text
+            if len(self._render_cache) > RENDER_CACHE_SIZE:
+                self._render_cache.popitem(last=False)
+        else:
+            self._render_cache.move_to_end(key)
+        return text
 
 
 # c = TableConfig.builder()\
@@ -1,35 +1,87 @@
 """ This module contains the TableConfig class and TableConfigBuilder class. """
 
-from dataclasses import dataclass
+import shutil
+from dataclasses import dataclass, replace
+from typing import Tuple
 
+OVERFLOW_MODES = ("wrap", "truncate")
 
-@dataclass
+
+@dataclass(frozen=True)
 class Border:
-    """Class to represent the borders of the table."""
+    """Class to represent the borders of the table.
+
+    A Border is immutable and hashable, so it can be shared between tables.
+    """
 
     top: str = ""
     bottom: str = ""
     left: str = ""
     right: str = ""
 
+    def stripped(self) -> "Border":
+        """Get the border used by the separator rows, without the inner spaces
+
+        :return: The border with the left border right-stripped and the right
+            border left-stripped
+        :rtype: Border
+        """
+        return replace(self, left=self.left.rstrip(), right=self.right.lstrip())
+
+
+@dataclass(frozen=True)
+class ColumnWidth:
+    """Class to represent the width constraints of a column.
+
+    The column is as wide as its longest cell, within min_width and max_width.
+    When the table is wider than its max_width, the flexible columns shrink, the
+    widest first, in proportion to their flex. A column with a flex of 0 never
+    shrinks.
+    """
+
+    min_width: int = 0
+    max_width: int = None
+    flex: int = 1
+
 
-class TableConfig:
+@dataclass(frozen=True, init=False)
+class TableConfig:  # pylint: disable=too-many-instance-attributes
     """Class to represent the configuration of the table.
 
     With builder method, you can create a TableConfig object with the desired configuration.
     Check the TableConfigBuilder class for more information.
 
+    A TableConfig is immutable and hashable: it can be shared between tables and
+    used as a cache key.
+
     """
 
+    border_header: Border
+    border_data: Border
+    column_separator: str
+    row_separator: str
+    alignment_default: str
+    alignments: Tuple[str, ...]
+    column_widths: Tuple[ColumnWidth, ...]
+    max_width: int
+    overflow: str
+
     def __init__(self, **kwargs) -> None:  # pylint: disable=too-many-arguments
-        self.border_header = kwargs.get(
-            "border_header", Border(top="", bottom="", left="", right="")
-        )
-        self.border_data = kwargs.get("border_data", Border(left="", right=""))
-        self.column_separator = kwargs.get("column_separator", " | ")
-        self.row_separator = kwargs.get("row_separator", "-")
-        self.alignment_default = kwargs.get("alignment", "left")
-        self.alignments = kwargs.get("alignments", [])
+        values = {
+            "border_header": kwargs.get(
+                "border_header", Border(top="", bottom="", left="", right="")
+            ),
+            "border_data": kwargs.get("border_data", Border(left="", right="")),
+            "column_separator": kwargs.get("column_separator", " | "),
+            "row_separator": kwargs.get("row_separator", "-"),
+            "alignment_default": kwargs.get("alignment", "left"),
+            "alignments": tuple(kwargs.get("alignments", ())),
+            "column_widths": tuple(kwargs.get("column_widths", ())),
+            "max_width": kwargs.get("max_width"),
+            "overflow": kwargs.get("overflow", "wrap"),
+        }
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
 
     def get_config(self):
         """Get the configuration of the table.
@@ -40,6 +92,14 @@ class TableConfig:
         """
         return vars(self)
 
+    def has_width_constraints(self) -> bool:
+        """Check if the widths of the columns are constrained
+
+        :return: True if a column has a width constraint or the table a max width
+        :rtype: bool
+        """
+        return self.max_width is not None or any(self.column_widths)
+
     @staticmethod
     def builder():
         """Create a TableConfigBuilder object to build a TableConfig object
@@ -48,7 +108,7 @@ class TableConfig:
         return TableConfigBuilder()
 
 
-class TableConfigBuilder:
+class TableConfigBuilder:  # pylint: disable=too-many-instance-attributes
     """ Class to build a TableConfig object with the desired configuration.
 
     **Example:**
@@ -72,6 +132,9 @@ class TableConfigBuilder:
         self.row_separator = "-"
         self.alignment_default = "left"
         self.alignments = []
+        self.column_widths = []
+        self.max_width = None
+        self.overflow = "wrap"
 
     def set_border(
         self, top="", bottom="", left="", right="", data_bottom=""
@@ -122,6 +185,77 @@ class TableConfigBuilder:
         self.row_separator = row_separator
         return self
 
+    def set_column_width(self, column, min_width=0, max_width=None, flex=1):
+        """Set the width constraints of a column.
+
+        The cells wider than the column are wrapped or truncated, see set_overflow.
+
+        :param column: The position of the column
+        :type column: int
+        :param min_width: The minimum width of the column, defaults to 0
+        :type min_width: int, optional
+        :param max_width: The maximum width of the column, defaults to None (no limit)
+        :type max_width: int, optional
+        :param flex: The share of the column when the table shrinks to its max
+            width, 0 to never shrink, defaults to 1
+        :type flex: int, optional
+
+        :return: The TableConfigBuilder object
+        :rtype: TableConfigBuilder
+
+        :raises ValueError: If the constraints are invalid
+        """
+        if column < 0:
+            raise ValueError(f"Invalid column: {column}")
+        if min_width < 0 or flex < 0:
+            raise ValueError(f"Invalid width constraints: {min_width}, {flex}")
+        if max_width is not None and max_width < max(min_width, 1):
+            raise ValueError(f"Invalid max width: {max_width}")
+        while len(self.column_widths) <= column:
+            self.column_widths.append(None)
+        self.column_widths[column] = ColumnWidth(min_width, max_width, flex)
+        return self
+
+    def set_max_width(self, max_width=None):
+        """Set the maximum width of the table.
+
+        The widths of the columns are solved once per table: the flexible columns
+        shrink until the table fits, and their long cells are fitted as set by
+        set_overflow.
+
+        :param max_width: The maximum width of the table, defaults to None (the
+            width of the terminal)
+        :type max_width: int, optional
+
+        :return: The TableConfigBuilder object
+        :rtype: TableConfigBuilder
+
+        :raises ValueError: If the max width is invalid
+        """
+        if max_width is None:
+            max_width = shutil.get_terminal_size().columns
+        if max_width < 1:
+            raise ValueError(f"Invalid max width: {max_width}")
+        self.max_width = max_width
+        return self
+
+    def set_overflow(self, overflow):
+        """Set how the cells wider than their column are fitted.
+
+        :param overflow: "wrap" to wrap the cells on several lines, "truncate" to
+            cut them with an ellipsis
+        :type overflow: str
+
+        :return: The TableConfigBuilder object
+        :rtype: TableConfigBuilder
+
+        :raises ValueError: If the overflow mode is invalid
+        """
+        if overflow not in OVERFLOW_MODES:
+            raise ValueError(f"Invalid overflow: {overflow}")
+        self.overflow = overflow
+        return self
+
     def build(self):
         """Build a TableConfig object with the desired configuration.
 
@@ -136,4 +270,7 @@ class TableConfigBuilder:
             row_separator=self.row_separator,
             alignment=self.alignment_default,
             alignments=self.alignments,
+            column_widths=self.column_widths,
+            max_width=self.max_width,
+            overflow=self.overflow,
         )
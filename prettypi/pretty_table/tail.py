@@ -0,0 +1,102 @@
+""" TailTable class for rendering the last rows of a high-rate stream. """
+
+from typing import Iterable, Iterator, List
+from prettypi.pretty_table.output import LinesOutput
+from prettypi.pretty_table.ring_store import RingStore
+from prettypi.pretty_table.table_config import TableConfig
+from prettypi.pretty_table.utils import JsonRowsManager
+
+
+class TailTable(LinesOutput):
+    """TailTable class for rendering the last rows of a stream, like tail -n.
+
+    The rows are kept in a ring buffer of a fixed capacity: appending a row costs
+    O(columns), whatever the capacity, and the oldest row is dropped once the
+    table is full. The widths of the columns follow the rows kept, they shrink
+    when the widest cells are dropped. The layout is only updated when the table
+    is rendered. Check the RingStore class for more information.
+
+    **Features:**
+
+    - Append the rows one by one with the append method, or by batches with extend.
+    - Render the last rows with the same layout as the PrettyTable class.
+    - Use the TableConfig class to customize the table.
+
+    :param capacity: The maximum number of rows kept
+    :type capacity: int
+    :param headers: The headers of the table, defaults to None
+    :type headers: List[str], optional
+    :param config: The configuration of the table, defaults to TableConfig()
+    :type config: TableConfig, optional
+
+    :raises ValueError: If the capacity is invalid
+
+    **Example:**
+
+    .. code-block:: python
+
+            from prettypi.pretty_table.tail import TailTable
+
+            tail = TailTable(3, ["Id", "Event"])
+            for i in range(10):
+                tail.append([str(i), "login" if i % 2 else "logout"])
+            print(tail)
+
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        headers: List[str] = None,
+        config: TableConfig = TableConfig(),
+    ) -> None:
+        self.headers = headers
+        self.config = config
+        self.store = RingStore(capacity)
+        self.json_rows_manager = JsonRowsManager()
+        self.json_rows_manager.init(headers, self.store, config)
+        self._synced = True
+
+    @property
+    def capacity(self) -> int:
+        """Get the maximum number of rows kept
+
+        :return: The capacity of the table
+        :rtype: int
+        """
+        return self.store.capacity
+
+    def append(self, row: List[str]) -> None:
+        """Append a row, dropping the oldest row if the table is full.
+
+        :param row: The cells of the row
+        :type row: List[str]
+        """
+        self.store.append(row)
+        self._synced = False
+
+    def extend(self, rows: Iterable[List[str]]) -> None:
+        """Append rows, dropping the oldest rows if the table is full.
+
+        :param rows: The rows to append
+        :type rows: Iterable[List[str]]
+        """
+        self.store.append_rows(rows)
+        self._synced = False
+
+    def iter_lines(self) -> Iterator[str]:
+        """Render the table one line at a time, from the oldest row to the newest.
+
+        :return: A generator of the lines of the table
+        :rtype: Iterator[str]
+        """
+        if not self._synced:
+            self.json_rows_manager.sync_store()
+            self._synced = True
+        return self.json_rows_manager.iter_lines()
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def __str__(self) -> str:
+        return "\n".join(self.iter_lines())
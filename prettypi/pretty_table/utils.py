@@ -1,7 +1,42 @@
-""" Utils for pretty table """
+""" Utils for pretty table """  # pylint: disable=too-many-lines
 
-from typing import List
+import sys
+from array import array
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from typing import Dict, Iterable, Iterator, List, Tuple
+from prettypi.pretty_table.array_store import ArrayStore
+from prettypi.pretty_table.csv_store import CsvStore
+from prettypi.pretty_table.parallel import (
+    PARALLEL_CHUNK_SIZE,
+    check_workers,
+    iter_parallel_lines,
+)
+from prettypi.pretty_table.ring_store import RingStore
+from prettypi.pretty_table.sorting import (
+    column_keys,
+    merge_permutation,
+    rank_key,
+    sort_permutation,
+)
 from prettypi.pretty_table.table_config import Border
+from prettypi.pretty_table.widths import (
+    ascii_lengths,
+    max_length,
+    max_length_at,
+    max_lengths,
+    merge_widths,
+    solve_widths,
+    split_columns,
+)
+from prettypi.utils.display_width import (
+    CACHE_SIZE,
+    ESCAPE,
+    display_width,
+    ellipsize,
+    ljust,
+    wrap,
+)
 
 
 class JsonRow:
@@ -63,9 +98,7 @@ class JsonRow:
         :rtype: JsonRow
 
         """
-        border.left = border.left.rstrip()
-        border.right = border.right.lstrip()
-        return JsonRow("separator", [], border, separator)
+        return JsonRow("separator", [], border.stripped(), separator)
 
     def len_border_left(self):
         """Check the length of the left border
@@ -85,18 +118,78 @@ class JsonRow:
         return len(self.border.right)
 
     def len_columns(self):
-        """Check the length of the columns
+        """Check the display width of the columns, escape codes take no column
 
         :return: The length of the columns
         :rtype: List[int]
         """
         if self.row_data:
-            return [len(item) for item in self.row_data]
+            return [display_width(str(item)) for item in self.row_data]
         return []
 
     def __str__(self) -> str:
         return f"{self.border.left}, {self.row_data}, {self.border.right}"
 
+    def render_row_data(self, max_len_left, max_len_right, max_len_columns):
+        """Render the row data without storing it
+
+        :param max_len_left: The maximum length of the left border
+        :type max_len_left: int
+        :param max_len_right: The maximum length of the right border
+        :type max_len_right: int
+        :param max_len_columns: The maximum length of the columns
+        :type max_len_columns: List[int]
+
+        :return: The rendered row
+        :rtype: str
+
+        """
+        left = self.border.left.ljust(max_len_left)
+        right = self.border.right.ljust(max_len_right)
+
+        columns = [
+            ljust(str(item), max_len_columns[i]) for i, item in enumerate(self.row_data)
+        ]
+        return f"{left} {self.separator.join(columns)} {right}"
+
+    def render_row_separator(self, max_len_computed):
+        """Render the row separator without storing it
+
+        :param max_len_computed: The maximum length of the computed row
+        :type max_len_computed: int
+
+        :return: The rendered separator
+        :rtype: str
+
+        """
+        remove_len = len(self.border.left) + len(self.border.right)
+        separator_line = self.separator * (max_len_computed - remove_len)
+        return f"{self.border.left}{separator_line}{self.border.right}"
+
+    def len_row_data(self, max_len_left, max_len_right, max_len_columns):
+        """Compute the length of the rendered row data without rendering it
+
+        :param max_len_left: The maximum length of the left border
+        :type max_len_left: int
+        :param max_len_right: The maximum length of the right border
+        :type max_len_right: int
+        :param max_len_columns: The maximum length of the columns
+        :type max_len_columns: List[int]
+
+        :return: The length of the rendered row
+        :rtype: int
+
+        """
+        nb_columns = len(self.row_data) if self.row_data else 0
+        len_separators = len(self.separator) * max(nb_columns - 1, 0)
+        return (
+            max_len_left
+            + max_len_right
+            + sum(max_len_columns[:nb_columns])
+            + len_separators
+            + 2
+        )
+
     def compute_row_data(self, max_len_left, max_len_right, max_len_columns):
         """Compute the row data
 
@@ -109,13 +202,9 @@ class JsonRow:
 
         """
         if self.row_type != "separator":
-            left = self.border.left.ljust(max_len_left)
-            right = self.border.right.ljust(max_len_right)
-
-            columns = [
-                item.ljust(max_len_columns[i]) for i, item in enumerate(self.row_data)
-            ]
-            self.row_computed = f"{left} {self.separator.join(columns)} {right}"
+            self.row_computed = self.render_row_data(
+                max_len_left, max_len_right, max_len_columns
+            )
 
     def compute_row_separator(self, max_len_computed):
         """Compute the row separator
@@ -124,116 +213,1000 @@ class JsonRow:
         :type max_len_computed: int
 
         """
-        remove_len = len(self.border.left) + len(self.border.right)
-        separator_line = self.separator * (max_len_computed - remove_len)
-        self.row_computed = f"{self.border.left}{separator_line}{self.border.right}"
+        self.row_computed = self.render_row_separator(max_len_computed)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def fit_cell(cell: str, width: int, overflow: str) -> Tuple[str, ...]:
+    """Fit a cell wider than its column, the lines of each cell are cached
+
+    :param cell: The cell
+    :type cell: str
+    :param width: The width of the column
+    :type width: int
+    :param overflow: "wrap" to wrap the cell on several lines, "truncate" to cut it
+    :type overflow: str
+
+    :return: The lines of the cell
+    :rtype: Tuple[str, ...]
+    """
+    if overflow == "truncate":
+        return (ellipsize(cell, width),)
+    return tuple(wrap(cell, width))
+
+
+def fit_cells(cells: List[str], widths: List[int], overflow: str) -> List[List[str]]:
+    """Fit the cells of a row to the widths of the columns
+
+    :param cells: The cells of the row
+    :type cells: List[str]
+    :param widths: The widths of the columns
+    :type widths: List[int]
+    :param overflow: "wrap" to wrap the cells on several lines, "truncate" to cut them
+    :type overflow: str
+
+    :return: The cells of each line of the row, a single line if every cell fits
+    :rtype: List[List[str]]
+    """
+    fitted = None
+    for i, (cell, width) in enumerate(zip(cells, widths)):
+        if display_width(cell) > width:
+            if fitted is None:
+                fitted = [(item,) for item in cells]
+            fitted[i] = fit_cell(cell, width, overflow)
+    if fitted is None:
+        return [cells]
+    height = max(map(len, fitted))
+    return [
+        [lines[line] if line < len(lines) else "" for lines in fitted]
+        for line in range(height)
+    ]
+
+
+@dataclass
+class RowLayout:  # pylint: disable=too-many-instance-attributes
+    """Class to represent the layout shared by all the data rows of a table
+
+    The layout only holds strings and integers, so it can be sent to other
+    processes to render blocks of rows in parallel. The borders, the separators
+    and the padding of the cells are compiled once into a format string per
+    number of cells, so rendering a row is a single format call.
+
+    The format string pads the cells by their number of characters. The cells
+    of the wide columns, holding non-ASCII or styled text, are padded by their
+    display width before the format call instead.
+
+    When the widths of the columns are constrained, overflow is set and the cells
+    wider than their column are wrapped or truncated to fit.
+    """
+
+    left: str
+    right: str
+    separator: str
+    widths: List[int]
+    row_separator: str = None
+    bottom_separator: str = None
+    wide: Tuple[int, ...] = ()
+    overflow: str = None
+    formats: Dict[int, str] = field(default_factory=dict, compare=False, repr=False)
+
+    def compile(self, nb_cells: int) -> str:
+        """Compile the format string of the rows of nb_cells cells
+
+        :param nb_cells: The number of cells of the rows
+        :type nb_cells: int
+
+        :return: The format string, with one replacement field per cell
+        :rtype: str
+        """
+        def escape(text):
+            return text.replace("{", "{{").replace("}", "}}")
+
+        fields = [
+            "{}" if i in self.wide else f"{{:<{width}}}"
+            for i, width in enumerate(self.widths[:nb_cells])
+        ]
+        row_format = (
+            f"{escape(self.left)} {escape(self.separator).join(fields)} "
+            f"{escape(self.right)}"
+        )
+        self.formats[nb_cells] = row_format
+        return row_format
+
+    def render_row(self, cells: List[str]) -> str:
+        """Render a data row
+
+        :param cells: The cells of the row
+        :type cells: List[str]
+
+        :return: The rendered row
+        :rtype: str
+        """
+        row_format = self.formats.get(len(cells))
+        if row_format is None:
+            row_format = self.compile(len(cells))
+        if self.wide:
+            cells = list(cells)
+            nb_cells = len(cells)
+            widths = self.widths
+            for i in self.wide:
+                if i < nb_cells:
+                    cells[i] = ljust(cells[i], widths[i])
+        return row_format.format(*cells)
+
+    def iter_lines(self, rows: Iterable[List[str]], last: bool = True) -> Iterator[str]:
+        """Render a block of data rows, each one followed by its separator
+
+        :param rows: The cells of each row
+        :type rows: Iterable[List[str]]
+        :param last: The block ends the table, its last row is followed by the
+            bottom border, defaults to True
+        :type last: bool, optional
+
+        :return: A generator of the rendered lines
+        :rtype: Iterator[str]
+        """
+        first = True
+        render_row = self.render_row
+        for cells in rows:
+            if not first and self.row_separator is not None:
+                yield self.row_separator
+            first = False
+            if self.overflow is None:
+                yield render_row(cells)
+            else:
+                for line in fit_cells(cells, self.widths, self.overflow):
+                    yield render_row(line)
+        if first:
+            return
+        if last and self.bottom_separator is not None:
+            yield self.bottom_separator
+        elif self.row_separator is not None:
+            yield self.row_separator
 
 
-class JsonRowsManager:
-    """Class to manage the rows of the table"""
+class ColumnStore:
+    """Class to store the cells of the table column by column
+
+    Each column is a list of interned strings with an array of the cell lengths,
+    so no Python object is created per row. Rows shorter than the others are
+    padded with empty cells, their real size is kept in row_sizes.
+
+    The lengths are display widths. The cells of a chunk of plain ASCII text are
+    measured in bulk by ascii_lengths, only the chunks with wide characters or ANSI
+    escape codes are measured one cell at a time. StyledStr cells are stored as
+    strings.
+    """
 
     def __init__(self) -> None:
+        self.columns = []
+        self.lengths = []
+        self.row_sizes = None
+        self.nb_rows = 0
+        self.wide = set()
+        self.ascii = True
+
+    def append_rows(self, rows):
+        """Append rows to the store
+
+        :param rows: The rows to append
+        :type rows: Iterable[List[str]]
+
+        :return: The length of the longest appended cell of each column
+        :rtype: List[int]
+        """
+        if not isinstance(rows, list):
+            rows = list(rows)
+        sizes = array("L", map(len, rows))
+        old_nb_columns = len(self.columns)
+        nb_columns = max(max(sizes, default=0), old_nb_columns)
+        while len(self.columns) < nb_columns:
+            self.columns.append([""] * self.nb_rows)
+            self.lengths.append(array("L", [0]) * self.nb_rows)
+
+        ragged = any(size != nb_columns for size in sizes)
+        if self.row_sizes is None and (
+            ragged or (self.nb_rows and old_nb_columns != nb_columns)
+        ):
+            self.row_sizes = array("L", [old_nb_columns]) * self.nb_rows
+        if self.row_sizes is not None:
+            self.row_sizes.extend(sizes)
+
+        new_max_lengths = []
+        for i, column in enumerate(self.columns):
+            if ragged:
+                cells = [sys.intern(str(row[i])) if i < len(row) else "" for row in rows]
+            else:
+                cells = [sys.intern(str(row[i])) for row in rows]
+            text = "\0".join(cells)
+            if text.isascii() and ESCAPE not in text:
+                lengths = ascii_lengths(cells, text)
+            else:
+                widths = {cell: display_width(cell) for cell in set(cells)}
+                lengths = array("L", map(widths.__getitem__, cells))
+                self.ascii = self.ascii and text.isascii()
+                self.wide.add(i)
+            column.extend(cells)
+            self.lengths[i].extend(lengths)
+            new_max_lengths.append(max_length(lengths))
+        self.nb_rows += len(sizes)
+        return new_max_lengths
+
+    def iter_rows(self, indices, columns=None):
+        """Get the cells of some rows
+
+        :param indices: The indices of the rows
+        :type indices: Iterable[int]
+        :param columns: The positions of the columns, missing cells are empty,
+            defaults to None (all)
+        :type columns: Sequence[int], optional
+
+        :return: A generator of the cells of each row
+        :rtype: Iterator[List[str]]
+        """
+        if columns is None:
+            return map(self.row, indices)
+        return map(partial(self.project, columns=columns), indices)
+
+    def row(self, index):
+        """Get the cells of a row
+
+        :param index: The index of the row
+        :type index: int
+
+        :return: The cells of the row
+        :rtype: List[str]
+        """
+        cells = [column[index] for column in self.columns]
+        if self.row_sizes is not None:
+            del cells[self.row_sizes[index]:]
+        return cells
+
+    def project(self, index, columns):
+        """Get some cells of a row
+
+        :param index: The index of the row
+        :type index: int
+        :param columns: The positions of the columns, missing cells are empty
+        :type columns: Sequence[int]
+
+        :return: The cells of the row
+        :rtype: List[str]
+        """
+        nb_columns = len(self.columns)
+        return [self.columns[i][index] if i < nb_columns else "" for i in columns]
+
+    def nb_columns(self):
+        """Get the number of columns of the store
+
+        :return: The number of columns
+        :rtype: int
+        """
+        return len(self.columns)
+
+    def column(self, index):
+        """Get the cells of a column, missing cells are empty
+
+        :param index: The index of the column
+        :type index: int
+
+        :return: The cells of the column
+        :rtype: Sequence[str]
+        """
+        return self.columns[index]
+
+    def column_lengths(self, index):
+        """Get the lengths of the cells of a column
+
+        :param index: The index of the column
+        :type index: int
+
+        :return: The length of each cell of the column
+        :rtype: array
+        """
+        return self.lengths[index]
+
+    def is_ragged(self):
+        """Check if some rows have fewer cells than the others
+
+        :return: True if the rows do not all have the same number of cells
+        :rtype: bool
+        """
+        return self.row_sizes is not None and min(self.row_sizes) != max(self.row_sizes)
+
+    def is_ascii(self):
+        """Check if every cell is ASCII text
+
+        :return: True if every cell is ASCII text
+        :rtype: bool
+        """
+        return self.ascii
+
+    def wide_columns(self):
+        """Get the columns holding non-ASCII or styled cells, padded by display width
+
+        :return: The positions of the columns
+        :rtype: Set[int]
+        """
+        return self.wide
+
+    def max_row_size(self):
+        """Get the number of cells of the longest row
+
+        :return: The number of cells of the longest row
+        :rtype: int
+        """
+        if self.row_sizes is not None:
+            return max(self.row_sizes, default=0)
+        return len(self.columns) if self.nb_rows else 0
+
+    def max_length(self, index):
+        """Get the length of the longest cell of a column
+
+        :param index: The index of the column
+        :type index: int
+
+        :return: The length of the longest cell
+        :rtype: int
+        """
+        return max_length(self.lengths[index])
+
+    def max_lengths(self):
+        """Get the length of the longest cell of each column
+
+        :return: The length of the longest cell of each column
+        :rtype: List[int]
+        """
+        return max_lengths(self.lengths)
+
+    def __len__(self) -> int:
+        return self.nb_rows
+
+
+class JsonRowsManager:  # pylint: disable=too-many-instance-attributes
+    """Class to manage the rows of the table
+
+    The header rows are kept as JsonRow objects, the data rows are stored column
+    by column in a ColumnStore and their separators are rendered on the fly.
+    """
+
+    def __init__(self, workers=None, executor="process") -> None:
+        check_workers(workers, executor)
+        self.workers = workers
+        self.executor = executor
         self.json_rows = []
         self.max_len_after = 0
         self.max_len_before = 0
         self.max_len_columns = []
         self.data = None
         self.header = None
+        self.store = ColumnStore()
+        self.border_header = None
+        self.border_data = None
+        self.column_separator = ""
+        self.row_separator = None
+        self.bottom_separator = None
+        self.config = None
+        self.sort_keys = {}
+        self.sort_spec = None
+        self.order = None
+        self.version = 0
+        self._stale = False
 
     def init(self, header, data, config):
         """Initialize the rows of the table
 
         :param header: The header of the table
         :type header: List[str]
-        :param data: The data of the table
-        :type data: List[List[str]]
+        :param data: The data of the table, or a store to read the rows from
+        :type data: Union[List[List[str]], ArrayStore, CsvStore, RingStore]
         :param config: The configuration of the table
         :type config: TableConfig
         """
         self.data = data
         self.header = header
+        self.config = config
 
         if self.header:
             self._init_header(header, config)
-        if self.data:
+        if isinstance(self.data, (ArrayStore, CsvStore, RingStore)):
+            self.store = self.data
+            if len(self.store):
+                self._init_data_separators(config)
+        elif self.data:
             self._init_data(self.data, config)
         self._update_max_len()
 
     def _init_header(self, header, config):
-        """Initialize the header of the table"""
-        if config.border_header.top:
-            self.json_rows.append(
-                JsonRow.create_separator(config.border_header, config.border_header.top)
-            )
+        """Initialize the header of the table
+
+        The header row of a table with a top or bottom border uses the same
+        stripped borders as the separators around it.
+        """
+        border = config.border_header
+        if border.top or border.bottom:
+            border = border.stripped()
+        self.border_header = border
+        if border.top:
+            self.json_rows.append(JsonRow.create_separator(border, border.top))
         self.json_rows.append(
-            JsonRow.create_header(header, config.border_header, config.column_separator)
+            JsonRow.create_header(header, border, config.column_separator)
         )
-        if config.border_header.bottom:
-            self.json_rows.append(
-                JsonRow.create_separator(
-                    config.border_header, config.border_header.bottom
-                )
-            )
+        if border.bottom:
+            self.json_rows.append(JsonRow.create_separator(border, border.bottom))
+
+    def strip_header_border(self):
+        """Strip the border of the header rows, once a separator uses it"""
+        if self.border_header is None:
+            return
+        self.border_header = self.border_header.stripped()
+        for row in self.json_rows:
+            row.border = self.border_header
 
     def _init_data(self, data, config):
-        """Initialize the data of the table"""
-        for i, row in enumerate(data):
-            self.json_rows.append(
-                JsonRow.create_data(row, config.border_data, config.column_separator)
+        """Initialize the data of the table
+
+        The cells are stored column by column, the separators of the data rows
+        are only created once and repeated at render time.
+        """
+        self.store = ColumnStore()
+        self.store.append_rows(data)
+        self._init_data_separators(config)
+
+    def _init_data_separators(self, config, nb_rows=None):
+        """Initialize the border and the separators of the data rows
+
+        :param config: The configuration of the table
+        :type config: TableConfig
+        :param nb_rows: The number of data rows of the table, defaults to None
+            (the rows of the store)
+        :type nb_rows: int, optional
+        """
+        if nb_rows is None:
+            nb_rows = len(self.store)
+        self.border_data = config.border_data
+        self.column_separator = config.column_separator
+        self.row_separator = None
+        self.bottom_separator = None
+        if config.border_data.bottom:
+            self.bottom_separator = JsonRow.create_separator(
+                config.border_header, config.border_data.bottom
             )
-            if i == len(data) - 1 and config.border_data.bottom:
-                self.json_rows.append(
-                    JsonRow.create_separator(
-                        config.border_header, config.border_data.bottom
-                    )
-                )
-            elif config.row_separator:
-                self.json_rows.append(
-                    JsonRow.create_separator(config.border_data, config.row_separator)
-                )
+            self.strip_header_border()
+        if config.row_separator and (nb_rows > 1 or not config.border_data.bottom):
+            self.row_separator = JsonRow.create_separator(
+                config.border_data, config.row_separator
+            )
+            self.border_data = self.border_data.stripped()
 
     def set_config(self, config):
-        """Set the configuration of the table (reset the rows)
+        """Set the configuration of the table
+
+        The layout is rebuilt lazily, the next time the table is rendered, and
+        not at all if the configuration did not change. The data and the widths
+        of the columns are kept.
 
         :param config: The configuration of the table
         :type config: TableConfig
 
         """
+        if config == self.config:
+            return
+        self.config = config
+        self._stale = True
+
+    def _refresh(self):
+        """Redo the layout of the table if the configuration changed
+
+        The widths of the columns do not depend on the configuration, so the
+        store and the widths are kept: only the header rows, the separators and
+        the border lengths are rebuilt.
+        """
+        if not self._stale:
+            return
+        self._stale = False
         self.json_rows = []
-        self.init(self.header, self.data, config)
+        self.border_header = None
+        self.max_len_before = 0
+        self.max_len_after = 0
+        if self.header:
+            self._init_header(self.header, self.config)
+        if len(self.store):
+            self._init_data_separators(self.config)
+        self._update_max_len_borders()
+
+    def nb_columns(self):
+        """Get the number of columns of the table, header included
+
+        :return: The number of columns
+        :rtype: int
+        """
+        return max(len(self.header or []), self.store.nb_columns())
+
+    def column_index(self, column):
+        """Get the position of a column from its position or its header
+
+        :param column: The position or the header of the column
+        :type column: Union[int, str]
+
+        :return: The position of the column
+        :rtype: int
+
+        :raises ValueError: If the header does not exist
+        :raises IndexError: If the position does not exist
+        """
+        if isinstance(column, str):
+            if not self.header or column not in self.header:
+                raise ValueError(f"Invalid column: {column}")
+            return self.header.index(column)
+        if not 0 <= column < self.nb_columns():
+            raise IndexError(f"Invalid column: {column}")
+        return column
+
+    def _sort_keys(self, index):
+        """Get the cached sort keys of a column, computing them the first time"""
+        keys = self.sort_keys.get(index)
+        if keys is None:
+            if index < self.store.nb_columns():
+                keys = column_keys(self.store.column(index))
+            else:
+                keys = array("L", [0]) * len(self.store)
+            self.sort_keys[index] = keys
+        return keys
+
+    def sort(self, columns, reverse):
+        """Sort the rows with a permutation index, the data is not copied
+
+        The sort keys of each column are computed once and cached, so sorting
+        again by a column already used is only the cost of the sort itself.
+
+        :param columns: The positions of the columns to sort by, by priority
+        :type columns: List[int]
+        :param reverse: Sort each column in descending order
+        :type reverse: List[bool]
+        """
+        keys = [self._sort_keys(index) for index in columns]
+        self.order = sort_permutation(keys, reverse)
+        self.sort_spec = (columns, reverse)
+        self.version += 1
+
+    def _merge_sorted(self, indices):
+        """Merge appended rows into the sorted order, the other rows keep their order
+
+        The rank arrays are dense, a new value would renumber its whole column, so
+        they are dropped and only computed again by the next sort. The new rows
+        are compared to the existing ones by the rank keys of their cells.
+
+        :param indices: The indices of the appended rows
+        :type indices: Sequence[int]
+        """
+        columns, reverse = self.sort_spec
+        project = self.store.project
+
+        def row_keys(index):
+            return [rank_key(cell) for cell in project(index, columns)]
+
+        self.order = merge_permutation(self.order, row_keys, indices, reverse)
+
+    def row_order(self):
+        """Get the indices of the data rows in display order
+
+        :return: The indices of the data rows
+        :rtype: Sequence[int]
+        """
+        if self.order is None:
+            return range(len(self.store))
+        return self.order
+
+    def append_rows(self, rows):
+        """Append rows to the table without reprocessing the existing ones
+
+        Only the appended cells are measured, the widths of the columns grow
+        incrementally. The rows are padded at render time, so the existing rows
+        are never touched even when a column widens. The rows are only kept in
+        the store, the data given to init is not extended.
+
+        :param rows: The rows to append
+        :type rows: Iterable[List[str]]
+        """
+        rows = list(rows)
+        if not rows:
+            return
+        self._refresh()
+        nb_rows = len(self.store)
+        new_max_lengths = self.store.append_rows(rows)
+
+        self.sort_keys = {}
+        if self.sort_spec is not None:
+            self._merge_sorted(range(nb_rows, len(self.store)))
+        self._init_data_separators(self.config)
+        self._update_max_len_borders()
+        self.max_len_columns = merge_widths(self.max_len_columns, new_max_lengths)
+        self.version += 1
+
+    def sync_store(self):
+        """Update the layout after the rows of the store changed in place
+
+        The widths of the columns are computed again from the header and the
+        store, so they also shrink when the widest cells leave the store.
+        """
+        self._refresh()
+        if len(self.store):
+            self._init_data_separators(self.config)
+        self.max_len_columns = []
+        self._update_max_len()
+        self.version += 1
+
+    def _borders(self, with_data=None):
+        """Get the borders of every kind of row of the table
+
+        :param with_data: The table has data rows, defaults to None (the store has rows)
+        :type with_data: bool, optional
+        """
+        if with_data is None:
+            with_data = len(self.store) > 0
+        borders = [row.border for row in self.json_rows]
+        if with_data:
+            borders.append(self.border_data)
+            if self.bottom_separator:
+                borders.append(self.bottom_separator.border)
+        return borders
+
+    def _update_max_len_borders(self, with_data=None):
+        """Update the maximum length of the left and right borders
+
+        :param with_data: The table has data rows, defaults to None (the store has rows)
+        :type with_data: bool, optional
+
+        :return: False if the table has no row
+        :rtype: bool
+        """
+        borders = self._borders(with_data)
+        if not borders:
+            return False
+        self.max_len_before = max(len(border.left) for border in borders)
+        self.max_len_after = max(len(border.right) for border in borders)
+        return True
 
     def _update_max_len(self):
-        if not self.json_rows:
+        if not self._update_max_len_borders():
             return
-        self.max_len_before = max(len(row.border.left) for row in self.json_rows)
-        self.max_len_after = max(len(row.border.right) for row in self.json_rows)
 
         for row in self.json_rows:
-            for i, column in enumerate(row.len_columns()):
-                while len(self.max_len_columns) <= i:
-                    self.max_len_columns.append(column)
+            self.max_len_columns = merge_widths(self.max_len_columns, row.len_columns())
+        self.max_len_columns = merge_widths(
+            self.max_len_columns, self.store.max_lengths()
+        )
+
+    def _len_row(self, widths, nb_columns):
+        """Compute the length of a rendered row of nb_columns cells"""
+        return (
+            self.max_len_before
+            + self.max_len_after
+            + sum(widths[:nb_columns])
+            + len(self.column_separator) * max(nb_columns - 1, 0)
+            + 2
+        )
+
+    def _max_len_computed(self, widths=None, max_row_size=None):
+        """Compute the length of the widest row, used to draw the separators
+
+        :param widths: The widths of the rendered columns, defaults to None
+            (all the columns of the table)
+        :type widths: List[int], optional
+        :param max_row_size: The number of cells of the longest data row,
+            defaults to None (the longest row of the store)
+        :type max_row_size: int, optional
 
-                self.max_len_columns[i] = max(self.max_len_columns[i], column)
+        :return: The maximum length of the computed rows
+        :rtype: int
+        """
+        if widths is not None:
+            return self._len_row(widths, len(widths))
+        max_len_computed = max(
+            (
+                row.len_row_data(
+                    self.max_len_before, self.max_len_after, self.max_len_columns
+                )
+                for row in self.json_rows
+                if row.row_type != "separator"
+            ),
+            default=0,
+        )
+        if max_row_size is None:
+            max_row_size = self.store.max_row_size()
+        if max_row_size:
+            max_len_computed = max(
+                max_len_computed, self._len_row(self.max_len_columns, max_row_size)
+            )
+        return max_len_computed
+
+    def fitted_widths(self, widths=None, columns=None):
+        """Solve the width constraints of the configuration for the rendered columns
+
+        :param widths: The natural widths of the rendered columns, defaults to None
+            (the widths of the whole table)
+        :type widths: List[int], optional
+        :param columns: The positions of the rendered columns, defaults to None (all)
+        :type columns: Sequence[int], optional
+
+        :return: The solved widths, or the given widths if the configuration does
+            not constrain them
+        :rtype: List[int]
+        """
+        if self.config is None or not self.config.has_width_constraints():
+            return widths
+        if widths is None:
+            widths = self.max_len_columns
+        constraints = self.config.column_widths
+        if columns is not None:
+            constraints = [
+                constraints[column] if column < len(constraints) else None
+                for column in columns
+            ]
+        overhead = self._len_row([0] * len(widths), len(widths))
+        return solve_widths(widths, constraints, self.config.max_width, overhead)
+
+    def column_blocks(self, columns, widths, keys, max_width):
+        """Split columns into blocks fitting a width, each block starts with the keys
+
+        :param columns: The positions of the columns to split
+        :type columns: Sequence[int]
+        :param widths: The width of each column to split
+        :type widths: Sequence[int]
+        :param keys: The positions and the widths of the key columns
+        :type keys: Sequence[Tuple[int, int]]
+        :param max_width: The maximum width of a rendered row
+        :type max_width: int
+
+        :return: The positions of the columns of each block, keys included
+        :rtype: List[List[int]]
+        """
+        self._refresh()
+        key_widths = [width for _, width in keys]
+        available = max_width - self._len_row(key_widths + [0], len(keys) + 1)
+        groups = split_columns(widths, available, len(self.column_separator))
+        key_columns = [column for column, _ in keys]
+        return [key_columns + [columns[i] for i in group] for group in groups]
+
+    def visible_widths(self, indices, columns):
+        """Compute the widths of some columns over a subset of the rows
+
+        :param indices: The indices of the data rows
+        :type indices: Sequence[int]
+        :param columns: The positions of the columns
+        :type columns: Sequence[int]
+
+        :return: The width of each column
+        :rtype: List[int]
+        """
+        header = self.header or []
+        widths = []
+        for column in columns:
+            width = display_width(header[column]) if column < len(header) else 0
+            if column < self.store.nb_columns():
+                lengths = self.store.column_lengths(column)
+                width = max(width, max_length_at(lengths, indices))
+            widths.append(width)
+        return widths
 
     def process(self):
-        """Process the rows of the table"""
+        """Process the header rows of the table (store every computed row)"""
+        self._refresh()
         # Compute the row with data
         for row in self.json_rows:
             row.compute_row_data(
                 self.max_len_before, self.max_len_after, self.max_len_columns
             )
 
-        # Calculate the max length of the computed row
-        max_len_computed = max(
-            len(row.row_computed)
-            for row in self.json_rows
-            if row.row_type != "separator"
-        )
-
         # Compute the row with separator
+        max_len_computed = self._max_len_computed()
         for row in self.json_rows:
             if row.row_type == "separator":
                 row.compute_row_separator(max_len_computed)
 
+    def data_layout(self, max_len_computed, widths, columns=None):
+        """Build the layout shared by the data rows
+
+        :param max_len_computed: The maximum length of the computed rows
+        :type max_len_computed: int
+        :param widths: The widths of the rendered columns
+        :type widths: List[int]
+        :param columns: The positions of the rendered columns, defaults to None (all)
+        :type columns: Sequence[int], optional
+
+        :return: The layout of the data rows
+        :rtype: RowLayout
+        """
+        row_separator = None
+        if self.row_separator:
+            row_separator = self.row_separator.render_row_separator(max_len_computed)
+        bottom_separator = None
+        if self.bottom_separator:
+            bottom_separator = self.bottom_separator.render_row_separator(
+                max_len_computed
+            )
+        return RowLayout(
+            self.border_data.left.ljust(self.max_len_before),
+            self.border_data.right.ljust(self.max_len_after),
+            self.column_separator,
+            list(widths),
+            row_separator,
+            bottom_separator,
+            self._wide_positions(columns),
+            self.config.overflow if self.config.has_width_constraints() else None,
+        )
+
+    def _wide_positions(self, columns):
+        """Get the positions of the rendered columns holding non-ASCII cells"""
+        wide = self.store.wide_columns()
+        if columns is None:
+            return tuple(sorted(wide))
+        return tuple(i for i, column in enumerate(columns) if column in wide)
+
+    def rows(self, indices, columns=None):
+        """Get the cells of some data rows
+
+        :param indices: The indices of the rows
+        :type indices: Iterable[int]
+        :param columns: The positions of the columns, defaults to None (all)
+        :type columns: Sequence[int], optional
+
+        :return: A generator of the cells of each row
+        :rtype: Iterator[List[str]]
+        """
+        return self.store.iter_rows(indices, columns)
+
+    def _iter_data_lines(self, indices, max_len_computed, columns, widths):
+        """Render the data rows at the given indices, followed by their separators
+
+        :param indices: The indices of the rows to render
+        :type indices: Sequence[int]
+        :param max_len_computed: The maximum length of the computed rows
+        :type max_len_computed: int
+        :param columns: The positions of the columns to render, None for all
+        :type columns: Sequence[int]
+        :param widths: The widths of the rendered columns
+        :type widths: List[int]
+
+        :return: A generator of the rendered lines
+        :rtype: Iterator[str]
+        """
+        layout = self.data_layout(max_len_computed, widths, columns)
+        if self.workers and len(indices) > PARALLEL_CHUNK_SIZE:
+            return iter_parallel_lines(
+                layout,
+                self.store,
+                indices,
+                columns,
+                self.workers,
+                self.executor,
+                PARALLEL_CHUNK_SIZE,
+            )
+        return layout.iter_lines(self.rows(indices, columns))
+
+    def iter_lines(self, indices=None, columns=None, widths=None):
+        """Render the rows of the table one at a time
+
+        Nothing is stored on the rows, so only the current line is kept in memory.
+        The widths computed by the width pass are reused, so rendering a subset of
+        the rows only costs the size of the subset.
+
+        :param indices: The indices of the data rows to render,
+            defaults to None (all the rows, in display order)
+        :type indices: Sequence[int], optional
+        :param columns: The positions of the columns to render,
+            defaults to None (all the columns)
+        :type columns: Sequence[int], optional
+        :param widths: The widths of the rendered columns, defaults to None
+            (the widths of the whole table)
+        :type widths: List[int], optional
+
+        :return: A generator of the rendered lines
+        :rtype: Iterator[str]
+        """
+        self._refresh()
+        if indices is None:
+            indices = self.row_order()
+        if columns is not None and widths is None:
+            widths = [self.max_len_columns[column] for column in columns]
+        widths = self.fitted_widths(widths, columns)
+        max_len_computed = self._max_len_computed(widths)
+        if widths is None:
+            widths = self.max_len_columns
+        yield from self._iter_header_lines(max_len_computed, columns, widths)
+        if len(indices):
+            yield from self._iter_data_lines(indices, max_len_computed, columns, widths)
+
+    def reserve_rows(self, nb_rows):
+        """Lay out the data rows of a table of nb_rows rows, whatever the store holds
+
+        The separators and the borders of the data rows are set up as if the table
+        had nb_rows rows, for the rows the caller renders outside the store.
+
+        :param nb_rows: The number of data rows of the table
+        :type nb_rows: int
+        """
+        self._refresh()
+        self._init_data_separators(self.config, nb_rows)
+        self._update_max_len_borders(with_data=True)
+
+    def iter_shard_lines(self, summary, first=True, last=True):
+        """Render the rows of a shard of a table split across several managers
+
+        The widths and the number of rows of the whole table are taken from the
+        summary, so the lines of every shard line up when they are concatenated.
+
+        :param summary: The merged width summary of every shard of the table
+        :type summary: WidthSummary
+        :param first: The shard starts the table, it renders the header, defaults to True
+        :type first: bool, optional
+        :param last: The shard ends the table, it renders the bottom border, even
+            without rows, defaults to True
+        :type last: bool, optional
+
+        :return: A generator of the rendered lines
+        :rtype: Iterator[str]
+        """
+        self.max_len_columns = merge_widths(self.max_len_columns, summary.widths)
+        if summary.nb_rows:
+            self.reserve_rows(summary.nb_rows)
+        widths = self.fitted_widths()
+        max_len_computed = self._max_len_computed(widths, summary.max_row_size)
+        widths = widths or self.max_len_columns
+        if first:
+            yield from self._iter_header_lines(max_len_computed, None, widths)
+        layout = self.data_layout(max_len_computed, widths)
+        if len(self.store):
+            yield from layout.iter_lines(self.rows(range(len(self.store))), last)
+        elif last and summary.nb_rows and layout.bottom_separator is not None:
+            # The previous shard ended with a row separator, a different bottom
+            # border still closes the table
+            if layout.bottom_separator != layout.row_separator:
+                yield layout.bottom_separator
+
+    def header_and_layout(self, widths=None):
+        """Render the header rows and build the layout of the data rows
+
+        :param widths: The widths of the columns, defaults to None (the widths of
+            the whole table)
+        :type widths: List[int], optional
+
+        :return: The rendered header lines and the layout of the data rows
+        :rtype: Tuple[List[str], RowLayout]
+        """
+        self._refresh()
+        widths = self.fitted_widths(widths)
+        max_len_computed = self._max_len_computed(widths)
+        widths = widths or self.max_len_columns
+        header = list(self._iter_header_lines(max_len_computed, None, widths))
+        return header, self.data_layout(max_len_computed, widths)
+
+    def _iter_header_lines(self, max_len_computed, columns, widths):
+        """Render the header rows and their borders
+
+        :param max_len_computed: The maximum length of the computed rows
+        :type max_len_computed: int
+        :param columns: The positions of the columns to render, None for all
+        :type columns: Sequence[int]
+        :param widths: The widths of the rendered columns
+        :type widths: List[int]
+
+        :return: A generator of the rendered lines
+        :rtype: Iterator[str]
+        """
+        for row in self.json_rows:
+            if row.row_type == "separator":
+                yield row.render_row_separator(max_len_computed)
+                continue
+            header = row.row_data
+            if columns is not None:
+                header = [header[i] if i < len(header) else "" for i in columns]
+            for line in fit_cells(
+                [str(item) for item in header], widths, self.config.overflow
+            ):
+                row = JsonRow.create_header(line, row.border, row.separator)
+                yield row.render_row_data(self.max_len_before, self.max_len_after, widths)
+
     def __str__(self) -> str:
-        return "\n".join(row.row_computed for row in self.json_rows)
+        return "\n".join(self.iter_lines())
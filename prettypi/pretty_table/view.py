@@ -0,0 +1,184 @@
+""" TableView class for lazy filtered and projected views of a PrettyTable. """
+
+import shutil
+from array import array
+from typing import Callable, Iterator, List, Sequence, TextIO, Union
+from prettypi.pretty_table.output import LinesOutput
+from prettypi.pretty_table.utils import JsonRowsManager
+
+
+class TableView(LinesOutput):
+    """TableView class for displaying a subset of the rows and columns of a table.
+
+    A view only keeps the index of its rows and the positions of its columns, the
+    data of the table is never copied. The widths of the columns are computed
+    over the visible cells only, the first time the view is rendered.
+
+    Use the PrettyTable.where() and PrettyTable.select() methods to create a view.
+
+    **Features:**
+
+    - Filter the rows with the where method.
+    - Select the columns with the select method.
+    - Chain the where and select methods.
+    - Split wide views into blocks of columns fitting the terminal with the blocks method.
+    - Print the view with the __str__ method.
+    - Write the view to text or binary files with the dump method.
+
+    :param manager: The manager of the table
+    :type manager: JsonRowsManager
+    :param indices: The indices of the visible data rows
+    :type indices: Sequence[int]
+    :param columns: The positions of the visible columns
+    :type columns: List[int]
+    :param widths: The widths of the visible columns, defaults to None (computed
+        over the visible cells)
+    :type widths: List[int], optional
+
+    **Example:**
+
+    .. code-block:: python
+
+            from prettypi.pretty_table.table import PrettyTable
+
+            pt = PrettyTable([["1", "a", "x"], ["2", "b", "y"]], ["Id", "Name", "Other"])
+            view = pt.where(lambda row: row[0] != "1").select(["Id", "Name"])
+            print(view)
+
+    """
+
+    def __init__(
+        self,
+        manager: JsonRowsManager,
+        indices: Sequence[int],
+        columns: List[int],
+        widths: List[int] = None,
+    ) -> None:
+        self.manager = manager
+        self.indices = indices
+        self.columns = columns
+        self._widths = widths
+
+    def where(self, predicate: Callable[[List[str]], bool]) -> "TableView":
+        """Keep only the rows matching a predicate.
+
+        :param predicate: A function called with the visible cells of each row
+        :type predicate: Callable[[List[str]], bool]
+
+        :return: A new view with the matching rows
+        :rtype: TableView
+        """
+        rows = self.manager.rows(self.indices, self.columns)
+        indices = array(
+            "L", (i for i, row in zip(self.indices, rows) if predicate(row))
+        )
+        return TableView(self.manager, indices, self.columns)
+
+    def select(self, columns: List[Union[int, str]]) -> "TableView":
+        """Keep only some columns.
+
+        :param columns: The headers of the columns, or their position in the view
+        :type columns: List[Union[int, str]]
+
+        :return: A new view with the selected columns
+        :rtype: TableView
+
+        :raises ValueError: If a header is not visible in the view
+        :raises IndexError: If a position does not exist in the view
+        """
+        selected = []
+        for column in columns:
+            if isinstance(column, str):
+                position = self.manager.column_index(column)
+                if position not in self.columns:
+                    raise ValueError(f"Invalid column: {column}")
+            else:
+                if not 0 <= column < len(self.columns):
+                    raise IndexError(f"Invalid column: {column}")
+                position = self.columns[column]
+            selected.append(position)
+        return TableView(self.manager, self.indices, selected)
+
+    def blocks(
+        self, max_width: int = None, keys: List[Union[int, str]] = None
+    ) -> List["TableView"]:
+        """Split the columns into blocks of consecutive columns fitting a width.
+
+        Each block is a view of the same rows with some of the columns, starting
+        with the key columns. Rendering a block only formats the cells of its
+        columns, so the cost and the size of a block do not depend on the number
+        of columns of the table. A column wider than max_width is alone in its block.
+
+        :param max_width: The maximum width of the rendered rows, defaults to None
+            (the width of the terminal)
+        :type max_width: int, optional
+        :param keys: The headers or the positions in the view of the columns repeated
+            in every block, defaults to None (no key column)
+        :type keys: List[Union[int, str]], optional
+
+        :return: The views of the blocks, at least one
+        :rtype: List[TableView]
+
+        :raises ValueError: If a header is not visible in the view
+        :raises IndexError: If a position does not exist in the view
+
+        **Example:**
+
+        .. code-block:: python
+
+                from prettypi.pretty_table.table import PrettyTable
+
+                headers = ["Id"] + [f"Metric {i}" for i in range(8)]
+                pt = PrettyTable([[str(row)] + ["0.5"] * 8 for row in range(3)], headers)
+                for block in pt.where(lambda row: row[0] != "1").blocks(40, ["Id"]):
+                    print(block)
+
+        """
+        if max_width is None:
+            max_width = shutil.get_terminal_size().columns
+        widths = dict(zip(self.columns, self.widths))
+        keys = self.select(keys or []).columns
+        columns = [column for column in self.columns if column not in keys]
+        blocks = self.manager.column_blocks(
+            columns,
+            [widths[column] for column in columns],
+            [(column, widths[column]) for column in keys],
+            max_width,
+        )
+        return [
+            TableView(
+                self.manager, self.indices, block, [widths[column] for column in block]
+            )
+            for block in blocks
+        ]
+
+    @property
+    def widths(self) -> List[int]:
+        """The widths of the visible columns, computed over the visible rows only."""
+        if self._widths is None:
+            self._widths = self.manager.visible_widths(self.indices, self.columns)
+        return self._widths
+
+    def iter_lines(self) -> Iterator[str]:
+        """Render the view one line at a time.
+
+        :return: A generator of the lines of the view
+        :rtype: Iterator[str]
+        """
+        return self.manager.iter_lines(self.indices, self.columns, self.widths)
+
+    def write(self, fp: TextIO) -> None:
+        """Write the view to a text file object, one line at a time.
+
+        :param fp: The file object to write to
+        :type fp: TextIO
+        """
+        for line in self.iter_lines():
+            fp.write(line)
+            fp.write("\n")
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __str__(self) -> str:
+        return "\n".join(self.iter_lines())
@@ -0,0 +1,257 @@
+""" Width engine used to compute the widths of the columns of a table.
+
+When NumPy is installed, the large columns are measured in bulk: the lengths of
+plain ASCII cells are the gaps between the separators of the joined cells, and
+the maximum of the length arrays is computed over the array buffer, without
+creating a Python integer per cell. Otherwise the pure-Python path is used.
+"""
+
+from array import array
+from itertools import zip_longest
+from typing import List, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+NUMPY_MIN_SIZE = 1024
+
+
+def has_numpy() -> bool:
+    """Check if the NumPy width engine is available
+
+    :return: True if NumPy is installed
+    :rtype: bool
+    """
+    return np is not None
+
+
+def _use_numpy(use_numpy, size):
+    """Choose the width engine, NumPy for the large inputs when it is installed"""
+    if use_numpy is None:
+        return np is not None and size >= NUMPY_MIN_SIZE
+    if use_numpy and np is None:
+        raise ImportError("NumPy is required by the NumPy width engine")
+    return use_numpy
+
+
+def ascii_lengths(cells: Sequence[str], joined: str = None, use_numpy: bool = None) -> array:
+    """Get the lengths of cells of plain ASCII text
+
+    With NumPy, the cells are joined by NUL characters and encoded once, the
+    lengths are the gaps between the NUL bytes, found in bulk.
+
+    :param cells: The cells, plain ASCII text
+    :type cells: Sequence[str]
+    :param joined: The cells joined by NUL characters, if already computed,
+        defaults to None
+    :type joined: str, optional
+    :param use_numpy: Force or disable the NumPy engine, defaults to None (automatic)
+    :type use_numpy: bool, optional
+
+    :return: The length of each cell
+    :rtype: array
+
+    :raises ImportError: If use_numpy is True and NumPy is not installed
+    """
+    if not _use_numpy(use_numpy, len(cells)):
+        return array("L", map(len, cells))
+    if joined is None:
+        joined = "\0".join(cells)
+    data = np.frombuffer(joined.encode("ascii"), dtype=np.uint8)
+    ends = np.flatnonzero(data == 0)
+    if len(ends) != len(cells) - 1:  # NUL characters in the cells
+        return array("L", map(len, cells))
+    lengths = array("L")
+    gaps = np.diff(ends, prepend=-1, append=len(data)) - 1
+    lengths.frombytes(gaps.astype(np.dtype(lengths.typecode)).tobytes())
+    return lengths
+
+
+def max_length(lengths: array, use_numpy: bool = None) -> int:
+    """Get the maximum of an array of cell lengths
+
+    :param lengths: The lengths of the cells of a column
+    :type lengths: array
+    :param use_numpy: Force or disable the NumPy engine, defaults to None (automatic)
+    :type use_numpy: bool, optional
+
+    :return: The maximum length, 0 if the array is empty
+    :rtype: int
+
+    :raises ImportError: If use_numpy is True and NumPy is not installed
+    """
+    if _use_numpy(use_numpy, len(lengths)) and len(lengths):
+        return int(np.frombuffer(lengths, dtype=np.dtype(lengths.typecode)).max())
+    return max(lengths, default=0)
+
+
+def max_length_at(lengths: array, indices: Sequence[int], use_numpy: bool = None) -> int:
+    """Get the maximum of an array of cell lengths, over a subset of the cells
+
+    :param lengths: The lengths of the cells of a column
+    :type lengths: array
+    :param indices: The indices of the cells
+    :type indices: Sequence[int]
+    :param use_numpy: Force or disable the NumPy engine, defaults to None (automatic)
+    :type use_numpy: bool, optional
+
+    :return: The maximum length, 0 if there is no cell
+    :rtype: int
+
+    :raises ImportError: If use_numpy is True and NumPy is not installed
+    """
+    if isinstance(indices, range):
+        return max_length(lengths[indices.start:indices.stop:indices.step], use_numpy)
+    if _use_numpy(use_numpy, len(indices)) and len(indices):
+        if isinstance(indices, array):
+            indices = np.frombuffer(indices, dtype=np.dtype(indices.typecode))
+        values = np.frombuffer(lengths, dtype=np.dtype(lengths.typecode))
+        return int(values[indices].max())
+    return max((lengths[index] for index in indices), default=0)
+
+
+def max_lengths(columns_lengths: Sequence[array], use_numpy: bool = None) -> List[int]:
+    """Get the maximum length of each column
+
+    :param columns_lengths: The lengths of the cells, column by column
+    :type columns_lengths: Sequence[array]
+    :param use_numpy: Force or disable the NumPy engine, defaults to None (automatic)
+    :type use_numpy: bool, optional
+
+    :return: The maximum length of each column
+    :rtype: List[int]
+
+    :raises ImportError: If use_numpy is True and NumPy is not installed
+    """
+    return [max_length(lengths, use_numpy) for lengths in columns_lengths]
+
+
+def merge_widths(widths: Sequence[int], other: Sequence[int]) -> List[int]:
+    """Merge two lists of column widths, keeping the largest width of each column
+
+    :param widths: The first widths
+    :type widths: Sequence[int]
+    :param other: The second widths
+    :type other: Sequence[int]
+
+    :return: The merged widths
+    :rtype: List[int]
+    """
+    return [max(a, b) for a, b in zip_longest(widths, other, fillvalue=0)]
+
+
+def _capped(widths, floors, flex, level):
+    """Cap the width of each flexible column at level times its flex"""
+    return [
+        width if not weight else min(width, max(floor, level * weight))
+        for width, floor, weight in zip(widths, floors, flex)
+    ]
+
+
+def solve_widths(
+    widths: Sequence[int],
+    constraints: Sequence = (),
+    max_width: int = None,
+    overhead: int = 0,
+) -> List[int]:
+    """Solve the width constraints of the columns of a table
+
+    Each column is clamped between its min and max width. If the table is still
+    wider than max_width, the flexible columns shrink, the widest first: each one
+    is capped at the highest level times its flex that makes the table fit, so a
+    single runaway column absorbs the whole shrink. A flexible column never
+    shrinks below its min width, or 1.
+
+    :param widths: The natural width of each column, its longest cell
+    :type widths: Sequence[int]
+    :param constraints: The constraints of each column, None for no constraint,
+        defaults to ()
+    :type constraints: Sequence[ColumnWidth], optional
+    :param max_width: The maximum width of the table, defaults to None (no limit)
+    :type max_width: int, optional
+    :param overhead: The width of the borders and the separators, defaults to 0
+    :type overhead: int, optional
+
+    :return: The width of each column, the table may still be wider than max_width
+        if the min widths do not fit
+    :rtype: List[int]
+    """
+    solved, floors, flex = _clamp(widths, constraints)
+    if max_width is None or sum(solved) + overhead <= max_width:
+        return solved
+    return _shrink(solved, floors, flex, max_width - overhead)
+
+
+def _clamp(widths, constraints):
+    """Clamp each column between its min and max width
+
+    :return: The clamped widths, the widths each column can shrink to and the
+        flex of each column
+    :rtype: Tuple[List[int], List[int], List[int]]
+    """
+    solved, floors, flex = [], [], []
+    for width, constraint in zip_longest(widths, constraints[:len(widths)]):
+        min_width, max_width, weight = 0, None, 1
+        if constraint is not None:
+            min_width, max_width, weight = (
+                constraint.min_width,
+                constraint.max_width,
+                constraint.flex,
+            )
+        if max_width is not None:
+            width = min(width, max_width)
+        width = max(width, min_width)
+        solved.append(width)
+        floors.append(min(width, max(min_width, 1)))
+        flex.append(weight)
+    return solved, floors, flex
+
+
+def _shrink(widths, floors, flex, available):
+    """Shrink the flexible columns to fit the available width, the widest first"""
+    low, high = 0, max(widths, default=0)
+    while low < high:
+        level = (low + high + 1) // 2
+        if sum(_capped(widths, floors, flex, level)) <= available:
+            low = level
+        else:
+            high = level - 1
+    capped = _capped(widths, floors, flex, low)
+    slack = available - sum(capped)
+    for i, width in enumerate(capped):
+        if slack <= 0:
+            break
+        extra = min(slack, widths[i] - width)
+        capped[i] += extra
+        slack -= extra
+    return capped
+
+
+def split_columns(widths: Sequence[int], available: int, separator: int) -> List[List[int]]:
+    """Split consecutive columns into groups fitting an available width
+
+    The columns are added to the current group while it fits, a column wider
+    than the available width is alone in its group.
+
+    :param widths: The width of each column
+    :type widths: Sequence[int]
+    :param available: The width available for each group
+    :type available: int
+    :param separator: The width of the separator between two columns
+    :type separator: int
+
+    :return: The positions of the columns of each group, at least one group
+    :rtype: List[List[int]]
+    """
+    groups = [[]]
+    used = 0
+    for i, width in enumerate(widths):
+        group = groups[-1]
+        if group and used + separator + width > available:
+            group = []
+            groups.append(group)
+        used = used + separator + width if group else width
+        group.append(i)
+    return groups
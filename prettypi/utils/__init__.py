@@ -5,6 +5,7 @@
 - Use the Style class to set the style of the text.
 - Use the BackgroundColor class to set the background color of the text.
 - Use the Align class to align the text.
+- Use the display_width module to measure and pad text by its width in a terminal.
 
 """
 
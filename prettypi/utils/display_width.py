@@ -0,0 +1,371 @@
+""" This module measures and pads strings by their width in a terminal.
+
+Plain ASCII strings are measured with len(), without looking at their characters.
+The other strings are measured character by character: East Asian wide characters
+and emojis take two columns, combining marks and zero-width characters take none,
+and the ANSI color and style codes (SGR sequences) are stripped by a precompiled
+regex. The width of these strings is cached, as the same cells are measured many
+times.
+
+**Example:**
+
+.. code-block:: python
+
+    from prettypi.utils.display_width import display_width, ljust
+
+    print(display_width("コーヒー"), display_width("coffee"))
+    print(f"[{ljust('コーヒー', 10)}]")
+
+"""
+
+import re
+import textwrap
+from bisect import bisect_right
+from functools import lru_cache
+from typing import List
+from unicodedata import category
+
+# Ranges of the characters taking two columns: the East Asian wide and fullwidth
+# characters and the emojis with an emoji presentation (Unicode 14).
+WIDE_RANGES = (
+    (0x1100, 0x115F),
+    (0x231A, 0x231B),
+    (0x2329, 0x232A),
+    (0x23E9, 0x23EC),
+    (0x23F0, 0x23F0),
+    (0x23F3, 0x23F3),
+    (0x25FD, 0x25FE),
+    (0x2614, 0x2615),
+    (0x2648, 0x2653),
+    (0x267F, 0x267F),
+    (0x2693, 0x2693),
+    (0x26A1, 0x26A1),
+    (0x26AA, 0x26AB),
+    (0x26BD, 0x26BE),
+    (0x26C4, 0x26C5),
+    (0x26CE, 0x26CE),
+    (0x26D4, 0x26D4),
+    (0x26EA, 0x26EA),
+    (0x26F2, 0x26F3),
+    (0x26F5, 0x26F5),
+    (0x26FA, 0x26FA),
+    (0x26FD, 0x26FD),
+    (0x2705, 0x2705),
+    (0x270A, 0x270B),
+    (0x2728, 0x2728),
+    (0x274C, 0x274C),
+    (0x274E, 0x274E),
+    (0x2753, 0x2755),
+    (0x2757, 0x2757),
+    (0x2795, 0x2797),
+    (0x27B0, 0x27B0),
+    (0x27BF, 0x27BF),
+    (0x2B1B, 0x2B1C),
+    (0x2B50, 0x2B50),
+    (0x2B55, 0x2B55),
+    (0x2E80, 0x303E),
+    (0x3041, 0x3247),
+    (0x3250, 0x4DBF),
+    (0x4E00, 0xA4C6),
+    (0xA960, 0xA97C),
+    (0xAC00, 0xD7A3),
+    (0xF900, 0xFAFF),
+    (0xFE10, 0xFE19),
+    (0xFE30, 0xFE6B),
+    (0xFF01, 0xFF60),
+    (0xFFE0, 0xFFE6),
+    (0x16FE0, 0x16FE4),
+    (0x16FF0, 0x16FF1),
+    (0x17000, 0x18CD5),
+    (0x18D00, 0x18D08),
+    (0x1AFF0, 0x1B2FB),
+    (0x1F004, 0x1F004),
+    (0x1F0CF, 0x1F0CF),
+    (0x1F18E, 0x1F18E),
+    (0x1F191, 0x1F19A),
+    (0x1F200, 0x1F202),
+    (0x1F210, 0x1F23B),
+    (0x1F240, 0x1F248),
+    (0x1F250, 0x1F251),
+    (0x1F260, 0x1F265),
+    (0x1F300, 0x1F320),
+    (0x1F32D, 0x1F335),
+    (0x1F337, 0x1F37C),
+    (0x1F37E, 0x1F393),
+    (0x1F3A0, 0x1F3CA),
+    (0x1F3CF, 0x1F3D3),
+    (0x1F3E0, 0x1F3F0),
+    (0x1F3F4, 0x1F3F4),
+    (0x1F3F8, 0x1F43E),
+    (0x1F440, 0x1F440),
+    (0x1F442, 0x1F4FC),
+    (0x1F4FF, 0x1F53D),
+    (0x1F54B, 0x1F54E),
+    (0x1F550, 0x1F567),
+    (0x1F57A, 0x1F57A),
+    (0x1F595, 0x1F596),
+    (0x1F5A4, 0x1F5A4),
+    (0x1F5FB, 0x1F64F),
+    (0x1F680, 0x1F6C5),
+    (0x1F6CC, 0x1F6CC),
+    (0x1F6D0, 0x1F6D2),
+    (0x1F6D5, 0x1F6D7),
+    (0x1F6DD, 0x1F6DF),
+    (0x1F6EB, 0x1F6EC),
+    (0x1F6F4, 0x1F6FC),
+    (0x1F7E0, 0x1F7EB),
+    (0x1F7F0, 0x1F7F0),
+    (0x1F90C, 0x1F93A),
+    (0x1F93C, 0x1F945),
+    (0x1F947, 0x1F9FF),
+    (0x1FA70, 0x1FA74),
+    (0x1FA78, 0x1FA7C),
+    (0x1FA80, 0x1FA86),
+    (0x1FA90, 0x1FAAC),
+    (0x1FAB0, 0x1FABA),
+    (0x1FAC0, 0x1FAC5),
+    (0x1FAD0, 0x1FAD9),
+    (0x1FAE0, 0x1FAE7),
+    (0x1FAF0, 0x1FAF6),
+    (0x20000, 0x2FFFD),
+    (0x30000, 0x3FFFD),
+)
+_WIDE_STARTS = [start for start, _ in WIDE_RANGES]
+_ZERO_WIDTH_CATEGORIES = ("Mn", "Me", "Cf", "Cc")
+ELLIPSIS = "…"
+ESCAPE = "\x1b"
+SGR_PATTERN = re.compile(r"(\x1b\[[0-9;:]*m)")
+ZERO_WIDTH_JOINER = "\u200d"
+EMOJI_PRESENTATION = "\ufe0f"
+CACHE_SIZE = 65536
+
+
+def is_plain(text: str) -> bool:
+    """Check if a string is ASCII text without escape codes, measured by len()
+
+    :param text: The string
+    :type text: str
+
+    :return: True if every character of the string takes one column
+    :rtype: bool
+    """
+    return text.isascii() and ESCAPE not in text
+
+
+def strip_ansi(text: str) -> str:
+    """Remove the ANSI color and style codes of a string
+
+    :param text: The string
+    :type text: str
+
+    :return: The string without its SGR escape sequences
+    :rtype: str
+    """
+    if ESCAPE not in text:
+        return text
+    return SGR_PATTERN.sub("", text)
+
+
+@lru_cache(maxsize=4096)
+def char_width(char: str) -> int:
+    """Get the number of columns taken by a character in a terminal
+
+    :param char: The character
+    :type char: str
+
+    :return: 0 for the combining and zero-width characters, 2 for the wide ones, else 1
+    :rtype: int
+    """
+    code = ord(char)
+    if code < 0x80:
+        return 1
+    index = bisect_right(_WIDE_STARTS, code) - 1
+    if index >= 0 and code <= WIDE_RANGES[index][1]:
+        return 2
+    if category(char) in _ZERO_WIDTH_CATEGORIES:
+        return 0
+    return 1
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _wide_width(text: str) -> int:
+    """Measure a styled or non-ASCII string character by character
+
+    A character following a zero-width joiner is part of the same emoji, and
+    the emoji presentation selector turns a narrow character into an emoji.
+    """
+    if ESCAPE in text:
+        text = SGR_PATTERN.sub("", text)
+        if text.isascii() and ESCAPE not in text:
+            return len(text)
+    if ZERO_WIDTH_JOINER not in text and EMOJI_PRESENTATION not in text:
+        return sum(map(char_width, text))
+    width = 0
+    previous = ""
+    last = 0
+    for char in text:
+        if previous == ZERO_WIDTH_JOINER:
+            last = 0
+        elif char == EMOJI_PRESENTATION and last == 1:
+            width += 1
+            last = 2
+        else:
+            last = char_width(char)
+            width += last
+        previous = char
+    return width
+
+
+def display_width(text: str) -> int:
+    """Get the number of columns taken by a string in a terminal
+
+    The ANSI color and style codes of the string take no column.
+
+    :param text: The string
+    :type text: str
+
+    :return: The width of the string
+    :rtype: int
+
+    **Example:**
+
+    .. code-block:: python
+
+        from prettypi.utils.display_width import display_width
+
+        print(display_width("abc"), display_width("日本"), display_width("☕ tea"))
+        print(display_width("\x1b[31mred\x1b[0m"))
+
+    """
+    if text.isascii() and ESCAPE not in text:
+        return len(text)
+    return _wide_width(text)
+
+
+def ljust(text: str, width: int) -> str:
+    """Pad a string on the right to a display width
+
+    :param text: The string
+    :type text: str
+    :param width: The display width of the padded string
+    :type width: int
+
+    :return: The padded string, or the string itself if it is wider
+    :rtype: str
+    """
+    if text.isascii() and ESCAPE not in text:
+        return text.ljust(width)
+    return text + " " * (width - _wide_width(text))
+
+
+def rjust(text: str, width: int) -> str:
+    """Pad a string on the left to a display width
+
+    :param text: The string
+    :type text: str
+    :param width: The display width of the padded string
+    :type width: int
+
+    :return: The padded string, or the string itself if it is wider
+    :rtype: str
+    """
+    if text.isascii() and ESCAPE not in text:
+        return text.rjust(width)
+    return " " * (width - _wide_width(text)) + text
+
+
+def center(text: str, width: int) -> str:
+    """Pad a string on both sides to a display width, like str.center
+
+    :param text: The string
+    :type text: str
+    :param width: The display width of the padded string
+    :type width: int
+
+    :return: The padded string, or the string itself if it is wider
+    :rtype: str
+    """
+    if text.isascii() and ESCAPE not in text:
+        return text.center(width)
+    margin = width - _wide_width(text)
+    if margin <= 0:
+        return text
+    left = margin // 2 + (margin & width & 1)
+    return " " * left + text + " " * (margin - left)
+
+
+def truncate(text: str, width: int) -> str:
+    """Cut a string to its longest prefix fitting in a display width
+
+    :param text: The string
+    :type text: str
+    :param width: The maximum display width
+    :type width: int
+
+    :return: The string, or its longest prefix not wider than width
+    :rtype: str
+    """
+    if text.isascii() and ESCAPE not in text:
+        return text[:max(width, 0)]
+    if ESCAPE in text:
+        return _truncate_styled(text, width)
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if display_width(text[:middle]) <= width:
+            low = middle
+        else:
+            high = middle - 1
+    return text[:low]
+
+
+def ellipsize(text: str, width: int) -> str:
+    """Cut a string wider than a display width, ending it with an ellipsis
+
+    :param text: The string
+    :type text: str
+    :param width: The maximum display width
+    :type width: int
+
+    :return: The string, or its longest prefix followed by an ellipsis
+    :rtype: str
+    """
+    if display_width(text) <= width:
+        return text
+    return truncate(text, width - 1) + ELLIPSIS * (width > 0)
+
+
+def wrap(text: str, width: int) -> List[str]:
+    """Wrap a string on lines of a display width
+
+    The lines are broken on whitespace when possible, the words wider than the
+    width are split. The ANSI codes of a styled string are removed.
+
+    :param text: The string
+    :type text: str
+    :param width: The display width of the lines, at least 1
+    :type width: int
+
+    :return: The lines, at least one
+    :rtype: List[str]
+    """
+    if display_width(text) <= width:
+        return [text]
+    text = strip_ansi(text)
+    if text.isascii():
+        return textwrap.wrap(text, width) or [""]
+    lines = []
+    while text:
+        line = truncate(text, width) or text[0]
+        lines.append(line)
+        text = text[len(line):]
+    return lines
+
+
+def _truncate_styled(text, width):
+    """Cut the visible text of a styled string, keeping every escape code"""
+    parts = SGR_PATTERN.split(text)
+    for i in range(0, len(parts), 2):
+        parts[i] = truncate(parts[i], width)
+        width -= display_width(parts[i])
+    return "".join(parts)
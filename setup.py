@@ -20,6 +20,11 @@ setup(
     packages=find_packages(exclude=("tests")),
     install_requires=[
     ],
+    extras_require={
+        "numpy": ["numpy"],
+        "pandas": ["pandas"],
+        "arrow": ["pyarrow"],
+    },
     classifiers=[
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3"
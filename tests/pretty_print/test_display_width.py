@@ -0,0 +1,134 @@
+""" Test display_width module. """
+
+import pytest
+
+from prettypi.utils import Color, Emoji
+from prettypi.utils.display_width import (
+    center,
+    char_width,
+    display_width,
+    ellipsize,
+    is_plain,
+    ljust,
+    rjust,
+    strip_ansi,
+    truncate,
+    wrap,
+)
+
+RED = f"{Color.RED}red{Color.RESET}"
+
+
+class TestDisplayWidth:
+    @pytest.mark.parametrize(
+        "char, expected",
+        [
+            pytest.param("a", 1, id="ascii"),
+            pytest.param("é", 1, id="latin"),
+            pytest.param("日", 2, id="cjk"),
+            pytest.param("ｱ", 1, id="halfwidth"),
+            pytest.param("Ａ", 2, id="fullwidth"),
+            pytest.param("😊", 2, id="emoji"),
+            pytest.param("\u0301", 0, id="combining"),
+            pytest.param("\u200b", 0, id="zero width space"),
+        ],
+    )
+    def test_char_width(self, char, expected):
+        assert char_width(char) == expected
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            pytest.param("", 0, id="empty"),
+            pytest.param("abc", 3, id="ascii"),
+            pytest.param("コーヒー", 8, id="japanese"),
+            pytest.param("tea 日本茶", 10, id="mixed"),
+            pytest.param("e\u0301", 1, id="combined"),
+            pytest.param("\u2764\ufe0f", 2, id="emoji presentation"),
+            pytest.param("\U0001f468\u200d\U0001f469\u200d\U0001f467", 2, id="joined emoji"),
+            pytest.param(RED, 3, id="styled"),
+            pytest.param(f"{Color.RED}日本{Color.RESET}", 4, id="styled wide"),
+            pytest.param("\x1b[1;31mbold\x1b[0m", 4, id="combined codes"),
+        ],
+    )
+    def test_display_width(self, text, expected):
+        assert display_width(text) == expected
+
+    def test_display_width_emojis(self):
+        for emoji in Emoji:
+            assert display_width(emoji.value) in (1, 2)
+        assert display_width(Emoji.SMILE.value) == 2
+        assert display_width(Emoji.COFFEE.value) == 2
+
+    @pytest.mark.parametrize(
+        "function, text, width, expected",
+        [
+            pytest.param(ljust, "abc", 5, "abc  ", id="ljust ascii"),
+            pytest.param(ljust, "日本", 6, "日本  ", id="ljust wide"),
+            pytest.param(ljust, "日本", 3, "日本", id="ljust too wide"),
+            pytest.param(rjust, "abc", 5, "  abc", id="rjust ascii"),
+            pytest.param(rjust, "日本", 6, "  日本", id="rjust wide"),
+            pytest.param(center, "ab", 7, "ab".center(7), id="center ascii"),
+            pytest.param(center, "日本", 7, "  日本 ", id="center wide odd"),
+            pytest.param(center, "日本", 8, "  日本  ", id="center wide even"),
+            pytest.param(center, "日本", 2, "日本", id="center too wide"),
+            pytest.param(ljust, RED, 5, f"{RED}  ", id="ljust styled"),
+            pytest.param(rjust, RED, 5, f"  {RED}", id="rjust styled"),
+            pytest.param(center, RED, 5, f" {RED} ", id="center styled"),
+        ],
+    )
+    def test_pad(self, function, text, width, expected):
+        assert function(text, width) == expected
+
+    @pytest.mark.parametrize(
+        "text, width, expected",
+        [
+            pytest.param("abcdef", 3, "abc", id="ascii"),
+            pytest.param("abc", -1, "", id="negative"),
+            pytest.param("日本語", 4, "日本", id="wide"),
+            pytest.param("日本語", 5, "日本", id="wide cut"),
+            pytest.param("日本", 10, "日本", id="fits"),
+            pytest.param(RED, 2, f"{Color.RED}re{Color.RESET}", id="styled"),
+        ],
+    )
+    def test_truncate(self, text, width, expected):
+        assert truncate(text, width) == expected
+
+    @pytest.mark.parametrize(
+        "text, plain, stripped",
+        [
+            pytest.param("abc", True, "abc", id="ascii"),
+            pytest.param("日本", False, "日本", id="wide"),
+            pytest.param(RED, False, "red", id="styled"),
+        ],
+    )
+    def test_strip_ansi(self, text, plain, stripped):
+        assert is_plain(text) == plain
+        assert strip_ansi(text) == stripped
+
+    @pytest.mark.parametrize(
+        "text, width, expected",
+        [
+            pytest.param("abcdef", 6, "abcdef", id="fits"),
+            pytest.param("abcdef", 4, "abc…", id="ascii"),
+            pytest.param("日本語", 4, "日…", id="wide"),
+            pytest.param("abc", 0, "", id="empty"),
+        ],
+    )
+    def test_ellipsize(self, text, width, expected):
+        assert ellipsize(text, width) == expected
+
+    @pytest.mark.parametrize(
+        "text, width, expected",
+        [
+            pytest.param("abc", 5, ["abc"], id="fits"),
+            pytest.param("hello big world", 9, ["hello big", "world"], id="words"),
+            pytest.param("x" * 7, 3, ["xxx", "xxx", "x"], id="long word"),
+            pytest.param("日本語です", 4, ["日本", "語で", "す"], id="wide"),
+            pytest.param("日本", 1, ["日", "本"], id="wider than width"),
+            pytest.param(f"{RED} {RED}", 4, ["red", "red"], id="styled"),
+            pytest.param(" " * 5, 2, [""], id="blank"),
+        ],
+    )
+    def test_wrap(self, text, width, expected):
+        assert wrap(text, width) == expected
@@ -1,6 +1,6 @@
 import pytest
 from prettypi.pretty_print import StyledStr
-from prettypi.utils import Color, Style, BackgroundColor, Align
+from prettypi.utils import Color, Style, BackgroundColor, Align, Emoji
 
 
 class TestStyledStr:
@@ -334,9 +334,39 @@ class TestStyledStr:
                 f"{Style.BOLD}{BackgroundColor.GREEN}   Toto   {Style.RESET}",
                 id="style and background_color and center align",
             ),
+            pytest.param(
+                {"string": "日本"},
+                {"align": Align.LEFT, "width": 10},
+                "日本      ",
+                id="wide left align",
+            ),
+            pytest.param(
+                {"string": "日本"},
+                {"align": Align.RIGHT, "width": 10},
+                "      日本",
+                id="wide right align",
+            ),
+            pytest.param(
+                {"string": "日本"},
+                {"align": Align.CENTER, "width": 10},
+                "   日本   ",
+                id="wide center align",
+            ),
         ],
     )
     def test_str_with_align(self, params, align, expected):
         styled_str = StyledStr(**params)
         styled_str.set_align(**align)
         assert str(styled_str) == expected
+
+    @pytest.mark.parametrize(
+        "string, expected",
+        [
+            pytest.param("Toto", 4, id="ascii"),
+            pytest.param("コーヒー", 8, id="wide"),
+            pytest.param(f"{Emoji.COFFEE} Toto", 7, id="emoji"),
+            pytest.param(f"{Color.BLUE}Toto{Color.RESET}", 4, id="pre-colored"),
+        ],
+    )
+    def test_len(self, string, expected):
+        assert len(StyledStr(string, color=Color.RED)) == expected
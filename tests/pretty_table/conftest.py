@@ -0,0 +1,30 @@
+import pytest
+
+from prettypi.pretty_table import TableConfig
+
+
+def custom_config(row_separator="┈", data_bottom="═"):
+    return (
+        TableConfig.builder()
+        .set_border(top="═", bottom="═", left="│ ", right=" │", data_bottom=data_bottom)
+        .set_column_separator(" ║ ")
+        .set_row_separator(row_separator)
+        .build()
+    )
+
+
+def wrap_config():
+    return TableConfig.builder().set_column_width(1, max_width=4).build()
+
+
+CONFIG_FACTORIES = {"default": TableConfig, "custom": custom_config, "wrapped": wrap_config}
+
+
+@pytest.fixture
+def build_config():
+    return custom_config
+
+
+@pytest.fixture(params=["default", "custom"], ids=["default config", "custom config"])
+def config_factory(request):
+    return CONFIG_FACTORIES[request.param]
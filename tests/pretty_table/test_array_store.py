@@ -0,0 +1,178 @@
+from array import array
+
+import pytest
+
+from prettypi.pretty_table.array_store import ArrayStore
+from prettypi.pretty_table.table import PrettyTable
+
+np = pytest.importorskip("numpy")
+
+
+class TestArrayStore:
+
+    def test_from_numpy(self):
+        store = ArrayStore.from_numpy(np.array([[1, 22], [333, 4]]), ["A", "B"])
+        assert len(store) == 2
+        assert store.header == ["A", "B"]
+        assert store.max_lengths() == [3, 2]
+        assert store.max_row_size() == 2
+        assert store.row(1) == ["333", "4"]
+        assert store.project(0, [1, 2]) == ["22", ""]
+        assert list(store.iter_rows([1, 0])) == [["333", "4"], ["1", "22"]]
+        assert store.column(0) == ["1", "333"]
+        assert list(store.column_lengths(1)) == [2, 1]
+
+    @pytest.mark.parametrize(
+        "values, expected",
+        [
+            pytest.param([5, -123, 42], 4, id="negative integers"),
+            pytest.param([5, 12345, 0], 5, id="positive integers"),
+            pytest.param([0.5, -1.25], 5, id="floats"),
+            pytest.param(["a", "abc"], 3, id="strings"),
+        ],
+    )
+    def test_max_lengths(self, values, expected):
+        assert ArrayStore.from_numpy(np.array(values)).max_lengths() == [expected]
+
+    def test_from_numpy_one_dimension(self):
+        store = ArrayStore.from_numpy(np.array([1.5, 2.25]))
+        assert store.nb_columns() == 1
+        assert store.max_lengths() == [4]
+
+    def test_from_numpy_invalid(self):
+        with pytest.raises(ValueError) as e:
+            ArrayStore.from_numpy(np.zeros((2, 2, 2)))
+        assert e.match("Invalid array: 3 dimensions")
+
+    def test_chunks(self, mocker):
+        mocker.patch("prettypi.pretty_table.array_store.ARRAY_CHUNK_SIZE", 3)
+        values = np.arange(10) * 10
+        store = ArrayStore.from_numpy(values)
+        assert store.max_lengths() == [2]
+        assert list(store.column_lengths(0)) == [1] + [2] * 9
+        assert [row[0] for row in store.iter_rows(range(10))] == list(map(str, values))
+
+    @pytest.mark.parametrize(
+        "indices",
+        [
+            pytest.param(range(1, 9), id="range"),
+            pytest.param(range(8, 0, -2), id="range with step"),
+            pytest.param(array("L", [9, 0, 4, 4, 7]), id="array"),
+            pytest.param([3, 1, 2], id="list"),
+            pytest.param(iter([5, 6, 0, 2]), id="iterator"),
+        ],
+    )
+    @pytest.mark.parametrize("kind", ["numpy", "arrow"])
+    def test_iter_rows_chunks(self, mocker, indices, kind):
+        mocker.patch("prettypi.pretty_table.array_store.ARRAY_CHUNK_SIZE", 3)
+        values = np.arange(20).reshape(10, 2)
+        if kind == "numpy":
+            store = ArrayStore.from_numpy(values)
+        else:
+            pa = pytest.importorskip("pyarrow")
+            store = ArrayStore.from_arrow(pa.table({"A": values[:, 0], "B": values[:, 1]}))
+        positions = list(indices)
+        expected = [[str(2 * i), str(2 * i + 1)] for i in positions]
+        if not isinstance(indices, (range, array, list)):
+            indices = iter(positions)
+        assert list(store.iter_rows(indices)) == expected
+        if not isinstance(indices, (range, array, list)):
+            indices = iter(positions)
+        assert list(store.iter_rows(indices, [1, 2])) == [[b, ""] for _, b in expected]
+
+    def test_where_reads_chunks(self, mocker):
+        pt = PrettyTable.from_numpy(np.arange(20).reshape(10, 2), ["A", "B"])
+        spy = mocker.spy(ArrayStore, "project")
+        view = pt.select(["B"]).where(lambda row: int(row[0]) % 4 == 1)
+        assert list(view.indices) == [0, 2, 4, 6, 8]
+        assert spy.call_count == 0
+
+    def test_from_dataframe(self):
+        pd = pytest.importorskip("pandas")
+        df = pd.DataFrame({"Id": [1, 2], "Name": ["apple", "banana"]})
+        store = ArrayStore.from_dataframe(df)
+        assert store.header == ["Id", "Name"]
+        assert list(store.iter_rows(range(2))) == [["1", "apple"], ["2", "banana"]]
+
+    def test_from_dataframe_missing_cells(self):
+        pd = pytest.importorskip("pandas")
+        df = pd.DataFrame(
+            {
+                "Count": pd.array([1, None, 3], dtype="Int64"),
+                "Name": ["apple", None, "cherry"],
+                "Price": [1.5, float("nan"), 2.0],
+                "Date": pd.to_datetime(["2024-01-01 00:00", None, "2024-03-05 10:30"]),
+            }
+        )
+        store = ArrayStore.from_dataframe(df)
+        assert list(store.iter_rows(range(3))) == [
+            ["1", "apple", "1.5", "2024-01-01 00:00:00"],
+            ["", "", "", ""],
+            ["3", "cherry", "2.0", "2024-03-05 10:30:00"],
+        ]
+        assert store.max_lengths() == [1, 6, 3, 19]
+        assert list(store.column_lengths(3)) == [19, 0, 19]
+
+    def test_from_dataframe_index(self):
+        pd = pytest.importorskip("pandas")
+        df = pd.DataFrame({"Name": ["apple", None]}, index=[10, 20])
+        store = ArrayStore.from_dataframe(df)
+        assert list(store.iter_rows([1, 0])) == [[""], ["apple"]]
+
+    def test_from_arrow(self):
+        pa = pytest.importorskip("pyarrow")
+        table = pa.table({"Id": [1, 22], "Name": ["apple", None]})
+        store = ArrayStore.from_arrow(table)
+        assert store.header == ["Id", "Name"]
+        assert store.max_lengths() == [2, 5]
+        assert list(store.iter_rows([1, 0])) == [["22", ""], ["1", "apple"]]
+        assert list(store.column_lengths(1)) == [5, 0]
+
+    @pytest.mark.parametrize(
+        "values, expected",
+        [
+            pytest.param([[1.5, 2]], True, id="numbers"),
+            pytest.param([["a", "b"]], True, id="ascii strings"),
+            pytest.param([["a", "é"]], False, id="multibyte strings"),
+        ],
+    )
+    def test_is_ascii(self, values, expected):
+        store = ArrayStore.from_numpy(np.array(values))
+        assert store.is_ascii() == expected
+        assert not store.is_ragged()
+
+    def test_wide_cells(self):
+        store = ArrayStore.from_numpy(np.array([["コーヒー", "a"], ["tea", "b"]]))
+        assert store.max_lengths() == [8, 1]
+        assert list(store.column_lengths(0)) == [8, 3]
+        assert store.wide_columns() == {0}
+
+    def test_styled_cells(self):
+        store = ArrayStore.from_numpy(np.array([["\x1b[31mred\x1b[0m", "a"]]))
+        assert store.max_lengths() == [3, 1]
+        assert store.wide_columns() == {0}
+        assert store.is_ascii()
+
+    def test_wide_cells_arrow(self):
+        pa = pytest.importorskip("pyarrow")
+        store = ArrayStore.from_arrow(pa.table({"Name": ["日本", None], "Id": [1, 2]}))
+        assert store.max_lengths() == [4, 1]
+        assert store.wide_columns() == {0}
+
+    def test_append_rows(self):
+        with pytest.raises(ValueError):
+            ArrayStore.from_numpy(np.array([[1]])).append_rows([["2"]])
+
+    def test_table(self):
+        values = np.array([[3, 10], [1, 200], [2, 3]])
+        pt = PrettyTable.from_numpy(values, ["A", "B"])
+        expected = PrettyTable(values.astype(str).tolist(), ["A", "B"])
+        assert str(pt) == str(expected)
+        pt.sort_by("A")
+        expected.sort_by("A")
+        assert pt.page(0, 2) == expected.page(0, 2)
+        assert str(pt.select(["B"])) == str(expected.select(["B"]))
+
+    def test_empty_table(self):
+        pt = PrettyTable.from_numpy(np.zeros((0, 2)), ["A", "B"])
+        assert str(pt) == str(PrettyTable([], ["A", "B"]))
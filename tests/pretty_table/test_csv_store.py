@@ -0,0 +1,112 @@
+import pickle
+
+import pytest
+
+from prettypi.pretty_table.csv_store import CsvStore
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_bytes('Id,Name\n1,apple\n22,"ban,ana"\n3,"multi\nline"\n4\n'.encode())
+    return str(path)
+
+
+class TestCsvStore:
+
+    def test_scan(self, csv_file):
+        store = CsvStore(csv_file)
+        assert store.header == ["Id", "Name"]
+        assert len(store) == 4
+        assert store.offsets.typecode == "Q"
+        assert list(store.offsets) == [8, 16, 29, 44, 46]
+        assert store.max_lengths() == [2, 10]
+        assert store.max_row_size() == 2
+
+    def test_rows(self, csv_file):
+        store = CsvStore(csv_file)
+        assert [store.row(i) for i in range(len(store))] == [
+            ["1", "apple"],
+            ["22", "ban,ana"],
+            ["3", "multi\nline"],
+            ["4"],
+        ]
+        assert store.project(3, [1, 0]) == ["", "4"]
+
+    def test_columns(self, csv_file):
+        store = CsvStore(csv_file)
+        assert store.nb_columns() == 2
+        assert store.column(1) == ["apple", "ban,ana", "multi\nline", ""]
+        assert list(store.column_lengths(0)) == [1, 2, 1, 1]
+        assert list(store.column_lengths(1)) == [5, 7, 10, 0]
+
+    def test_no_header(self, csv_file):
+        store = CsvStore(csv_file, has_header=False)
+        assert store.header is None
+        assert len(store) == 5
+        assert store.row(0) == ["Id", "Name"]
+
+    @pytest.mark.parametrize(
+        "content, expected",
+        [
+            pytest.param(b"", [], id="empty file"),
+            pytest.param(b"a\tb\n", [["a", "b"]], id="tsv"),
+            pytest.param(b"a\tb\r\nc\td", [["a", "b"], ["c", "d"]], id="no final newline"),
+        ],
+    )
+    def test_files(self, tmp_path, content, expected):
+        path = tmp_path / "data.tsv"
+        path.write_bytes(content)
+        store = CsvStore(str(path), "\t", has_header=False)
+        assert [store.row(i) for i in range(len(store))] == expected
+        store.close()
+
+    def test_is_ragged_and_ascii(self, csv_file, tmp_path):
+        store = CsvStore(csv_file)
+        assert store.is_ragged()
+        assert store.is_ascii()
+        path = tmp_path / "other.csv"
+        path.write_bytes("A,B\n1,é\n".encode())
+        store = CsvStore(str(path))
+        assert not store.is_ragged()
+        assert not store.is_ascii()
+
+    def test_wide_cells(self, tmp_path):
+        path = tmp_path / "wide.csv"
+        path.write_bytes("A,B\nabc,1\nコーヒー,2\n".encode())
+        store = CsvStore(str(path))
+        assert store.max_lengths() == [8, 1]
+        assert store.wide_columns() == {0}
+        assert list(store.column_lengths(0)) == [3, 8]
+        store.close()
+
+    def test_styled_cells(self, tmp_path):
+        path = tmp_path / "styled.csv"
+        path.write_bytes(b"A,B\nabc,\x1b[31mred\x1b[0m\n")
+        store = CsvStore(str(path))
+        assert store.max_lengths() == [3, 3]
+        assert store.wide_columns() == {1}
+        assert store.is_ascii()
+        store.close()
+
+    def test_context_manager(self, csv_file):
+        with CsvStore(csv_file) as store:
+            assert store.row(0) == ["1", "apple"]
+        with pytest.raises(ValueError):
+            store.row(0)
+        store.close()
+
+    def test_append_rows(self, csv_file):
+        with pytest.raises(ValueError) as e:
+            CsvStore(csv_file).append_rows([["5", "kiwi"]])
+        assert e.match("Cannot append rows")
+
+    def test_pickle(self, csv_file):
+        store = CsvStore(csv_file)
+        store.column_lengths(0)
+        copy = pickle.loads(pickle.dumps(store))
+        assert copy._lengths is None
+        assert copy.max_lengths() == store.max_lengths()
+        assert list(copy.iter_rows(range(len(store)))) == list(
+            store.iter_rows(range(len(store)))
+        )
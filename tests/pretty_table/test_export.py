@@ -0,0 +1,83 @@
+import pytest
+
+from prettypi.pretty_table import TableConfig
+from prettypi.pretty_table.export import export_fixed_width, is_fixed_width, write_block
+from prettypi.pretty_table.table import PrettyTable
+from prettypi.pretty_table.utils import ColumnStore, RowLayout
+
+
+def store(rows):
+    result = ColumnStore()
+    result.append_rows(rows)
+    return result
+
+
+class TestExport:
+
+    @pytest.mark.parametrize(
+        "rows, encoding, expected",
+        [
+            pytest.param([["a", "b"], ["c", "d"]], "utf-8", True, id="ascii"),
+            pytest.param([["a", "é"]], "utf-8", False, id="multibyte"),
+            pytest.param([["a", "b"], ["c"]], "utf-8", False, id="ragged"),
+            pytest.param([["a"]], "utf-16", False, id="wide encoding"),
+            pytest.param([["\x1b[31ma\x1b[0m"], ["b"]], "utf-8", False, id="styled"),
+        ],
+    )
+    def test_is_fixed_width(self, rows, encoding, expected):
+        assert is_fixed_width(store(rows), encoding) == expected
+
+    def test_write_block(self, tmp_path):
+        path = tmp_path / "out.txt"
+        path.write_bytes(b"#" * 18)
+        layout = RowLayout("", "", "|", [1], "---")
+        rows = store([["1"], ["2"], ["3"]])
+        assert write_block(2, [2, 0], False, rows, layout, str(path), "utf-8") == 16
+        assert path.read_bytes() == b"## 3 \n---\n 1 \n---\n"
+
+    @pytest.mark.parametrize(
+        "separators",
+        [
+            pytest.param(None, id="default config"),
+            pytest.param(("┈", "═"), id="custom config"),
+            pytest.param(("", "═"), id="no row separator"),
+            pytest.param(("", ""), id="no separator"),
+            pytest.param(("-", ""), id="no data bottom"),
+        ],
+    )
+    @pytest.mark.parametrize("nb_rows", [1, 7, 9])
+    def test_export_parallel(self, tmp_path, mocker, build_config, separators, nb_rows):
+        config = TableConfig() if separators is None else build_config(*separators)
+        rows = [[str(i * 37), "x" * (i % 4)] for i in range(nb_rows)]
+        pt = PrettyTable(rows, ["Id", "N"], config)
+        pt.sort_by("Id", reverse=True)
+        spy = mocker.patch("prettypi.pretty_table.export.dump_lines")
+        path = tmp_path / "out.txt"
+        export_fixed_width(pt.json_rows_manager, str(path), "utf-8", 2, "thread", 3)
+        assert spy.call_count == 0
+        assert path.read_text("utf-8") == str(pt) + "\n"
+
+    @pytest.mark.parametrize(
+        "rows",
+        [
+            pytest.param([["é", "1"], ["a", "2"]], id="multibyte"),
+            pytest.param([["a", "1"], ["b"]], id="ragged"),
+            pytest.param([], id="empty"),
+        ],
+    )
+    def test_export_sequential(self, tmp_path, mocker, build_config, rows):
+        pt = PrettyTable(rows, ["A", "B"], build_config())
+        spy = mocker.patch("prettypi.pretty_table.export.write_block")
+        path = tmp_path / "out.txt"
+        pt.export(str(path), workers=2, executor="thread")
+        assert path.read_text("utf-8") == str(pt) + "\n"
+        assert spy.call_count == 0
+
+    def test_export_width_constraints(self, tmp_path, mocker):
+        config = TableConfig.builder().set_max_width(10).build()
+        pt = PrettyTable([["a", "bbbbbbbbbb"]] * 5, ["A", "B"], config)
+        spy = mocker.patch("prettypi.pretty_table.export.write_block")
+        path = tmp_path / "out.txt"
+        pt.export(str(path), workers=2, executor="thread")
+        assert path.read_text("utf-8") == str(pt) + "\n"
+        assert spy.call_count == 0
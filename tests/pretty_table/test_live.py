@@ -0,0 +1,157 @@
+import io
+import re
+
+import pytest
+
+from prettypi.pretty_table.live import LiveTable
+from prettypi.pretty_table.table import PrettyTable
+from prettypi.utils import Color
+from prettypi.utils.display_width import display_width, strip_ansi
+
+
+class Screen:
+    """Terminal emulator handling the escape sequences written by LiveTable, colors
+    are dropped"""
+
+    TOKEN = re.compile(r"\x1b\[(\d*)([A-Za-z])|(.)", re.S)
+
+    def __init__(self):
+        self.lines = []
+        self.row = 0
+        self.column = 0
+
+    def write(self, text):
+        for match in self.TOKEN.finditer(text):
+            count, command, char = match.groups()
+            if command is not None:
+                self._command(int(count or 1), command)
+            elif char == "\r":
+                self.column = 0
+            elif char == "\n":
+                self.row += 1
+                self.column = 0
+            else:
+                self._put(char)
+
+    def _command(self, count, command):
+        if command == "A":
+            self.row -= count
+        elif command == "B":
+            self.row += count
+        elif command == "G":
+            self.column = count - 1
+        elif command == "K" and self.row < len(self.lines):
+            del self.lines[self.row][self.column:]
+        elif command == "J":
+            del self.lines[self.row + (self.column > 0):]
+
+    def _put(self, char):
+        while len(self.lines) <= self.row:
+            self.lines.append([])
+        line = self.lines[self.row]
+        width = display_width(char)
+        line.extend(" " * (self.column + width - len(line)))
+        line[self.column] = char
+        if width == 2:
+            line[self.column + 1] = ""
+        self.column += width
+
+    def flush(self):
+        pass
+
+    def __str__(self):
+        return "\n".join("".join(line) for line in self.lines)
+
+
+FRAMES = [
+    [["web-1", "0.42"], ["web-2", "0.17"]],
+    [["web-1", "0.51"], ["web-2", "0.17"]],
+    [["web-1", "0.5"], ["web-2", "0.2"]],
+    [["web-1", "0.51"], ["web-2", "10.17"]],
+    [["web-1", "0.51"], ["web-2", "1.17"]],
+    [["web-1", "0.51"], ["web-2", "1.17"], ["web-3", "0.05"]],
+    [["web-1", "0.51"], ["サーバ", "1.17"], ["web-3", "0.05"]],
+    [["web-1", f"{Color.RED}0.99{Color.RESET}"], ["サーバ", "1.17"], ["web-3", "0"]],
+    [["web-1", "0.99"], ["web-2"], ["web-3", "0"]],
+    [["web-1", "0.99 0.98 0.97"], ["web-2", "1"], ["web-3", "0"]],
+    [["web-1", "0.99 0.98 0.96"], ["web-2", "1"], ["web-3", "0"]],
+    [["web-1", "0.99"], ["web-2", "1"], ["web-3", "0"]],
+    [],
+    [["web-1", "0.1"]],
+]
+
+
+class TestLiveTable:
+
+    @pytest.mark.parametrize(
+        "headers, config_factory",
+        [
+            pytest.param(["Host", "Load"], "default", id="default config"),
+            pytest.param(["Host", "Load"], "custom", id="custom config"),
+            pytest.param(["Host", "Load"], "wrapped", id="wrapped"),
+            pytest.param(None, "default", id="no headers"),
+        ],
+        indirect=["config_factory"],
+    )
+    def test_same_as_pretty_table(self, headers, config_factory):
+        screen = Screen()
+        live = LiveTable(headers, config_factory(), screen)
+        for frame in FRAMES:
+            live.update(frame)
+            expected = str(PrettyTable(frame, headers, config_factory()))
+            assert str(screen) == strip_ansi(expected)
+            assert screen.row == len(screen.lines)
+            assert screen.column == 0
+
+    def test_first_update(self):
+        fp = io.StringIO()
+        LiveTable(["Host", "Load"], fp=fp).update(FRAMES[0])
+        assert fp.getvalue() == str(PrettyTable(FRAMES[0], ["Host", "Load"])) + "\n"
+
+    @pytest.mark.parametrize(
+        "frame, expected",
+        [
+            pytest.param(FRAMES[0], "", id="unchanged"),
+            pytest.param(FRAMES[1], "\x1b[4A\x1b[10G0.51\x1b[4B\r", id="one cell"),
+            pytest.param(
+                [["web-3", "0.42"], ["web-2", "0.1"]],
+                "\x1b[4A\x1b[2Gweb-3\x1b[2B\x1b[10G0.1 \x1b[2B\r",
+                id="two rows",
+            ),
+        ],
+    )
+    def test_diff(self, frame, expected):
+        live = LiveTable(["Host", "Load"])
+        live.diff(FRAMES[0])
+        assert live.diff(frame) == expected
+        assert live.redraws == 1
+
+    def test_redraw_when_widths_change(self):
+        live = LiveTable(["Host", "Load"])
+        live.diff(FRAMES[0])
+        text = live.diff([["web-1", "0.42"], ["web-2", "100.17"]])
+        assert text.startswith("\x1b[5A\r Host  | Load   \x1b[K\n")
+        assert text.endswith("\x1b[J")
+        assert live.redraws == 2
+
+    def test_diff_size(self):
+        rows = [[str(i), "idle", "0"] for i in range(1000)]
+        live = LiveTable(["Id", "State", "Load"])
+        first = live.diff(rows)
+        rows[500] = ["500", "busy", "7"]
+        text = live.diff(rows)
+        assert len(text) < 40 < len(first)
+        assert live.redraws == 1
+
+    def test_str(self):
+        live = LiveTable(["Host", "Load"])
+        assert str(live) == str(PrettyTable([], ["Host", "Load"]))
+        live.diff(FRAMES[1])
+        assert str(live) == str(PrettyTable(FRAMES[1], ["Host", "Load"]))
+
+    def test_pretty_table_live(self):
+        fp = io.StringIO()
+        live = PrettyTable.live(["Host", "Load"], fp=fp)
+        assert isinstance(live, LiveTable)
+        live.update(FRAMES[0])
+        assert fp.getvalue().startswith(" Host ")
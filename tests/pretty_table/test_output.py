@@ -0,0 +1,118 @@
+import asyncio
+import gzip
+import io
+
+import pytest
+
+from prettypi.pretty_table.output import LinesOutput, adump_lines, dump_lines, is_binary
+
+
+class TestOutput:
+
+    @pytest.mark.parametrize(
+        "fp, expected",
+        [
+            pytest.param(io.StringIO(), False, id="text"),
+            pytest.param(io.BytesIO(), True, id="bytes"),
+            pytest.param(gzip.GzipFile(fileobj=io.BytesIO(), mode="wb"), True, id="gzip"),
+        ],
+    )
+    def test_is_binary(self, fp, expected):
+        assert is_binary(fp) == expected
+
+    @pytest.mark.parametrize(
+        "buffer_size, expected",
+        [
+            pytest.param(1, ["ab\n", "c\n", "dé\n"], id="one line per block"),
+            pytest.param(5, ["ab\nc\n", "dé\n"], id="two lines per block"),
+            pytest.param(100, ["ab\nc\ndé\n"], id="single block"),
+        ],
+    )
+    def test_dump_lines_blocks(self, mocker, buffer_size, expected):
+        fp = io.BytesIO()
+        spy = mocker.spy(fp, "write")
+        dump_lines(iter(["ab", "c", "dé"]), fp, buffer_size=buffer_size)
+        assert [call.args[0].decode() for call in spy.call_args_list] == expected
+        assert fp.getvalue() == "ab\nc\ndé\n".encode()
+
+    def test_dump_lines_text(self):
+        fp = io.StringIO()
+        dump_lines(["a", "b"], fp, buffer_size=1)
+        assert fp.getvalue() == "a\nb\n"
+
+    def test_dump_lines_encoding(self):
+        fp = io.BytesIO()
+        dump_lines(["é"], fp, "latin-1")
+        assert fp.getvalue() == b"\xe9\n"
+
+    def test_dump_no_lines(self):
+        fp = io.BytesIO()
+        dump_lines([], fp)
+        assert fp.getvalue() == b""
+
+    def test_dump_lines_invalid_buffer_size(self):
+        with pytest.raises(ValueError) as e:
+            dump_lines([], io.StringIO(), buffer_size=0)
+        assert e.match("Invalid buffer size: 0")
+
+    def test_lines_output(self):
+        class Lines(LinesOutput):
+            def iter_lines(self):
+                yield from ["a", "b"]
+
+        fp = io.StringIO()
+        Lines().dump(fp)
+        assert fp.getvalue() == "a\nb\n"
+
+    def test_lines_output_without_iter_lines(self):
+        class Lines(LinesOutput):
+            pass
+
+        with pytest.raises(TypeError) as e:
+            Lines()
+        assert e.match("iter_lines")
+
+
+class FakeWriter:
+    def __init__(self, events):
+        self.events = events
+
+    def write(self, data):
+        self.events.append(("write", data))
+
+    async def drain(self):
+        self.events.append(("drain", None))
+
+
+class TestAsyncOutput:
+
+    def test_adump_lines(self):
+        events = []
+        asyncio.run(adump_lines(["ab", "c", "dé"], FakeWriter(events), buffer_size=5))
+        assert events == [
+            ("write", b"ab\nc\n"),
+            ("drain", None),
+            ("write", "dé\n".encode()),
+            ("drain", None),
+        ]
+
+    def test_adump_lines_yields_to_loop(self):
+        events = []
+
+        async def other_task():
+            for _ in range(3):
+                events.append(("other", None))
+                await asyncio.sleep(0)
+
+        async def main():
+            task = asyncio.ensure_future(other_task())
+            await adump_lines(["a", "b", "c"], FakeWriter(events), buffer_size=1)
+            await task
+
+        asyncio.run(main())
+        kinds = [kind for kind, _ in events]
+        assert kinds.index("other") < kinds.index("write", 2)
+
+    def test_adump_lines_invalid_buffer_size(self):
+        with pytest.raises(ValueError):
+            asyncio.run(adump_lines([], FakeWriter([]), buffer_size=0))
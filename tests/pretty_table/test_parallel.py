@@ -0,0 +1,119 @@
+import pytest
+
+from prettypi.pretty_table import TableConfig, utils
+from prettypi.pretty_table.csv_store import CsvStore
+from prettypi.pretty_table.parallel import (
+    check_workers,
+    iter_parallel_lines,
+    render_rows,
+)
+from prettypi.pretty_table.table import PrettyTable
+from prettypi.pretty_table.utils import ColumnStore, RowLayout
+
+
+def build_layout():
+    return RowLayout("|", "|", " | ", [2, 3], "-" * 12, "=" * 12)
+
+
+def build_store(rows):
+    store = ColumnStore()
+    store.append_rows(rows)
+    return store
+
+
+class TestParallel:
+
+    @pytest.mark.parametrize(
+        "workers, executor",
+        [
+            pytest.param(None, "process", id="serial"),
+            pytest.param(1, "thread", id="one thread"),
+            pytest.param(4, "process", id="processes"),
+        ],
+    )
+    def test_check_workers(self, workers, executor):
+        check_workers(workers, executor)
+
+    @pytest.mark.parametrize(
+        "workers, executor, match",
+        [
+            pytest.param(0, "process", "Invalid workers: 0", id="no worker"),
+            pytest.param("2", "process", "Invalid workers: 2", id="not an int"),
+            pytest.param(2, "fork", "Invalid executor: fork", id="unknown executor"),
+        ],
+    )
+    def test_check_workers_invalid(self, workers, executor, match):
+        with pytest.raises(ValueError) as e:
+            check_workers(workers, executor)
+        assert e.match(match)
+
+    @pytest.mark.parametrize(
+        "last, columns, expected",
+        [
+            pytest.param(
+                True,
+                None,
+                ["| 4  | 5   |", "------------", "| 1  | 2   |", "============"],
+                id="last",
+            ),
+            pytest.param(
+                False,
+                None,
+                ["| 4  | 5   |", "------------", "| 1  | 2   |", "------------"],
+                id="middle",
+            ),
+            pytest.param(
+                True,
+                [1, 0],
+                ["| 5  | 4   |", "------------", "| 2  | 1   |", "============"],
+                id="columns",
+            ),
+        ],
+    )
+    def test_render_rows(self, last, columns, expected):
+        store = build_store([["1", "2"], ["3", "x"], ["4", "5"]])
+        assert render_rows([2, 0], last, store, build_layout(), columns) == expected
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    @pytest.mark.parametrize(
+        "indices",
+        [
+            pytest.param(range(10), id="range"),
+            pytest.param([9, 3, 0, 4, 1, 8, 2, 7, 6, 5], id="permutation"),
+        ],
+    )
+    def test_iter_parallel_lines(self, executor, indices):
+        layout = build_layout()
+        store = build_store([[str(i), str(i * i)] for i in range(10)])
+        lines = iter_parallel_lines(layout, store, indices, None, 2, executor, 3)
+        assert list(lines) == list(layout.iter_lines(store.iter_rows(indices)))
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_iter_parallel_lines_csv(self, tmp_path, executor):
+        path = tmp_path / "data.csv"
+        path.write_text("".join(f"{i},{i * i}\n" for i in range(10)), "utf-8")
+        store = CsvStore(str(path), has_header=False)
+        layout = build_layout()
+        lines = iter_parallel_lines(layout, store, range(10), [1], 2, executor, 4)
+        assert list(lines) == list(layout.iter_lines(store.iter_rows(range(10), [1])))
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_pretty_table_workers(self, mocker, executor):
+        mocker.patch.object(utils, "PARALLEL_CHUNK_SIZE", 2)
+        config = TableConfig.builder().set_border(top="=", data_bottom="~").build()
+        data = [[str(i), "x" * i] for i in range(7)]
+        expected = str(PrettyTable(data, ["A", "B"], config))
+        table = PrettyTable(data, ["A", "B"], config, workers=2, executor=executor)
+        assert str(table) == expected
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_pretty_table_workers_multiline_cells(self, mocker, executor):
+        mocker.patch.object(utils, "PARALLEL_CHUNK_SIZE", 2)
+        data = [[str(i), "a\nb" * (i % 2)] for i in range(7)]
+        lines = list(PrettyTable(data, ["A", "B"]).iter_lines())
+        table = PrettyTable(data, ["A", "B"], workers=2, executor=executor)
+        assert list(table.iter_lines()) == lines
+
+    def test_pretty_table_invalid_workers(self):
+        with pytest.raises(ValueError):
+            PrettyTable([["1"]], workers=-1)
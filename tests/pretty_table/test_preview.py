@@ -0,0 +1,150 @@
+import pytest
+
+from prettypi.pretty_table.preview import PreviewTable
+from prettypi.pretty_table.table import PrettyTable
+
+
+def rows(count):
+    return ([str(i), str(i * 37 % 101)] for i in range(count))
+
+
+class TestPreviewTable:
+
+    def test_nothing_elided(self, config_factory):
+        preview = PreviewTable(rows(5), ["Id", "Score"], config_factory(), head=3, tail=2)
+        assert preview.elided == 0
+        assert str(preview) == str(PrettyTable(list(rows(5)), ["Id", "Score"], config_factory()))
+
+    def test_head_and_tail(self):
+        preview = PreviewTable(rows(100000), ["Id", "Score"], head=2, tail=2)
+        assert preview.nb_rows == 100000
+        assert preview.elided == 99996
+        assert str(preview) == "\n".join(
+            [
+                " Id    | Score   ",
+                " 0     | 0       ",
+                "-----------------",
+                " 1     | 37      ",
+                "-----------------",
+                " … 99,996 rows … ",
+                "-----------------",
+                " 99998 | 94      ",
+                "-----------------",
+                " 99999 | 30      ",
+                "-----------------",
+            ]
+        )
+
+    def test_custom_config(self, build_config):
+        preview = PreviewTable(rows(3), ["Id", "Score"], build_config(), head=1, tail=1)
+        assert list(preview.iter_lines()) == [
+            "│════════════│",
+            "│ Id ║ Score │",
+            "│════════════│",
+            "│ 0  ║ 0     │",
+            "│┈┈┈┈┈┈┈┈┈┈┈┈│",
+            "│ … 1 row …  │",
+            "│┈┈┈┈┈┈┈┈┈┈┈┈│",
+            "│ 2  ║ 74    │",
+            "│════════════│",
+        ]
+
+    @pytest.mark.parametrize(
+        "head, tail, expected",
+        [
+            pytest.param(0, 2, ["98", "99"], id="tail only"),
+            pytest.param(2, 0, ["0", "1"], id="head only"),
+            pytest.param(0, 0, [], id="nothing kept"),
+        ],
+    )
+    def test_kept_rows(self, head, tail, expected):
+        preview = PreviewTable(rows(100), ["Id", "Score"], head=head, tail=tail)
+        store = preview.json_rows_manager.store
+        assert (store.column(0) if len(store) else []) == expected
+        assert preview.elided == 100 - len(expected)
+        assert f"… {100 - len(expected)} rows …" in str(preview)
+
+    @pytest.mark.parametrize(
+        "headers, config_factory, expected",
+        [
+            pytest.param(
+                ["Id", "Score"],
+                "default",
+                [" Id | Score  ", " … 10 rows … ", "-------------"],
+                id="default config",
+            ),
+            pytest.param(
+                ["Id", "Score"],
+                "custom",
+                [
+                    "│═══════════════│",
+                    "│  Id ║ Score  │ ",
+                    "│═══════════════│",
+                    "│  … 10 rows …  │",
+                    "│═══════════════│",
+                ],
+                id="custom config",
+            ),
+            pytest.param(
+                None,
+                "custom",
+                ["│  … 10 rows …  │", "│═══════════════│"],
+                id="no headers",
+            ),
+        ],
+        indirect=["config_factory"],
+    )
+    def test_nothing_kept_is_framed(self, headers, config_factory, expected):
+        preview = PreviewTable(rows(10), headers, config_factory(), head=0, tail=0)
+        assert list(preview.iter_lines()) == expected
+
+    def test_widths_of_kept_rows(self):
+        data = [["1"], ["a very long cell"], ["2"]]
+        preview = PreviewTable(iter(data), ["Id"], head=1, tail=1)
+        assert preview.json_rows_manager.max_len_columns == [2]
+        assert "a very long cell" not in str(preview)
+
+    def test_top_n(self):
+        data = [[str(i), str(i * 37 % 101)] for i in range(1000)] + [["x", "n/a"]]
+        preview = PreviewTable(iter(data), ["Id", "Score"], top_n=("Score", 5))
+        table = PrettyTable(data[:-1], ["Id", "Score"])
+        table.sort_by("Score", reverse=True)
+        expected = table.json_rows_manager.row_order()[:5]
+        assert preview.json_rows_manager.store.column(0) == [data[i][0] for i in expected]
+        assert preview.elided == 996
+        assert str(preview).split("\n")[-2:] == [" … 996 rows … ", "--------------"]
+
+    @pytest.mark.parametrize(
+        "n, expected",
+        [
+            pytest.param(3, ["c", "a", "e"], id="numbers only"),
+            pytest.param(6, ["c", "a", "e", "b", "d", "f"], id="other cells last"),
+        ],
+    )
+    def test_top_n_non_numeric_cells(self, n, expected):
+        data = [["a", "999"], ["b", "N/A"], ["c", "1e4"], ["d", ""], ["e", "-5"], ["f"]]
+        preview = PreviewTable(iter(data), ["Id", "v"], top_n=("v", n))
+        assert preview.json_rows_manager.store.column(0) == expected
+
+    def test_top_n_position(self):
+        preview = PreviewTable(iter([["b", "1"], ["a", "2"], ["c"]]), top_n=(0, 2))
+        assert preview.json_rows_manager.store.column(0) == ["c", "b"]
+
+    @pytest.mark.parametrize(
+        "kwargs, error",
+        [
+            pytest.param({"head": -1}, ValueError, id="negative head"),
+            pytest.param({"tail": -1}, ValueError, id="negative tail"),
+            pytest.param({"top_n": ("Score", -1)}, ValueError, id="negative n"),
+            pytest.param({"top_n": ("Unknown", 1)}, ValueError, id="unknown header"),
+            pytest.param({"top_n": (-1, 1)}, IndexError, id="negative position"),
+        ],
+    )
+    def test_invalid(self, kwargs, error):
+        with pytest.raises(error):
+            PreviewTable(rows(10), ["Id", "Score"], **kwargs)
+
+    def test_pretty_table_preview(self):
+        preview = PrettyTable.preview(rows(50), ["Id", "Score"], head=1, tail=1)
+        assert isinstance(preview, PreviewTable)
+        assert preview.elided == 48
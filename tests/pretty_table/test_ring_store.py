@@ -0,0 +1,73 @@
+import pytest
+
+from prettypi.pretty_table.ring_store import RingStore
+from prettypi.utils import Color
+
+
+def ring(capacity, rows):
+    store = RingStore(capacity)
+    store.append_rows(rows)
+    return store
+
+
+class TestRingStore:
+
+    def test_append(self):
+        store = ring(3, [["1", "a"], ["2", "bb"]])
+        assert len(store) == 2
+        assert [store.row(i) for i in range(len(store))] == [["1", "a"], ["2", "bb"]]
+        assert store.max_lengths() == [1, 2]
+
+    def test_evict_oldest(self):
+        store = ring(3, [[str(i), "x" * i] for i in range(5)])
+        assert len(store) == 3
+        assert store.column(0) == ["2", "3", "4"]
+        assert store.project(0, [1, 2]) == ["xx", ""]
+        assert list(store.iter_rows([2], [0])) == [["4"]]
+
+    @pytest.mark.parametrize(
+        "rows, expected",
+        [
+            pytest.param([["long"], ["a"], ["b"]], [1], id="widest evicted"),
+            pytest.param([["long"], ["long"], ["b"]], [4], id="widest kept"),
+            pytest.param([["日本"], ["abc"], ["b"]], [3], id="wide evicted"),
+        ],
+    )
+    def test_widths_shrink(self, rows, expected):
+        store = ring(2, rows)
+        assert store.max_lengths() == expected
+        assert store.max_length(0) == expected[0]
+        assert sorted(store.counters[0].elements()) == sorted(
+            len(row[0]) for row in rows[1:]
+        )
+
+    def test_ragged(self):
+        store = ring(2, [["1", "2", "3"], ["1"]])
+        assert store.is_ragged()
+        assert store.max_row_size() == 3
+        store.append(["2"])
+        assert not store.is_ragged()
+        assert store.nb_columns() == 1
+        assert store.max_lengths() == [1]
+
+    @pytest.mark.parametrize(
+        "rows, is_ascii, wide",
+        [
+            pytest.param([["a", "b"]], True, set(), id="plain"),
+            pytest.param([["a", "日本"]], False, {1}, id="wide"),
+            pytest.param([[f"{Color.RED}a{Color.RESET}", "b"]], True, {0}, id="styled"),
+            pytest.param([["a", "日本"], ["a", "b"]], True, set(), id="wide evicted"),
+        ],
+    )
+    def test_wide_columns(self, rows, is_ascii, wide):
+        store = ring(1, rows)
+        assert store.is_ascii() == is_ascii
+        assert store.wide_columns() == wide
+
+    def test_column_lengths(self):
+        store = ring(2, [["abc"], ["日本"], ["a"]])
+        assert list(store.column_lengths(0)) == [4, 1]
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError):
+            RingStore(0)
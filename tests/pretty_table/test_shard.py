@@ -0,0 +1,88 @@
+import pickle
+
+import pytest
+
+from prettypi.pretty_table import TableConfig
+from prettypi.pretty_table.shard import (
+    WidthSummary,
+    compute_width_summary,
+    merge_width_summaries,
+    render_shard,
+)
+from prettypi.pretty_table.table import PrettyTable
+
+
+class TestShard:
+
+    def test_compute_width_summary(self):
+        summary = compute_width_summary(iter([["1", "22"], ["333"]]), ["A", "B", "C"])
+        assert summary == WidthSummary([3, 2, 1], 2, 2)
+
+    def test_summary_is_picklable(self):
+        summary = WidthSummary([1, 2], 2, 10)
+        assert pickle.loads(pickle.dumps(summary)) == summary
+
+    def test_merge(self):
+        merged = WidthSummary([1, 5], 2, 3).merge(WidthSummary([4, 2, 1], 3, 2))
+        assert merged == WidthSummary([4, 5, 1], 3, 5)
+
+    def test_merge_width_summaries(self):
+        summaries = [WidthSummary([1], 1, 1), WidthSummary([3], 1, 2)]
+        assert merge_width_summaries(summaries) == WidthSummary([3], 1, 3)
+        assert merge_width_summaries([]) == WidthSummary()
+
+    def test_render_shards(self, config_factory):
+        headers = ["Id", "Fruit"]
+        shards = [[["1", "apple"], ["2", "fig"]], [["3", "banana"]], [["40", "kiwi"]]]
+        summary = merge_width_summaries(
+            compute_width_summary(rows, headers) for rows in shards
+        )
+        lines = []
+        for rows, part in zip(shards, ["first", "middle", "last"]):
+            lines.extend(render_shard(rows, summary, config_factory(), part, headers))
+        all_rows = [row for rows in shards for row in rows]
+        assert "\n".join(lines) == str(PrettyTable(all_rows, headers, config_factory()))
+
+    def test_render_single_shard(self):
+        rows = [["1", "2"]]
+        summary = compute_width_summary(rows, ["A", "B"])
+        lines = render_shard(rows, summary, TableConfig(), "only", ["A", "B"])
+        assert list(lines) == [" A | B ", " 1 | 2 ", "-------"]
+
+    def test_render_empty_first_shard(self):
+        headers = ["A"]
+        summary = merge_width_summaries(
+            [compute_width_summary([], headers), compute_width_summary([["123"]])]
+        )
+        first = list(render_shard([], summary, TableConfig(), "first", headers))
+        last = list(render_shard([["123"]], summary, TableConfig(), "last"))
+        assert first + last == [" A   ", " 123 ", "-----"]
+
+    @pytest.mark.parametrize(
+        "config_factory, expected",
+        [
+            pytest.param(
+                "default", [" A  ", " 1  ", "----", " 23 ", "----"], id="default config"
+            ),
+            pytest.param(
+                "custom",
+                ["│════│", "│ A  │", "│════│", "│ 1  │", "│┈┈┈┈│", "│ 23 │", "│┈┈┈┈│", "│════│"],
+                id="custom config",
+            ),
+        ],
+        indirect=["config_factory"],
+    )
+    def test_render_empty_last_shard(self, config_factory, expected):
+        headers = ["A"]
+        rows = [["1"], ["23"]]
+        summary = merge_width_summaries(
+            [compute_width_summary(rows, headers), compute_width_summary([])]
+        )
+        first = list(render_shard(rows, summary, config_factory(), "first", headers))
+        last = list(render_shard([], summary, config_factory(), "last"))
+        assert first + last == expected
+
+    def test_render_shard_invalid_part(self):
+        with pytest.raises(ValueError) as e:
+            render_shard([], WidthSummary(), TableConfig(), "head")
+        assert e.match("Invalid part: head")
@@ -0,0 +1,83 @@
+import random
+
+import pytest
+
+from prettypi.pretty_table.sorting import (
+    column_keys,
+    merge_permutation,
+    rank_key,
+    sort_key,
+    sort_permutation,
+)
+
+
+class TestSorting:
+
+    @pytest.mark.parametrize(
+        "cells, expected",
+        [
+            pytest.param(["10", "9", "100"], ["9", "10", "100"], id="numbers"),
+            pytest.param(["-1.5", "2e3", "0"], ["-1.5", "0", "2e3"], id="floats"),
+            pytest.param(["b", "10", "a", "9"], ["9", "10", "a", "b"], id="mixed"),
+            pytest.param(["nan", "1", "a"], ["1", "a", "nan"], id="nan is a string"),
+        ],
+    )
+    def test_sort_key(self, cells, expected):
+        assert sorted(cells, key=sort_key) == expected
+
+    def test_column_keys(self):
+        assert list(column_keys(["b", "10", "a", "9", "b"])) == [4, 2, 3, 1, 4]
+
+    @pytest.mark.parametrize(
+        "reverse, expected",
+        [
+            pytest.param([False, False], [2, 1, 0, 3], id="ascending"),
+            pytest.param([False, True], [0, 1, 2, 3], id="second descending"),
+            pytest.param([True, False], [3, 2, 1, 0], id="first descending"),
+        ],
+    )
+    def test_sort_permutation(self, reverse, expected):
+        first = column_keys(["a", "a", "a", "b"])
+        second = column_keys(["3", "2", "1", "0"])
+        assert list(sort_permutation([first, second], reverse)) == expected
+
+    def test_sort_permutation_is_stable(self):
+        keys = column_keys(["x", "y", "x", "y"])
+        assert list(sort_permutation([keys], [True])) == [1, 3, 0, 2]
+
+    @pytest.mark.parametrize(
+        "first, second, equal",
+        [
+            pytest.param("1", "1.0", True, id="same number"),
+            pytest.param("1", "2", False, id="other number"),
+            pytest.param("a", "a", True, id="same string"),
+            pytest.param("1", "a", False, id="number and string"),
+        ],
+    )
+    def test_rank_key(self, first, second, equal):
+        assert (rank_key(first) == rank_key(second)) == equal
+        ranks = column_keys([first, second])
+        assert (ranks[0] == ranks[1]) == equal
+
+    @pytest.mark.parametrize(
+        "reverse",
+        [
+            pytest.param([False, False], id="ascending"),
+            pytest.param([True, False], id="first descending"),
+            pytest.param([False, True], id="second descending"),
+        ],
+    )
+    @pytest.mark.parametrize("nb_new", [0, 1, 5, 40])
+    def test_merge_permutation(self, reverse, nb_new):
+        generator = random.Random(nb_new)
+        cells = ["a", "b", "1", "2.0", "2", "10", "x"]
+        rows = [[generator.choice(cells) for _ in range(2)] for _ in range(60 + nb_new)]
+        columns = [column_keys([row[i] for row in rows]) for i in range(2)]
+        order = sort_permutation([keys[:60] for keys in columns], reverse)
+        merged = merge_permutation(
+            order,
+            lambda index: [rank_key(cell) for cell in rows[index]],
+            range(60, 60 + nb_new),
+            reverse,
+        )
+        assert merged == sort_permutation(columns, reverse)
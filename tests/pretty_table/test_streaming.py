@@ -0,0 +1,126 @@
+import io
+
+import pytest
+
+from prettypi.pretty_table.streaming import StreamingTable
+from prettypi.pretty_table.table import PrettyTable
+
+
+class TestStreamingTable:
+
+    def test_same_as_pretty_table(self, config_factory):
+        data = [["apple", "banana", "cherry"], ["dog", "elephant", "fox"]]
+        headers = ["Fruit", "Animal", "Object"]
+        expected = str(PrettyTable(data, headers, config_factory()))
+        table = StreamingTable(iter(data), headers, config_factory())
+        assert "\n".join(table) == expected
+
+    def test_generator_is_consumed_lazily(self):
+        consumed = []
+
+        def rows():
+            for i in range(1000):
+                consumed.append(i)
+                yield [str(i)]
+
+        lines = StreamingTable(rows(), ["Id"], widths=[4]).iter_lines()
+        assert next(lines) == " Id   "
+        assert next(lines) == " 0    "
+        assert consumed == [0]
+
+    def test_sample_size(self):
+        rows = iter([["a"], ["bb"], ["cccc"]])
+        lines = list(StreamingTable(rows, sample_size=2))
+        assert lines == [" a  ", "----", " bb ", "----", " c… ", "----"]
+
+    def test_declared_widths_truncate(self):
+        table = StreamingTable([["abcdef", "x"]], ["Name", "V"], widths=[4, 1])
+        assert list(table) == [" Name | V ", " abc… | x ", "----------"]
+
+    def test_declared_widths_truncate_wide(self):
+        table = StreamingTable([["日本茶ラテ", "x"], ["茶", "y"]], ["Name", "V"], widths=[6, 1])
+        assert list(table) == [
+            " Name   | V ",
+            " 日本…  | x ",
+            "------------",
+            " 茶     | y ",
+            "------------",
+        ]
+
+    def test_declared_widths_zero(self):
+        table = StreamingTable([["abc", "x"], ["", "y"]], ["N", "V"], widths=[0, 1])
+        assert list(table) == ["  | V ", "  | x ", "------", "  | y ", "------"]
+
+    @pytest.mark.parametrize(
+        "data, headers, widths, match",
+        [
+            pytest.param(
+                [["a", "b", "EXTRA"]], None, [3, 3], "3 cells for 2 columns", id="row"
+            ),
+            pytest.param(
+                [["a"]], ["A", "B"], [3], "2 cells for 1 columns", id="headers"
+            ),
+            pytest.param(
+                [["a"], ["b", "c"]], None, None, "2 cells for 1 columns", id="sampled"
+            ),
+        ],
+    )
+    def test_declared_widths_truncate_extra_cells(self, data, headers, widths, match):
+        table = StreamingTable(data, headers, widths=widths, sample_size=1)
+        with pytest.raises(ValueError) as e:
+            list(table)
+        assert e.match(match)
+
+    def test_invalid_row_writes_none_of_its_lines(self):
+        lines = []
+        table = StreamingTable([["a"], ["b", "c"]], ["A"], widths=[1])
+        with pytest.raises(ValueError):
+            lines.extend(table)
+        assert lines == [" A ", " a "]
+
+    def test_styled_cells(self):
+        styled = "\x1b[31mé\x1b[0m"
+        table = StreamingTable([[styled, "x"], ["ab", "y"]], ["N", "V"], widths=[2, 1])
+        assert list(table) == [
+            " N  | V ",
+            f" {styled}  | x ",
+            "--------",
+            " ab | y ",
+            "--------",
+        ]
+
+    def test_declared_widths_overflow(self):
+        table = StreamingTable(
+            [["abcdef", "x", "extra"]], ["Name", "V"], widths=[4, 1], overflow="overflow"
+        )
+        assert list(table) == [" Name | V ", " abcdef | x | extra ", "----------"]
+
+    def test_empty_data(self):
+        assert list(StreamingTable([], ["A"])) == [" A "]
+
+    def test_write(self):
+        fp = io.StringIO()
+        StreamingTable([["1", "2"]], ["A", "B"]).write(fp)
+        assert fp.getvalue() == " A | B \n 1 | 2 \n-------\n"
+
+    def test_dump(self):
+        fp = io.BytesIO()
+        StreamingTable(iter([["1", "é"]]), ["A", "B"]).dump(fp)
+        assert fp.getvalue() == " A | B \n 1 | é \n-------\n".encode()
+
+    @pytest.mark.parametrize(
+        "kwargs, match",
+        [
+            pytest.param({"overflow": "wrap"}, "Invalid overflow: wrap", id="overflow"),
+            pytest.param({"sample_size": 0}, "Invalid sample size: 0", id="sample"),
+        ],
+    )
+    def test_invalid_input(self, kwargs, match):
+        with pytest.raises(ValueError) as e:
+            StreamingTable([], **kwargs)
+        assert e.match(match)
+
+    def test_pretty_table_stream(self):
+        table = PrettyTable.stream(iter([["1", "2"]]), ["A", "B"], widths=[2, 2])
+        assert isinstance(table, StreamingTable)
+        assert list(table) == [" A  | B  ", " 1  | 2  ", "---------"]
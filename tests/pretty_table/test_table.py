@@ -1,5 +1,9 @@
+import asyncio
+import gzip
+import io
 import pytest
 from prettypi.pretty_table import TableConfig
+from prettypi.pretty_table import table, utils
 from prettypi.pretty_table.table import PrettyTable
 
 
@@ -42,3 +46,317 @@ class TestPrettyTable:
     def test_pretty_table_str(self, data, headers, expected):
         pt = PrettyTable(data, headers)
         assert str(pt) == expected
+
+    def test_iter_lines(self):
+        pt = PrettyTable([["1", "2"], ["3", "4"]], ["A", "B"])
+        lines = pt.iter_lines()
+        assert next(lines) == " A | B "
+        assert list(lines) == [" 1 | 2 ", "-------", " 3 | 4 ", "-------"]
+
+    def test_iter_lines_matches_str(self):
+        config = (
+            TableConfig.builder()
+            .set_border(top="═", bottom="═", left="│ ", right=" │", data_bottom="═")
+            .set_column_separator(" ║ ")
+            .set_row_separator("┈")
+            .build()
+        )
+        pt = PrettyTable([["1", "22"], ["333", "4"]], ["A", "B"], config)
+        assert "\n".join(pt.iter_lines()) == str(pt)
+
+    def test_write(self):
+        pt = PrettyTable([["1", "2"], ["3", "4"]], ["A", "B"])
+        fp = io.StringIO()
+        pt.write(fp)
+        assert fp.getvalue() == str(pt) + "\n"
+
+    def test_dump(self):
+        pt = PrettyTable([["1", "é"], ["3", "4"]], ["A", "B"])
+        text = io.StringIO()
+        pt.dump(text)
+        assert text.getvalue() == str(pt) + "\n"
+        buffer = io.BytesIO()
+        with gzip.GzipFile(fileobj=buffer, mode="wb") as fp:
+            pt.dump(fp, buffer_size=8)
+        assert gzip.decompress(buffer.getvalue()).decode() == str(pt) + "\n"
+
+    def test_awrite(self):
+        pt = PrettyTable([[str(i), "x"] for i in range(100)], ["A", "B"])
+
+        async def main():
+            received = []
+
+            async def handle(reader, writer):
+                await pt.awrite(writer, buffer_size=64)
+                writer.close()
+
+            server = await asyncio.start_server(handle, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            received.append(await reader.read())
+            writer.close()
+            server.close()
+            await server.wait_closed()
+            return b"".join(received)
+
+        assert asyncio.run(main()).decode() == str(pt) + "\n"
+
+    def test_empty_table(self):
+        pt = PrettyTable([])
+        assert str(pt) == ""
+        assert list(pt.iter_lines()) == []
+
+    @pytest.mark.parametrize(
+        "border_kwargs",
+        [
+            pytest.param({}, id="default config"),
+            pytest.param(
+                {"top": "═", "bottom": "═", "left": "│ ", "right": " │", "data_bottom": "═"},
+                id="custom config",
+            ),
+        ],
+    )
+    def test_append_rows(self, border_kwargs):
+        def config():
+            return TableConfig.builder().set_border(**border_kwargs).build()
+
+        data = [["1", "2"]]
+        pt = PrettyTable(data, ["A", "B"], config())
+        pt.append_rows([["333", "4"], ["5", "66666"]])
+        expected = PrettyTable(
+            [["1", "2"], ["333", "4"], ["5", "66666"]], ["A", "B"], config()
+        )
+        assert str(pt) == str(expected)
+        assert data == [["1", "2"]]
+        assert pt.data == [["1", "2"], ["333", "4"], ["5", "66666"]]
+        assert pt.json_rows_manager.data is data
+
+    def test_append_rows_empty_table(self):
+        pt = PrettyTable([], ["A", "B"])
+        pt.append_rows(iter([["1", "2"]]))
+        assert str(pt) == " A | B \n 1 | 2 \n-------"
+
+    @pytest.mark.parametrize(
+        "data, headers",
+        [
+            pytest.param([["1", "22"], ["333"]], ["A", "B"], id="header and data"),
+            pytest.param([["1", "22"]], None, id="no header"),
+            pytest.param([], ["A", "B"], id="no data"),
+        ],
+    )
+    def test_set_config_keeps_widths(self, data, headers):
+        configs = [
+            TableConfig(),
+            TableConfig.builder()
+            .set_border(top="═", bottom="═", left="│ ", right=" │", data_bottom="═")
+            .set_column_separator(" ║ ")
+            .set_row_separator("┈")
+            .build(),
+            TableConfig.builder().set_border(left="|").set_row_separator("").build(),
+        ]
+        pt = PrettyTable(data, headers)
+        for config in configs + configs[::-1]:
+            pt.set_config(config)
+            assert str(pt) == str(PrettyTable(data, headers, config))
+
+    def test_shared_config(self):
+        config = (
+            TableConfig.builder()
+            .set_border(top="═", left="│ ", right=" │", data_bottom="═")
+            .build()
+        )
+        first = str(PrettyTable([["1"], ["2"]], ["A"], config))
+        PrettyTable([["3"]], None, config).write(io.StringIO())
+        assert str(PrettyTable([["1"], ["2"]], ["A"], config)) == first
+        assert config.border_data.left == "│ "
+
+    def test_render_cache(self, mocker):
+        light = TableConfig()
+        heavy = TableConfig.builder().set_border(top="═").build()
+        pt = PrettyTable([["1"]], ["A"], light)
+        spy = mocker.spy(utils.JsonRowsManager, "iter_lines")
+        expected = {light: str(pt)}
+        assert str(pt) is str(pt)
+        pt.set_config(heavy)
+        expected[heavy] = str(pt)
+        for config in [light, heavy, light]:
+            pt.set_config(config)
+            assert str(pt) == expected[config]
+        assert spy.call_count == 2
+        pt.append_rows([["2"]])
+        assert str(pt) == " A \n 1 \n---\n 2 \n---"
+        assert spy.call_count == 3
+
+    def test_render_cache_is_bounded(self, mocker):
+        mocker.patch.object(table, "RENDER_CACHE_SIZE", 2)
+        configs = [TableConfig.builder().set_row_separator(c).build() for c in "-=~"]
+        pt = PrettyTable([["1"]], ["A"], configs[0])
+        spy = mocker.spy(utils.JsonRowsManager, "iter_lines")
+        for config in [configs[0], configs[1], configs[0], configs[2], configs[0]]:
+            pt.set_config(config)
+            str(pt)
+        assert spy.call_count == 3
+        assert len(pt._render_cache) == 2
+        pt.set_config(configs[1])
+        str(pt)
+        assert spy.call_count == 4
+
+    def test_append_rows_then_set_config(self):
+        pt = PrettyTable([["1"]], ["A"])
+        pt.append_rows([["2"]])
+        pt.set_config(TableConfig.builder().set_row_separator("").build())
+        assert str(pt) == " A \n 1 \n 2 "
+
+    @pytest.mark.parametrize(
+        "border_kwargs",
+        [
+            pytest.param({}, id="default config"),
+            pytest.param(
+                {"top": "═", "bottom": "═", "left": "│ ", "right": " │", "data_bottom": "═"},
+                id="custom config",
+            ),
+        ],
+    )
+    def test_from_csv(self, tmp_path, border_kwargs):
+        def config():
+            return TableConfig.builder().set_border(**border_kwargs).build()
+
+        path = tmp_path / "data.csv"
+        path.write_text('Id,Name\n1,apple\n22,"ban,ana"\n3\n')
+        pt = PrettyTable.from_csv(str(path), config=config())
+        expected = PrettyTable(
+            [["1", "apple"], ["22", "ban,ana"], ["3"]], ["Id", "Name"], config()
+        )
+        assert str(pt) == str(expected)
+        pt.sort_by("Id", reverse=True)
+        expected.sort_by("Id", reverse=True)
+        assert pt.page(0, 2) == expected.page(0, 2)
+        assert str(pt.where(lambda row: row[0] != "22")) == str(
+            expected.where(lambda row: row[0] != "22")
+        )
+        pt.set_config(TableConfig())
+        expected.set_config(TableConfig())
+        assert str(pt) == str(expected)
+
+    def test_from_tsv_without_header(self, tmp_path):
+        path = tmp_path / "data.tsv"
+        path.write_text("1\t2\n3\t4\n")
+        pt = PrettyTable.from_csv(str(path), ["A", "B"], delimiter="\t", has_header=False)
+        assert str(pt) == str(PrettyTable([["1", "2"], ["3", "4"]], ["A", "B"]))
+
+    def test_from_csv_append_rows(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_text("A\n1\n")
+        pt = PrettyTable.from_csv(str(path))
+        with pytest.raises(ValueError):
+            pt.append_rows([["2"]])
+        assert str(pt) == " A \n 1 \n---"
+
+    def test_from_csv_close(self, tmp_path):
+        path = tmp_path / "data.csv"
+        path.write_text("A\n1\n")
+        with PrettyTable.from_csv(str(path)) as pt:
+            assert str(pt) == " A \n 1 \n---"
+        assert pt.data._mmap.closed
+        with PrettyTable([["1"]], ["A"]) as pt:
+            pass
+        pt.close()
+        assert str(pt) == " A \n 1 \n---"
+
+    @pytest.mark.parametrize(
+        "number, expected",
+        [
+            pytest.param(0, " Id \n 0  \n----\n 1  \n----", id="first page"),
+            pytest.param(1, " Id \n 2  \n----\n 3  \n----", id="middle page"),
+            pytest.param(5, " Id \n 10 \n----", id="last page"),
+        ],
+    )
+    def test_page(self, number, expected):
+        pt = PrettyTable([[str(i)] for i in range(11)], ["Id"])
+        assert pt.page_count(2) == 6
+        assert pt.page(number, 2) == expected
+
+    def test_page_with_bottom_border(self):
+        config = TableConfig.builder().set_border(top="=", data_bottom="~").build()
+        pt = PrettyTable([["1"], ["2"], ["3"]], ["A"], config)
+        assert pt.page(0, 2) == "===\n A \n 1 \n---\n 2 \n~~~"
+
+    def test_page_empty_table(self):
+        pt = PrettyTable([], ["A"])
+        assert pt.page_count(10) == 1
+        assert pt.page(0, 10) == " A "
+
+    @pytest.mark.parametrize(
+        "number, size, error",
+        [
+            pytest.param(0, 0, ValueError, id="invalid size"),
+            pytest.param(3, 2, IndexError, id="page too far"),
+            pytest.param(-1, 2, IndexError, id="negative page"),
+        ],
+    )
+    def test_page_invalid(self, number, size, error):
+        pt = PrettyTable([["1"], ["2"], ["3"]], ["A"])
+        with pytest.raises(error):
+            pt.page(number, size)
+
+    def test_iter_pages(self):
+        pt = PrettyTable([["1"], ["22"], ["3"]], ["A"])
+        assert list(pt.iter_pages(2)) == [
+            " A  \n 1  \n----\n 22 \n----",
+            " A  \n 3  \n----",
+        ]
+
+    def test_sort_by(self):
+        data = [["b", "10"], ["a", "9"], ["a", "11"]]
+        pt = PrettyTable(data, ["Name", "Size"])
+        pt.sort_by("Size")
+        assert [line.split()[0] for line in pt.iter_lines()][1::2] == ["a", "b", "a"]
+        assert data == [["b", "10"], ["a", "9"], ["a", "11"]]
+
+    def test_sort_by_several_columns(self):
+        pt = PrettyTable([["b", "10"], ["a", "9"], ["a", "11"]], ["Name", "Size"])
+        pt.sort_by(["Name", 1], reverse=[False, True])
+        expected = PrettyTable([["a", "11"], ["a", "9"], ["b", "10"]], ["Name", "Size"])
+        assert str(pt) == str(expected)
+
+    def test_sort_by_reuses_keys(self, mocker):
+        pt = PrettyTable([["b", "1"], ["a", "2"]], ["Name", "Size"])
+        spy = mocker.spy(utils, "column_keys")
+        pt.sort_by("Name")
+        pt.sort_by("Size")
+        pt.sort_by("Name", reverse=True)
+        assert spy.call_count == 2
+        assert str(pt).split("\n")[1] == " b    | 1    "
+
+    def test_sort_by_then_page_and_append(self):
+        pt = PrettyTable([["3"], ["1"]], ["A"])
+        pt.sort_by(0)
+        assert pt.page(0, 1) == " A \n 1 \n---"
+        pt.append_rows([["2"]])
+        assert str(pt) == " A \n 1 \n---\n 2 \n---\n 3 \n---"
+
+    def test_sort_by_then_append_merges(self, mocker):
+        data = [[str(i % 7), "abc"[i % 3]] for i in range(30)]
+        pt = PrettyTable(data[:20], ["A", "B"])
+        pt.sort_by(["B", "A"], reverse=[True, False])
+        spy = mocker.spy(utils, "sort_permutation")
+        pt.append_rows(data[20:25])
+        pt.append_rows(data[25:])
+        assert spy.call_count == 0
+        expected = PrettyTable(data, ["A", "B"])
+        expected.sort_by(["B", "A"], reverse=[True, False])
+        assert str(pt) == str(expected)
+
+    @pytest.mark.parametrize(
+        "columns, reverse, error",
+        [
+            pytest.param([], False, ValueError, id="no column"),
+            pytest.param("Unknown", False, ValueError, id="unknown header"),
+            pytest.param(2, False, IndexError, id="unknown position"),
+            pytest.param([0, 1], [True], ValueError, id="reverse mismatch"),
+        ],
+    )
+    def test_sort_by_invalid(self, columns, reverse, error):
+        pt = PrettyTable([["1", "2"]], ["A", "B"])
+        with pytest.raises(error):
+            pt.sort_by(columns, reverse)
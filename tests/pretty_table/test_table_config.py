@@ -0,0 +1,90 @@
+import dataclasses
+import os
+
+import pytest
+
+from prettypi.pretty_table.table_config import Border, ColumnWidth, TableConfig
+
+
+class TestBorder:
+
+    def test_frozen(self):
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            Border().left = "|"
+
+    def test_stripped(self):
+        border = Border("=", "-", "| ", " |")
+        assert border.stripped() == Border("=", "-", "|", "|")
+        assert border == Border("=", "-", "| ", " |")
+
+
+class TestTableConfig:
+
+    def test_frozen(self):
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            TableConfig().row_separator = "="
+
+    def test_hashable(self):
+        def build():
+            return TableConfig.builder().set_border(top="═", left="│ ").build()
+
+        assert build() == build()
+        assert hash(build()) == hash(build())
+        assert build() != TableConfig()
+        assert len({build(), build(), TableConfig()}) == 2
+
+    def test_alignments(self):
+        config = TableConfig(alignments=["left", "right"])
+        assert config.alignments == ("left", "right")
+        assert config.get_config()["alignments"] == ("left", "right")
+
+    @pytest.mark.parametrize(
+        "config, expected",
+        [
+            pytest.param(TableConfig(), False, id="default"),
+            pytest.param(TableConfig(column_widths=[None]), False, id="no constraint"),
+            pytest.param(TableConfig(max_width=80), True, id="max width"),
+            pytest.param(
+                TableConfig(column_widths=[None, ColumnWidth(max_width=5)]),
+                True,
+                id="column constraint",
+            ),
+        ],
+    )
+    def test_has_width_constraints(self, config, expected):
+        assert config.has_width_constraints() == expected
+
+
+class TestTableConfigBuilder:
+
+    def test_set_column_width(self):
+        config = TableConfig.builder().set_column_width(2, 1, 10, 2).build()
+        assert config.column_widths == (None, None, ColumnWidth(1, 10, 2))
+        hash(config)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param({"column": -1}, id="column"),
+            pytest.param({"column": 0, "min_width": -1}, id="min width"),
+            pytest.param({"column": 0, "flex": -1}, id="flex"),
+            pytest.param({"column": 0, "min_width": 5, "max_width": 4}, id="max width"),
+            pytest.param({"column": 0, "max_width": 0}, id="empty max width"),
+        ],
+    )
+    def test_set_column_width_invalid(self, kwargs):
+        with pytest.raises(ValueError):
+            TableConfig.builder().set_column_width(**kwargs)
+
+    def test_set_max_width(self, mocker):
+        mocker.patch("shutil.get_terminal_size", return_value=os.terminal_size((42, 20)))
+        assert TableConfig.builder().set_max_width().build().max_width == 42
+        assert TableConfig.builder().set_max_width(80).build().max_width == 80
+        with pytest.raises(ValueError):
+            TableConfig.builder().set_max_width(0)
+
+    def test_set_overflow(self):
+        assert TableConfig.builder().build().overflow == "wrap"
+        assert TableConfig.builder().set_overflow("truncate").build().overflow == "truncate"
+        with pytest.raises(ValueError):
+            TableConfig.builder().set_overflow("hide")
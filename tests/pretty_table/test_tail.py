@@ -0,0 +1,48 @@
+import pytest
+
+from prettypi.pretty_table.tail import TailTable
+from prettypi.pretty_table.table import PrettyTable
+
+
+ROWS = [[str(i), "event " * (i % 4), "ok"] for i in range(20)]
+
+
+class TestTailTable:
+
+    @pytest.mark.parametrize(
+        "capacity, headers, config_factory",
+        [
+            pytest.param(3, ["Id", "Event", "State"], "default", id="default config"),
+            pytest.param(3, ["Id", "Event", "State"], "custom", id="custom config"),
+            pytest.param(1, ["Id", "Event", "State"], "custom", id="one row"),
+            pytest.param(5, None, "default", id="no headers"),
+        ],
+        indirect=["config_factory"],
+    )
+    def test_same_as_pretty_table(self, capacity, headers, config_factory):
+        tail = TailTable(capacity, headers, config_factory())
+        assert str(tail) == str(PrettyTable([], headers, config_factory()))
+        for i, row in enumerate(ROWS):
+            tail.append(row)
+            last = ROWS[max(i + 1 - capacity, 0):i + 1]
+            assert str(tail) == str(PrettyTable(last, headers, config_factory()))
+
+    def test_extend(self):
+        tail = TailTable(2, ["Id"])
+        tail.extend([str(i)] for i in range(100))
+        assert len(tail) == 2
+        assert tail.capacity == 2
+        assert list(tail.iter_lines()) == [" Id ", " 98 ", "----", " 99 ", "----"]
+
+    def test_width_shrinks(self):
+        tail = TailTable(1, ["Id"])
+        tail.append(["123456"])
+        assert str(tail) == " Id     \n 123456 \n--------"
+        tail.append(["1"])
+        assert str(tail) == " Id \n 1  \n----"
+
+    def test_pretty_table_tail(self):
+        tail = PrettyTable.tail(2, ["Id"])
+        assert isinstance(tail, TailTable)
+        with pytest.raises(ValueError):
+            PrettyTable.tail(0)
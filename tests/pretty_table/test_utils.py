@@ -1,7 +1,17 @@
+import pickle
 import pytest
 
-from prettypi.pretty_table.utils import JsonRow, Border, JsonRowsManager
+from prettypi.pretty_table.utils import (
+    JsonRow,
+    Border,
+    JsonRowsManager,
+    ColumnStore,
+    RowLayout,
+    fit_cells,
+)
 from prettypi.pretty_table.table_config import TableConfig
+from prettypi.pretty_print import StyledStr
+from prettypi.utils import Color
 
 
 class TestJsonRow:
@@ -44,6 +54,12 @@ class TestJsonRow:
         assert row.separator == "separator"
         assert row.row_computed is None
 
+    def test_create_separator_does_not_mutate_border(self):
+        border = Border(top="=", left="| ", right=" |")
+        row = JsonRow.create_separator(border, "-")
+        assert row.border == Border(top="=", left="|", right="|")
+        assert border == Border(top="=", left="| ", right=" |")
+
     def test_create_separator(self):
         row = JsonRow.create_separator(Border(), "separator")
         assert row.row_type == "separator"
@@ -237,6 +253,11 @@ class TestJsonRow:
         row.compute_row_data(max_len_left, max_len_right, max_len_columns)
         assert row.row_computed == expected
 
+    def test_len_row_data(self):
+        row = JsonRow.create_data(["1", "2"], Border(left="|", right="|"), " | ")
+        assert row.len_row_data(1, 1, [3, 4]) == len(row.render_row_data(1, 1, [3, 4]))
+        assert row.row_computed is None
+
     @pytest.mark.parametrize(
         "row, max_len_computed, expected",
         [
@@ -283,6 +304,172 @@ class TestJsonRow:
         assert row.row_computed == expected
 
 
+#############
+# RowLayout #
+#############
+
+
+class TestRowLayout:
+    def test_render_row(self):
+        layout = RowLayout("|", "|", " : ", [3, 1])
+        assert layout.render_row(["a", "b"]) == "| a   : b |"
+
+    @pytest.mark.parametrize(
+        "cells, expected",
+        [
+            pytest.param(["a", "b"], "{ a   }{ b  }", id="full row"),
+            pytest.param(["a"], "{ a   }", id="short row"),
+            pytest.param(["a", "b", "c"], "{ a   }{ b  }", id="extra cell"),
+            pytest.param(["{}", "toolong"], "{ {}  }{ toolong }", id="braces in cells"),
+        ],
+    )
+    def test_render_row_compiled(self, cells, expected):
+        layout = RowLayout("{", "}", " }{ ", [3, 2])
+        assert layout.render_row(cells) == expected
+        assert layout.render_row(cells) == expected
+
+    @pytest.mark.parametrize(
+        "cells, expected",
+        [
+            pytest.param(["日本", "b"], "| 日本   : b  |", id="wide cell"),
+            pytest.param(["ab", "b"], "| ab     : b  |", id="ascii cell"),
+            pytest.param(["日本"], "| 日本   |", id="short row"),
+        ],
+    )
+    def test_render_row_wide(self, cells, expected):
+        layout = RowLayout("|", "|", " : ", [6, 2], wide=(0,))
+        assert layout.render_row(cells) == expected
+        assert layout.compile(2) == "| {} : {:<2} |"
+
+    @pytest.mark.parametrize(
+        "cells, overflow, expected",
+        [
+            pytest.param(["ab", "c"], "wrap", [["ab", "c"]], id="fits"),
+            pytest.param(
+                ["abcde", "c"], "wrap", [["abc", "c"], ["de", ""]], id="wrap"
+            ),
+            pytest.param(["abcde", "c"], "truncate", [["ab…", "c"]], id="truncate"),
+            pytest.param(["a", "c", "extra"], "wrap", [["a", "c", "extra"]], id="extra cell"),
+        ],
+    )
+    def test_fit_cells(self, cells, overflow, expected):
+        assert fit_cells(cells, [3, 1], overflow) == expected
+
+    def test_iter_lines_wrapped(self):
+        layout = RowLayout("|", "|", " : ", [3, 1], "-", overflow="wrap")
+        lines = list(layout.iter_lines([["abcde", "c"], ["a", "b"]]))
+        assert lines == ["| abc : c |", "| de  :   |", "-", "| a   : b |", "-"]
+
+    def test_compile(self):
+        layout = RowLayout("|", "|", " : ", [3, 0])
+        assert layout.compile(2) == "| {:<3} : {:<0} |"
+        assert layout.formats == {2: "| {:<3} : {:<0} |"}
+
+    def test_pickle_compiled_layout(self):
+        layout = RowLayout("|", "|", " : ", [3, 1])
+        layout.render_row(["a", "b"])
+        copy = pickle.loads(pickle.dumps(layout))
+        assert copy == layout
+        assert copy.render_row(["c", "d"]) == "| c   : d |"
+
+    @pytest.mark.parametrize(
+        "row_separator, bottom_separator, last, expected",
+        [
+            pytest.param(None, None, True, [" 1 ", " 2 "], id="no separator"),
+            pytest.param("---", None, True, [" 1 ", "---", " 2 ", "---"], id="rows"),
+            pytest.param("---", "===", True, [" 1 ", "---", " 2 ", "==="], id="last"),
+            pytest.param("---", "===", False, [" 1 ", "---", " 2 ", "---"], id="middle"),
+            pytest.param(None, "===", False, [" 1 ", " 2 "], id="middle bottom only"),
+        ],
+    )
+    def test_iter_lines(self, row_separator, bottom_separator, last, expected):
+        layout = RowLayout("", "", "|", [1], row_separator, bottom_separator)
+        assert list(layout.iter_lines(iter([["1"], ["2"]]), last)) == expected
+
+    def test_iter_lines_no_rows(self):
+        layout = RowLayout("", "", "|", [1], "---", "===")
+        assert list(layout.iter_lines([])) == []
+
+
+###############
+# ColumnStore #
+###############
+
+
+class TestColumnStore:
+    def test_instantiate(self):
+        store = ColumnStore()
+        assert store.columns == []
+        assert store.lengths == []
+        assert store.row_sizes is None
+        assert len(store) == 0
+        assert store.max_row_size() == 0
+
+    def test_append_rows(self):
+        store = ColumnStore()
+        store.append_rows([["a", "bb"], ["ccc", "d"]])
+        assert store.columns == [["a", "ccc"], ["bb", "d"]]
+        assert [list(lengths) for lengths in store.lengths] == [[1, 3], [2, 1]]
+        assert store.row_sizes is None
+        assert len(store) == 2
+        assert store.row(1) == ["ccc", "d"]
+        assert store.max_length(0) == 3
+        assert store.max_length(1) == 2
+
+    def test_append_rows_iterable(self):
+        store = ColumnStore()
+        store.append_rows(iter([["a"], ["b"]]))
+        assert store.columns == [["a", "b"]]
+
+    def test_append_rows_interned(self):
+        store = ColumnStore()
+        store.append_rows([["".join(["o", "k"])], ["".join(["o", "k"])]])
+        assert store.columns[0][0] is store.columns[0][1]
+
+    def test_append_ragged_rows(self):
+        store = ColumnStore()
+        store.append_rows([["a"], ["b", "c"]])
+        store.append_rows([["d", "e", "f"]])
+        assert list(store.row_sizes) == [1, 2, 3]
+        assert store.row(0) == ["a"]
+        assert store.row(1) == ["b", "c"]
+        assert store.row(2) == ["d", "e", "f"]
+        assert store.max_row_size() == 3
+        assert store.columns[2] == ["", "", "f"]
+
+    @pytest.mark.parametrize(
+        "rows, ragged, ascii",
+        [
+            pytest.param([["a", "b"], ["c", "d"]], False, True, id="rectangular"),
+            pytest.param([["a", "b"], ["c"]], True, True, id="ragged"),
+            pytest.param([["a"], ["b", "c"], ["d", "e"]], True, True, id="widened"),
+            pytest.param([["a", "é"]], False, False, id="multibyte"),
+        ],
+    )
+    def test_is_ragged_and_ascii(self, rows, ragged, ascii):
+        store = ColumnStore()
+        for row in rows:
+            store.append_rows([row])
+        assert store.is_ragged() == ragged
+        assert store.is_ascii() == ascii
+
+    def test_append_wide_rows(self):
+        store = ColumnStore()
+        store.append_rows([["a", "b"]])
+        assert store.append_rows([["コーヒー", "b"]]) == [8, 1]
+        assert list(store.lengths[0]) == [1, 8]
+        assert store.wide_columns() == {0}
+        assert not store.is_ascii()
+
+    def test_append_styled_rows(self):
+        store = ColumnStore()
+        store.append_rows([["a", StyledStr("OK", color=Color.GREEN)]])
+        assert store.row(0) == ["a", f"{Color.GREEN}OK{Color.RESET}"]
+        assert list(store.lengths[1]) == [2]
+        assert store.wide_columns() == {1}
+        assert store.is_ascii()
+
+
 ###################
 # JsonRowsManager #
 ###################
@@ -313,10 +500,8 @@ class TestTableConfigBuilder:
         manager.init(header, data, config)
         assert manager.data == data
         assert manager.header == header
-        if not header and not data:
-            assert manager.json_rows == []
-        else:
-            assert manager.json_rows != []
+        assert (manager.json_rows != []) == bool(header)
+        assert len(manager.store) == len(data)
 
     def test_init_header(self):
         config = (
@@ -343,18 +528,82 @@ class TestTableConfigBuilder:
         )
         manager = JsonRowsManager()
         manager._init_data([["1", "2"], ["3", "4"]], config)
-        assert len(manager.json_rows) == 4
-        assert manager.json_rows[0].row_type == "data"
-        assert manager.json_rows[1].row_type == "separator"
-        assert manager.json_rows[2].row_type == "data"
-        assert manager.json_rows[3].row_type == "separator"
+        assert manager.json_rows == []
+        assert manager.store.columns == [["1", "3"], ["2", "4"]]
+        assert manager.row_separator.row_type == "separator"
+        assert manager.row_separator.separator == "┈"
+        assert manager.bottom_separator.row_type == "separator"
+        assert manager.bottom_separator.separator == "═"
+
+    @pytest.mark.parametrize(
+        "data, row_separator, data_bottom, expected",
+        [
+            pytest.param([["1"]], "-", "", (True, False), id="row separator only"),
+            pytest.param([["1"]], "-", "=", (False, True), id="single row bottom"),
+            pytest.param([["1"], ["2"]], "-", "=", (True, True), id="both"),
+            pytest.param([["1"], ["2"]], "", "", (False, False), id="none"),
+        ],
+    )
+    def test_init_data_separators(self, data, row_separator, data_bottom, expected):
+        config = (
+            TableConfig.builder()
+            .set_border(data_bottom=data_bottom)
+            .set_row_separator(row_separator)
+            .build()
+        )
+        manager = JsonRowsManager()
+        manager._init_data(data, config)
+        assert (
+            manager.row_separator is not None,
+            manager.bottom_separator is not None,
+        ) == expected
 
     def test_set_config(self, mocker):
-        config = TableConfig.builder().build()
+        config = TableConfig.builder().set_row_separator("").build()
         manager = JsonRowsManager()
-        mocker.patch.object(manager, "init")
+        manager.init(["a"], [["1"]], TableConfig())
+        store = manager.store
+        mocker.spy(manager, "_init_header")
+        mocker.spy(manager, "_update_max_len")
         manager.set_config(config)
-        assert manager.init.call_count == 1
+        assert manager._init_header.call_count == 0
+        assert str(manager) == " a \n 1 "
+        assert manager._init_header.call_count == 1
+        manager.set_config(TableConfig.builder().set_row_separator("").build())
+        assert str(manager) == " a \n 1 "
+        assert manager._init_header.call_count == 1
+        assert manager._update_max_len.call_count == 0
+        assert manager.store is store
+
+    def test_append_rows(self, mocker):
+        manager = JsonRowsManager()
+        manager.init(["a", "b"], [["1", "2"]], TableConfig.builder().build())
+        mocker.spy(manager, "_update_max_len")
+        manager.append_rows([["333", "4"]])
+        assert manager._update_max_len.call_count == 0
+        assert manager.max_len_columns == [3, 1]
+        assert len(manager.store) == 2
+        assert str(manager) == " a   | b \n 1   | 2 \n---------\n 333 | 4 \n---------"
+
+    @pytest.mark.parametrize(
+        "rows",
+        [pytest.param([], id="no rows"), pytest.param([["2"], ["3"]], id="rows")],
+    )
+    def test_append_rows_keeps_data(self, rows):
+        manager = JsonRowsManager()
+        data = [["1"]]
+        manager.init(None, data, TableConfig.builder().build())
+        manager.append_rows(rows)
+        assert manager.data is data
+        assert data == [["1"]]
+        assert len(manager.store) == 1 + len(rows)
+
+    def test_visible_widths(self):
+        manager = JsonRowsManager()
+        data = [["1", "22"], ["333", "4"], ["5"]]
+        manager.init(["a", "bbb"], data, TableConfig.builder().build())
+        assert manager.visible_widths([0, 2], [0, 1]) == [1, 3]
+        assert manager.visible_widths([1], [1, 0]) == [3, 3]
 
     def test_update_max_len(self):
         manager = JsonRowsManager()
@@ -370,12 +619,83 @@ class TestTableConfigBuilder:
         manager = JsonRowsManager()
         manager.init(["a", "b"], [["1", "2"]], TableConfig.builder().build())
         manager.process()
+        assert len(manager.json_rows) == 1
         assert manager.json_rows[0].row_computed == " a | b "
-        assert manager.json_rows[1].row_computed == " 1 | 2 "
-        assert manager.json_rows[2].row_computed == "-------"
 
     def test_str(self):
         manager = JsonRowsManager()
         manager.init(["a", "b"], [["1", "2"]], TableConfig.builder().build())
         manager.process()
         assert str(manager) == " a | b \n 1 | 2 \n-------"
+
+    def test_iter_lines(self):
+        manager = JsonRowsManager()
+        manager.init(["a", "b"], [["1", "2"]], TableConfig.builder().build())
+        assert list(manager.iter_lines()) == [" a | b ", " 1 | 2 ", "-------"]
+        assert all(row.row_computed is None for row in manager.json_rows)
+
+    def test_str_ragged_rows(self):
+        manager = JsonRowsManager()
+        manager.init(["a"], [["1", "22"], ["3"]], TableConfig.builder().build())
+        assert str(manager) == " a \n 1 | 22 \n--------\n 3 \n--------"
+
+    def test_str_wide_cells(self):
+        manager = JsonRowsManager()
+        manager.init(["名前", "n"], [["コーヒー", "1"], ["tea", "22"]], TableConfig.builder().build())
+        assert str(manager) == (
+            " 名前     | n  \n"
+            " コーヒー | 1  \n"
+            "---------------\n"
+            " tea      | 22 \n"
+            "---------------"
+        )
+
+    def test_visible_widths_wide_header(self):
+        manager = JsonRowsManager()
+        manager.init(["名前", "n"], [["a", "1"]], TableConfig.builder().build())
+        assert manager.visible_widths([0], [0, 1]) == [4, 1]
+
+    def test_str_styled_cells(self):
+        manager = JsonRowsManager()
+        manager.init(
+            ["id", StyledStr("status", color=Color.BLUE)],
+            [["1", StyledStr("OK", color=Color.GREEN)], ["2", f"{Color.RED}FAILED{Color.RESET}"]],
+            TableConfig.builder().build(),
+        )
+        assert str(manager) == (
+            f" id | {Color.BLUE}status{Color.RESET} \n"
+            f" 1  | {Color.GREEN}OK{Color.RESET}     \n"
+            "-------------\n"
+            f" 2  | {Color.RED}FAILED{Color.RESET} \n"
+            "-------------"
+        )
+
+    @pytest.mark.parametrize(
+        "builder, expected",
+        [
+            pytest.param(
+                TableConfig.builder().set_max_width(16),
+                " id | message   \n 1  | a long    \n    | message   \n----------------\n"
+                " 2  | short     \n----------------",
+                id="wrap",
+            ),
+            pytest.param(
+                TableConfig.builder().set_max_width(16).set_overflow("truncate"),
+                " id | message   \n 1  | a long m… \n----------------\n"
+                " 2  | short     \n----------------",
+                id="truncate",
+            ),
+            pytest.param(
+                TableConfig.builder().set_column_width(1, max_width=4),
+                " id | mess \n    | age  \n 1  | a    \n    | long \n    | mess \n"
+                "    | age  \n-----------\n 2  | shor \n    | t    \n-----------",
+                id="column max width",
+            ),
+        ],
+    )
+    def test_str_width_constraints(self, builder, expected):
+        manager = JsonRowsManager()
+        manager.init(
+            ["id", "message"], [["1", "a long message"], ["2", "short"]], builder.build()
+        )
+        assert str(manager) == expected
@@ -0,0 +1,160 @@
+import asyncio
+import io
+
+import pytest
+
+from prettypi.pretty_table import TableConfig
+from prettypi.pretty_table.table import PrettyTable
+from prettypi.pretty_table.view import TableView
+
+
+@pytest.fixture
+def table():
+    data = [["1", "apple", "red"], ["2", "banana", "yellow"], ["3", "kiwi", "green"]]
+    return PrettyTable(data, ["Id", "Fruit", "Color"])
+
+
+class TestTableView:
+
+    def test_where(self, table):
+        view = table.where(lambda row: row[0] != "2")
+        assert isinstance(view, TableView)
+        assert len(view) == 2
+        assert list(view.indices) == [0, 2]
+        expected = PrettyTable(
+            [["1", "apple", "red"], ["3", "kiwi", "green"]], ["Id", "Fruit", "Color"]
+        )
+        assert str(view) == str(expected)
+
+    def test_select(self, table):
+        view = table.select(["Color", 0])
+        assert view.columns == [2, 0]
+        assert str(view) == str(
+            PrettyTable([["red", "1"], ["yellow", "2"], ["green", "3"]], ["Color", "Id"])
+        )
+
+    def test_where_and_select(self, table):
+        view = table.where(lambda row: row[1].startswith("k")).select(["Fruit"])
+        assert view.widths == [5]
+        assert str(view) == " Fruit \n kiwi  \n-------"
+
+    def test_select_then_where(self, table):
+        view = table.select(["Fruit"]).where(lambda row: row == ["apple"])
+        assert str(view) == " Fruit \n apple \n-------"
+
+    def test_select_position_is_relative_to_view(self, table):
+        view = table.select(["Color", "Fruit"]).select([1])
+        assert view.columns == [1]
+
+    @pytest.mark.parametrize(
+        "columns, error",
+        [
+            pytest.param(["Unknown"], ValueError, id="unknown header"),
+            pytest.param(["Id"], ValueError, id="header not in view"),
+            pytest.param([2], IndexError, id="position not in view"),
+        ],
+    )
+    def test_select_invalid(self, table, columns, error):
+        with pytest.raises(error):
+            table.select(["Fruit", "Color"]).select(columns)
+
+    def test_select_width_constraints(self):
+        config = TableConfig.builder().set_column_width(2, max_width=3).build()
+        table = PrettyTable([["1", "apple", "yellow"]], ["Id", "Fruit", "Color"], config)
+        view = table.select(["Color", "Id"])
+        assert str(view) == " Col | Id \n or  |    \n yel | 1  \n low |    \n----------"
+
+    def test_data_is_not_copied(self, table):
+        view = table.where(lambda row: True)
+        assert view.manager is table.json_rows_manager
+
+    def test_where_follows_sort(self, table):
+        table.sort_by("Fruit", reverse=True)
+        view = table.where(lambda row: row[0] != "2")
+        assert list(view.indices) == [2, 0]
+
+    def test_empty_view(self, table):
+        config = TableConfig.builder().set_border(top="=").build()
+        table.set_config(config)
+        assert str(table.where(lambda row: False)) == "=" * 20 + "\n Id | Fruit | Color "
+
+    def test_write(self, table):
+        fp = io.StringIO()
+        view = table.select(["Id"])
+        view.write(fp)
+        assert fp.getvalue() == str(view) + "\n"
+
+    def test_dump(self, table):
+        fp = io.BytesIO()
+        view = table.where(lambda row: row[0] != "1")
+        view.dump(fp, encoding="utf-16")
+        assert fp.getvalue().decode("utf-16") == str(view) + "\n"
+
+    def test_awrite(self, table):
+        class Writer:
+            data = b""
+
+            def write(self, data):
+                self.data += data
+
+            async def drain(self):
+                pass
+
+        writer = Writer()
+        view = table.select(["Fruit"])
+        asyncio.run(view.awrite(writer, buffer_size=4))
+        assert writer.data.decode() == str(view) + "\n"
+
+    @pytest.mark.parametrize(
+        "max_width, keys, expected",
+        [
+            pytest.param(80, None, [[0, 1, 2]], id="fits"),
+            pytest.param(15, None, [[0, 1], [2]], id="no key"),
+            pytest.param(15, ["Id"], [[0, 1], [0, 2]], id="key"),
+            pytest.param(10, [0], [[0, 1], [0, 2]], id="key position"),
+            pytest.param(1, ["Id"], [[0, 1], [0, 2]], id="columns too wide"),
+            pytest.param(80, ["Id", "Fruit", "Color"], [[0, 1, 2]], id="only keys"),
+        ],
+    )
+    def test_blocks(self, table, max_width, keys, expected):
+        blocks = table.blocks(max_width, keys)
+        assert [block.columns for block in blocks] == expected
+        for block in blocks:
+            view = table.select(block.columns)
+            assert block.widths == view.widths
+            assert str(block) == str(view)
+            if len(block.columns) > len(keys or []) + 1:
+                assert all(len(line) <= max_width for line in block.iter_lines())
+
+    def test_blocks_of_view(self, table):
+        view = table.where(lambda row: row[0] != "2").select(["Color", "Fruit", "Id"])
+        blocks = view.blocks(14, ["Id"])
+        assert [block.columns for block in blocks] == [[0, 2], [0, 1]]
+        assert str(blocks[0]) == (
+            " Id | Color \n 1  | red   \n------------\n 3  | green \n------------"
+        )
+
+    def test_blocks_formats_only_block_columns(self, table):
+        projected = []
+        project = table.json_rows_manager.store.project
+
+        def spy(index, columns):
+            projected.append(list(columns))
+            return project(index, columns)
+
+        table.json_rows_manager.store.project = spy
+        block = table.blocks(15, ["Id"])[1]
+        assert projected == []
+        str(block)
+        assert projected == [[0, 2]] * 3
+
+    @pytest.mark.parametrize(
+        "keys, error",
+        [
+            pytest.param(["Unknown"], ValueError, id="unknown header"),
+            pytest.param([3], IndexError, id="unknown position"),
+        ],
+    )
+    def test_blocks_invalid_keys(self, table, keys, error):
+        with pytest.raises(error):
+            table.blocks(80, keys)
@@ -0,0 +1,146 @@
+from array import array
+
+import pytest
+
+from prettypi.pretty_table import widths
+from prettypi.pretty_table.table_config import ColumnWidth
+
+
+class TestWidths:
+
+    @pytest.mark.parametrize(
+        "lengths, expected",
+        [
+            pytest.param(array("L"), 0, id="empty"),
+            pytest.param(array("L", [3]), 3, id="one element"),
+            pytest.param(array("L", [1, 5, 2]), 5, id="several elements"),
+            pytest.param(array("L", range(5000)), 4999, id="large array"),
+        ],
+    )
+    @pytest.mark.parametrize("use_numpy", [None, False])
+    def test_max_length(self, lengths, expected, use_numpy):
+        assert widths.max_length(lengths, use_numpy) == expected
+
+    def test_max_length_numpy(self):
+        pytest.importorskip("numpy")
+        assert widths.has_numpy()
+        assert widths.max_length(array("L", [1, 7, 2]), use_numpy=True) == 7
+        assert widths.max_length(array("L"), use_numpy=True) == 0
+
+    def test_max_length_without_numpy(self, mocker):
+        mocker.patch.object(widths, "np", None)
+        assert not widths.has_numpy()
+        assert widths.max_length(array("L", range(5000))) == 4999
+
+    @pytest.mark.parametrize(
+        "use_numpy",
+        [
+            pytest.param(False, id="python"),
+            pytest.param(None, id="automatic"),
+            pytest.param(True, id="numpy"),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "cells",
+        [
+            pytest.param([], id="empty"),
+            pytest.param(["", "a", ""], id="empty cells"),
+            pytest.param(["ab", "c", "def"], id="cells"),
+            pytest.param(["a\0b", "c"], id="nul character"),
+            pytest.param([f"cell {i}" for i in range(3000)], id="large column"),
+        ],
+    )
+    def test_ascii_lengths(self, cells, use_numpy):
+        if use_numpy:
+            pytest.importorskip("numpy")
+        lengths = widths.ascii_lengths(cells, use_numpy=use_numpy)
+        assert lengths == array("L", map(len, cells))
+
+    def test_ascii_lengths_joined(self):
+        pytest.importorskip("numpy")
+        cells = ["ab", "c"]
+        lengths = widths.ascii_lengths(cells, "ab\0c", use_numpy=True)
+        assert lengths == array("L", [2, 1])
+
+    @pytest.mark.parametrize(
+        "function, args",
+        [
+            pytest.param(widths.max_length, (array("L", [1]),), id="max_length"),
+            pytest.param(widths.max_length_at, (array("L", [1]), [0]), id="max_length_at"),
+            pytest.param(widths.max_lengths, ([array("L", [1])],), id="max_lengths"),
+            pytest.param(widths.ascii_lengths, (["a"], None), id="ascii_lengths"),
+        ],
+    )
+    def test_numpy_engine_without_numpy(self, mocker, function, args):
+        mocker.patch.object(widths, "np", None)
+        with pytest.raises(ImportError) as e:
+            function(*args, use_numpy=True)
+        assert e.match("NumPy is required")
+
+    @pytest.mark.parametrize(
+        "indices, expected",
+        [
+            pytest.param([], 0, id="no index"),
+            pytest.param([0, 2], 3, id="list"),
+            pytest.param(array("L", [1]), 9, id="array"),
+            pytest.param(range(2, 4), 4, id="range"),
+        ],
+    )
+    @pytest.mark.parametrize("use_numpy", [None, False])
+    def test_max_length_at(self, indices, expected, use_numpy):
+        lengths = array("L", [1, 9, 3, 4])
+        assert widths.max_length_at(lengths, indices, use_numpy) == expected
+
+    def test_max_length_at_numpy(self):
+        pytest.importorskip("numpy")
+        lengths = array("L", [1, 9, 3, 4])
+        assert widths.max_length_at(lengths, array("L", [0, 3]), use_numpy=True) == 4
+        assert widths.max_length_at(lengths, [2], use_numpy=True) == 3
+
+    def test_max_lengths(self):
+        lengths = [array("L", [1, 2]), array("L", [4, 3]), array("L")]
+        assert widths.max_lengths(lengths) == [2, 4, 0]
+
+    @pytest.mark.parametrize(
+        "first, second, expected",
+        [
+            pytest.param([], [], [], id="empty"),
+            pytest.param([1, 2], [], [1, 2], id="second empty"),
+            pytest.param([], [1, 2], [1, 2], id="first empty"),
+            pytest.param([1, 5], [3, 2, 4], [3, 5, 4], id="different sizes"),
+        ],
+    )
+    def test_merge_widths(self, first, second, expected):
+        assert widths.merge_widths(first, second) == expected
+
+    @pytest.mark.parametrize(
+        "natural, constraints, max_width, overhead, expected",
+        [
+            pytest.param([5, 10], [], None, 0, [5, 10], id="no constraint"),
+            pytest.param(
+                [5, 10], [ColumnWidth(min_width=8), ColumnWidth(max_width=6)], None, 0,
+                [8, 6], id="min and max width",
+            ),
+            pytest.param([5, 10], [], 20, 5, [5, 10], id="fits"),
+            pytest.param([5, 4000, 3], [], 40, 9, [5, 23, 3], id="runaway column"),
+            pytest.param([30, 30, 3], [None, ColumnWidth(flex=2)], 40, 9, [10, 18, 3], id="flex"),
+            pytest.param([30, 30, 3], [ColumnWidth(flex=0)], 20, 9, [30, 1, 1], id="fixed"),
+            pytest.param([5, 10], [], 3, 0, [2, 1], id="min widths do not fit"),
+            pytest.param([], [], 3, 10, [], id="no column"),
+        ],
+    )
+    def test_solve_widths(self, natural, constraints, max_width, overhead, expected):
+        assert widths.solve_widths(natural, constraints, max_width, overhead) == expected
+
+    @pytest.mark.parametrize(
+        "natural, available, separator, expected",
+        [
+            pytest.param([], 10, 3, [[]], id="no column"),
+            pytest.param([2, 2, 2], 20, 3, [[0, 1, 2]], id="fits"),
+            pytest.param([4, 4, 4, 4], 11, 3, [[0, 1], [2, 3]], id="pairs"),
+            pytest.param([4, 30, 4], 11, 3, [[0], [1], [2]], id="column too wide"),
+            pytest.param([5, 5], 10, 0, [[0, 1]], id="no separator"),
+        ],
+    )
+    def test_split_columns(self, natural, available, separator, expected):
+        assert widths.split_columns(natural, available, separator) == expected